@@ -6,7 +6,7 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 
 from age_categories.serializers import AgeCategoriesSerializer
-from age_categories.models import AgeCategories
+from caching.reference import get_reference_rows
 
 
 @extend_schema(
@@ -30,7 +30,7 @@ from age_categories.models import AgeCategories
 @api_view(http_method_names=["GET"])
 @permission_classes(permission_classes=[AllowAny])
 def get_age_categories_view(request: Request) -> Response:
-    age_categories = AgeCategories.objects.all()
+    age_categories = get_reference_rows(name="age_categories")
 
     serializer = AgeCategoriesSerializer(age_categories, many=True)
 
@@ -0,0 +1,180 @@
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from csv import writer
+from io import StringIO
+from re import sub
+from typing import Iterator, NamedTuple
+from zipfile import ZIP64_LIMIT, ZIP_DEFLATED, ZIP_STORED, ZipFile, ZipInfo
+
+from applications.models import Applications
+from config.logger import logger
+from storage_s3.utils import get_file_key_from_url, get_sesion_s3, get_storage_object
+
+BUNDLE_PREFETCH: int = 4
+BUNDLE_CHUNK_SIZE: int = 1024 * 1024
+
+MANIFEST_HEADER: list[str] = [
+    "application_id",
+    "name",
+    "author",
+    "email",
+    "nomination",
+    "age_category",
+    "link_to_work",
+    "file",
+    "status",
+]
+
+
+class BundleEntry(NamedTuple):
+    application: Applications
+    file_key: str | None
+    archive_name: str | None
+
+
+class ZipStream:
+    """
+    Файлоподобный приёмник для ZipFile, который не хранит архив целиком:
+    записанные байты забираются генератором через drain() сразу после записи.
+    """
+
+    def __init__(self):
+        self._chunks: deque[bytes] = deque()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        return None
+
+    def drain(self) -> Iterator[bytes]:
+        while self._chunks:
+            yield self._chunks.popleft()
+
+
+def safe_archive_part(value: str) -> str:
+    return sub(pattern=r"[\\/:*?\"<>|\s]+", repl="_", string=value).strip("_") or "-"
+
+
+def build_bundle_entries(applications: list[Applications]) -> list[BundleEntry]:
+    entries = []
+
+    for application in applications:
+        file_key = get_file_key_from_url(url=application.link_to_work)
+
+        if not file_key:
+            entries.append(BundleEntry(application, None, None))
+            continue
+
+        extension = file_key.rsplit(sep=".", maxsplit=1)[-1] if "." in file_key else ""
+        archive_name = "/".join(
+            [
+                safe_archive_part(application.nomination.name),
+                safe_archive_part(application.age_category),
+                f"{application.id}_{safe_archive_part(application.name)}"
+                + (f".{extension}" if extension else ""),
+            ]
+        )
+        entries.append(BundleEntry(application, file_key, archive_name))
+
+    return entries
+
+
+def stream_applications_bundle(applications: list[Applications]) -> Iterator[bytes]:
+    """
+    Потоково формирует ZIP-архив с файлами заявок и manifest.csv.
+
+    Объекты S3 открываются заранее в пуле потоков (не более BUNDLE_PREFETCH
+    одновременно), а их содержимое переписывается в архив частями по
+    BUNDLE_CHUNK_SIZE. Временные файлы не создаются, объём памяти ограничен
+    размером окна предзагрузки.
+    """
+    entries = build_bundle_entries(applications=applications)
+    stored_entries = [entry for entry in entries if entry.file_key]
+    statuses: dict[int, str] = {
+        entry.application.id: "external" for entry in entries if not entry.file_key
+    }
+
+    client = get_sesion_s3()
+    stream = ZipStream()
+
+    with ThreadPoolExecutor(max_workers=BUNDLE_PREFETCH) as executor:
+        pending: deque[tuple[BundleEntry, Future]] = deque()
+        remaining = iter(stored_entries)
+
+        def schedule_next() -> None:
+            entry = next(remaining, None)
+            if entry:
+                pending.append(
+                    (entry, executor.submit(get_storage_object, client, entry.file_key))
+                )
+
+        for _ in range(BUNDLE_PREFETCH):
+            schedule_next()
+
+        with ZipFile(stream, mode="w") as archive:
+            while pending:
+                entry, future = pending.popleft()
+                schedule_next()
+
+                try:
+                    storage_object = future.result()
+                except Exception as e:
+                    logger.warning(f"Не удалось получить {entry.file_key}: {e}")
+                    statuses[entry.application.id] = "missing"
+                    continue
+
+                file_info = ZipInfo(
+                    filename=entry.archive_name,
+                    date_time=storage_object["LastModified"].timetuple()[:6],
+                )
+                file_info.compress_type = ZIP_STORED
+                file_info.file_size = storage_object["ContentLength"]
+
+                with archive.open(
+                    file_info, mode="w", force_zip64=file_info.file_size > ZIP64_LIMIT
+                ) as archive_file:
+                    for chunk in storage_object["Body"].iter_chunks(
+                        chunk_size=BUNDLE_CHUNK_SIZE
+                    ):
+                        archive_file.write(chunk)
+                        yield from stream.drain()
+
+                statuses[entry.application.id] = "ok"
+
+            archive.writestr(
+                "manifest.csv",
+                build_manifest(entries=entries, statuses=statuses),
+                compress_type=ZIP_DEFLATED,
+            )
+
+    yield from stream.drain()
+
+
+def build_manifest(entries: list[BundleEntry], statuses: dict[int, str]) -> bytes:
+    buffer = StringIO()
+    csv_writer = writer(buffer)
+    csv_writer.writerow(MANIFEST_HEADER)
+
+    for entry in entries:
+        application = entry.application
+        status = statuses.get(application.id, "missing")
+        csv_writer.writerow(
+            [
+                application.id,
+                application.name,
+                application.user.get_fio(),
+                application.user.email,
+                application.nomination.name,
+                application.age_category,
+                application.link_to_work,
+                entry.archive_name if status == "ok" else "",
+                status,
+            ]
+        )
+
+    return buffer.getvalue().encode("utf-8-sig")
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.2 on 2026-10-19 13:12
+
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def backfill_deleted_at(apps, schema_editor):
+    # Уже удалённые записи получают полный срок хранения с момента миграции.
+    Applications = apps.get_model("applications", "Applications")
+    Applications.objects.filter(is_deleted=True, deleted_at__isnull=True).update(
+        deleted_at=timezone.now()
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("applications", "0004_applications_is_deleted"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="applications",
+            name="deleted_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.RunPython(
+            code=backfill_deleted_at, reverse_code=migrations.RunPython.noop
+        ),
+    ]
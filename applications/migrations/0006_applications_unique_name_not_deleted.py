@@ -0,0 +1,31 @@
+# Generated by Django 5.2.2 on 2026-10-19 13:55
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("applications", "0005_applications_deleted_at"),
+        ("contests", "0006_contest_deleted_at"),
+        ("criteria", "0003_criteria_criteria_trgm_idx_and_more"),
+        ("nomination", "0003_nominations_nominations_trgm_idx_and_more"),
+        ("work_rate", "0002_alter_workrate_unique_together_workrate_jury_and_more"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name="applications",
+            unique_together=set(),
+        ),
+        migrations.AddConstraint(
+            model_name="applications",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("is_deleted", False)),
+                fields=("name", "contest", "nomination"),
+                name="applications_unique_name_not_deleted",
+            ),
+        ),
+    ]
@@ -34,7 +34,15 @@ class Applications(models.Model):
     )
 
     is_deleted = models.BooleanField(default=False)
+    deleted_at = models.DateTimeField(null=True, blank=True)
 
     class Meta:
         db_table = "applications"
-        unique_together = ("name", "contest", "nomination")
+        constraints = [
+            # Удалённая заявка не мешает подать новую с тем же названием.
+            models.UniqueConstraint(
+                fields=["name", "contest", "nomination"],
+                condition=models.Q(is_deleted=False),
+                name="applications_unique_name_not_deleted",
+            ),
+        ]
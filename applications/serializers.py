@@ -104,7 +104,10 @@ class SendApplicationsSerializer(Serializer):
                 )
 
             exists_application = Applications.objects.filter(
-                nomination_id=nomination_id, contest_id=contest.id, user_id=user.id
+                nomination_id=nomination_id,
+                contest_id=contest.id,
+                user_id=user.id,
+                is_deleted=False,
             ).exists()
 
             if exists_application:
@@ -0,0 +1,11 @@
+from authentication.throttle import ContestBasedThrottle, UserBasedThrottle
+
+
+class SendApplicationUserThrottle(UserBasedThrottle):
+    scope = "send_application_user"
+    rate = "10/min"
+
+
+class SendApplicationContestThrottle(ContestBasedThrottle):
+    scope = "send_application_contest"
+    rate = "120/min"
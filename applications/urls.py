@@ -11,6 +11,7 @@ from applications.views import (
     update_application_view,
     get_applications_user_view,
     delete_application_view,
+    download_applications_bundle_view,
 )
 from work_rate.views import (
     work_rate_view,
@@ -70,4 +71,9 @@ urlpatterns = [
         view=delete_application_view,
         name="delete_application_view",
     ),
+    path(
+        route="bundle",
+        view=download_applications_bundle_view,
+        name="download_applications_bundle_view",
+    ),
 ]
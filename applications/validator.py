@@ -6,7 +6,9 @@ from applications.models import Applications
 class ApplicationValidator:
     @staticmethod
     def validate_application(application_id, application_status):
-        application = Applications.objects.filter(id=application_id).first()
+        application = Applications.objects.filter(
+            id=application_id, is_deleted=False
+        ).first()
 
         if not application:
             return ValidationError("Application does not exist")
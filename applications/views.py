@@ -1,11 +1,14 @@
+from django.http import HttpResponseBase, StreamingHttpResponse
+from django.utils import timezone
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import OpenApiExample, extend_schema, OpenApiParameter
 from rest_framework import status
-from rest_framework.decorators import api_view, permission_classes
+from rest_framework.decorators import api_view, permission_classes, throttle_classes
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.request import Request
 from rest_framework.response import Response
 
+from applications.bundle import stream_applications_bundle
 from applications.enums import ApplicationStatus
 from applications.filters import ApplicationFilter
 from applications.models import Applications
@@ -18,19 +21,24 @@ from applications.serializers import (
     ApplicationWithCriteriaSerializer,
     UpdateApplicationSerializer,
 )
+from applications.throttle import (
+    SendApplicationContestThrottle,
+    SendApplicationUserThrottle,
+)
 from block_user.permissions import IsNotBlockUserPermission
 from contest_stage.permissions import CanSubmitApplicationPermission
 from participants.permissions import (
     IsContestJuryPermission,
     IsOrgCommitteePermission,
     IsContestMemberPermission,
+    IsContestStaffPermission,
 )
 
 
 def get_filtered_applications(contest_id: str, status_filter: str):
     return Applications.objects.filter(
-        contest_id=contest_id, status=status_filter
-    ).all()
+        contest_id=contest_id, status=status_filter, is_deleted=False
+    ).select_related("contest", "nomination")
 
 
 def get_applications_by_status(request: Request, status_filter: str) -> Response:
@@ -103,6 +111,9 @@ def get_applications_by_status(request: Request, status_filter: str) -> Response
         CanSubmitApplicationPermission,
     ]
 )
+@throttle_classes(
+    throttle_classes=[SendApplicationUserThrottle, SendApplicationContestThrottle]
+)
 def send_applications_view(request: Request) -> Response:
     serializer = SendApplicationsSerializer(
         data=request.data, context={"user": request.user}
@@ -514,7 +525,7 @@ def get_application_view(request: Request) -> Response:
             status=status.HTTP_400_BAD_REQUEST,
         )
 
-    application = Applications.objects.get(id=application_id)
+    application = Applications.objects.get(id=application_id, is_deleted=False)
     serializer = ApplicationWithCriteriaSerializer(instance=application)
 
     return Response(data=serializer.data, status=status.HTTP_200_OK)
@@ -606,7 +617,7 @@ def get_application_view(request: Request) -> Response:
 def get_applications_user_view(request: Request) -> Response:
     user_applications = Applications.objects.filter(
         user_id=request.user.id, is_deleted=False
-    ).all()
+    ).select_related("contest", "nomination")
 
     application_filter = ApplicationFilter(data=request.GET, queryset=user_applications)
 
@@ -684,7 +695,7 @@ def update_application_view(request: Request) -> Response:
         )
 
     try:
-        application = Applications.objects.get(id=application_id)
+        application = Applications.objects.get(id=application_id, is_deleted=False)
     except Applications.DoesNotExist:
         return Response(
             data={"error": "Application not found"},
@@ -766,7 +777,7 @@ def delete_application_view(request: Request) -> Response:
         )
 
     try:
-        application = Applications.objects.get(id=application_id)
+        application = Applications.objects.get(id=application_id, is_deleted=False)
     except Applications.DoesNotExist:
         return Response(
             data={"error": "Application not found"},
@@ -779,9 +790,79 @@ def delete_application_view(request: Request) -> Response:
             status=status.HTTP_403_FORBIDDEN,
         )
 
-    application.delete()
+    application.is_deleted = True
+    application.deleted_at = timezone.now()
+    application.save(update_fields=["is_deleted", "deleted_at"])
 
     return Response(
         data={"message": "Application successfully deleted"},
         status=status.HTTP_200_OK,
     )
+
+
+@extend_schema(
+    summary="Скачивание архива конкурсных работ",
+    description="Потоково отдаёт ZIP-архив с файлами всех принятых заявок конкурса и файлом manifest.csv. "
+    "Можно ограничить архив номинацией и возрастной категорией.",
+    parameters=[
+        OpenApiParameter(
+            name="nomination_id",
+            type=OpenApiTypes.INT,
+            location="query",
+            description="Фильтр по ID номинации",
+        ),
+        OpenApiParameter(
+            name="age_category",
+            type=OpenApiTypes.STR,
+            location="query",
+            description="Фильтр по названию возрастной категории",
+        ),
+    ],
+    responses={
+        (200, "application/zip"): OpenApiTypes.BINARY,
+        404: {"type": "object", "properties": {"error": {"type": "string"}}},
+    },
+)
+@api_view(http_method_names=["GET"])
+@permission_classes(
+    permission_classes=[
+        IsAuthenticated,
+        IsContestStaffPermission,
+        IsNotBlockUserPermission,
+    ]
+)
+def download_applications_bundle_view(request: Request) -> HttpResponseBase:
+    queryset = (
+        get_filtered_applications(
+            contest_id=request.contest_id,
+            status_filter=ApplicationStatus.accepted.value,
+        )
+        .select_related("user", "nomination")
+        .order_by("nomination_id", "age_category", "id")
+    )
+
+    nomination_id = request.query_params.get("nomination_id", None)
+    age_category = request.query_params.get("age_category", None)
+
+    if nomination_id:
+        queryset = queryset.filter(nomination_id=nomination_id)
+
+    if age_category:
+        queryset = queryset.filter(age_category=age_category)
+
+    applications = list(queryset)
+
+    if not applications:
+        return Response(
+            data={"error": "Принятые заявки не найдены"},
+            status=status.HTTP_404_NOT_FOUND,
+        )
+
+    response = StreamingHttpResponse(
+        streaming_content=stream_applications_bundle(applications=applications),
+        content_type="application/zip",
+    )
+    response["Content-Disposition"] = (
+        f'attachment; filename="contest_{request.contest_id}_works.zip"'
+    )
+    return response
@@ -1,7 +1,10 @@
-from django.core.mail import EmailMessage
 from django.template.loader import render_to_string
 
+from email_outbox.utils import enqueue_email
+from monitoring.tracing import traced
 
+
+@traced(name="email.send_confirmation_email")
 def send_confirmation_email(user_email: str, code: str):
     subject = "Подтверждение входа"
     html_template = render_to_string(
@@ -11,11 +14,4 @@ def send_confirmation_email(user_email: str, code: str):
             "valid_minutes": 5,
         },
     )
-    email = EmailMessage(
-        subject=subject,
-        body=html_template,
-        from_email="manager@skazka-design.ru",
-        to=[user_email],
-    )
-    email.content_subtype = "html"
-    email.send()
+    enqueue_email(subject=subject, body=html_template, to=[user_email])
@@ -0,0 +1,107 @@
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+from uuid import uuid4
+
+from django.core.cache import cache
+from django.core.management.base import BaseCommand
+from django.test import RequestFactory
+from rest_framework.request import Request
+from rest_framework.throttling import AnonRateThrottle
+
+from authentication.throttle import IpBasedThrottle
+from caching.reference import get_redis_client
+
+
+class LegacyIpThrottle(AnonRateThrottle):
+    """Прежняя реализация: история запросов списком в кэше."""
+
+    scope = "benchmark_legacy"
+
+    def get_cache_key(self, request, view):
+        return self.cache_format % {
+            "scope": self.scope,
+            "ident": request.META["REMOTE_ADDR"],
+        }
+
+
+class SlidingIpThrottle(IpBasedThrottle):
+    scope = "benchmark_sliding"
+
+
+def build_throttle(throttle_class, rate: str):
+    return type(throttle_class.__name__, (throttle_class,), {"rate": rate})
+
+
+def run_requests(throttle_class, ip: str, count: int) -> int:
+    request = Request(RequestFactory().post("/", REMOTE_ADDR=ip))
+    allowed = 0
+    for _ in range(count):
+        if throttle_class().allow_request(request=request, view=None):
+            allowed += 1
+
+    return allowed
+
+
+class Command(BaseCommand):
+    help = (
+        "Сравнивает ограничитель частоты на скользящем окне в Redis с прежним "
+        "SimpleRateThrottle: стоимость проверки и точность лимита при "
+        "одновременных запросах."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=2000)
+        parser.add_argument("--threads", type=int, default=16)
+        parser.add_argument("--limit", type=int, default=100)
+
+    def handle(self, *args, **options):
+        if get_redis_client() is None:
+            self.stdout.write(
+                "Кэш не на Redis: новая реализация работает по фиксированному окну"
+            )
+
+        implementations = {
+            "SimpleRateThrottle": LegacyIpThrottle,
+            "SlidingWindowThrottle": SlidingIpThrottle,
+        }
+
+        for name, throttle_class in implementations.items():
+            ip = f"benchmark-{uuid4().hex}"
+            throttle = build_throttle(throttle_class, f"{options['requests']}/hour")
+
+            started_at = perf_counter()
+            run_requests(throttle_class=throttle, ip=ip, count=options["requests"])
+            per_call = (perf_counter() - started_at) / options["requests"] * 1_000_000
+            self.cleanup(throttle_class=throttle, ip=ip)
+
+            ip = f"benchmark-{uuid4().hex}"
+            throttle = build_throttle(throttle_class, f"{options['limit']}/hour")
+            per_thread = options["limit"] * 2 // options["threads"] + 1
+
+            with ThreadPoolExecutor(max_workers=options["threads"]) as executor:
+                admitted = sum(
+                    executor.map(
+                        lambda _: run_requests(throttle, ip, per_thread),
+                        range(options["threads"]),
+                    )
+                )
+            self.cleanup(throttle_class=throttle, ip=ip)
+
+            self.stdout.write(
+                f"{name}: {per_call:.1f} мкс на проверку; при "
+                f"{options['threads']} потоках пропущено {admitted} из "
+                f"{per_thread * options['threads']} запросов при лимите "
+                f"{options['limit']}"
+            )
+
+    @staticmethod
+    def cleanup(throttle_class, ip: str) -> None:
+        key = throttle_class.cache_format % {
+            "scope": throttle_class.scope,
+            "ident": ip,
+        }
+        cache.delete(key=key)
+
+        client = get_redis_client()
+        if client is not None:
+            client.delete(key)
@@ -0,0 +1,44 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import (
+    BlacklistedToken,
+    OutstandingToken,
+)
+
+from authentication.tokens import blacklist_jti
+
+
+class Command(BaseCommand):
+    help = (
+        "Переносит действующие записи чёрного списка refresh-токенов из таблиц "
+        "token_blacklist в кэш. Запускается один раз при переходе на чёрный "
+        "список в Redis."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument(
+            "--purge",
+            action="store_true",
+            help="После переноса удалить все записи из таблиц token_blacklist",
+        )
+
+    def handle(self, *args, **options):
+        now = timezone.now()
+
+        rows = (
+            BlacklistedToken.objects.filter(token__expires_at__gt=now)
+            .values_list("token__jti", "token__expires_at")
+            .order_by("id")
+        )
+
+        migrated = 0
+        for jti, expires_at in rows.iterator(chunk_size=options["batch_size"]):
+            blacklist_jti(jti=jti, exp=int(expires_at.timestamp()))
+            migrated += 1
+
+        self.stdout.write(f"Перенесено в кэш действующих записей: {migrated}")
+
+        if options["purge"]:
+            deleted, _ = OutstandingToken.objects.all().delete()
+            self.stdout.write(f"Удалено записей из token_blacklist: {deleted}")
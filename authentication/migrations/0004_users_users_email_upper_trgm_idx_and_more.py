@@ -0,0 +1,51 @@
+# Generated by Django 5.2.2 on 2026-10-19 13:04
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently, TrigramExtension
+import django.db.models.functions.text
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("applications", "0004_applications_is_deleted"),
+        ("auth", "0012_alter_user_first_name_max_length"),
+        ("authentication", "0003_alter_users_avatar_link"),
+        ("competencies", "0001_initial"),
+        ("contests", "0005_alter_contest_avatar"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        AddIndexConcurrently(
+            model_name="users",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("email"), name="gin_trgm_ops"
+                ),
+                name="users_email_upper_trgm_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="users",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("first_name"),
+                    name="gin_trgm_ops",
+                ),
+                name="users_first_upper_trgm_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="users",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("last_name"),
+                    name="gin_trgm_ops",
+                ),
+                name="users_last_upper_trgm_idx",
+            ),
+        ),
+    ]
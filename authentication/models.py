@@ -2,11 +2,13 @@ from datetime import date
 
 from django.contrib.auth.base_user import AbstractBaseUser
 from django.contrib.auth.models import PermissionsMixin
-from rest_framework_simplejwt.tokens import RefreshToken
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Upper
 
 from authentication.enums import UserRole
 from authentication.managers import UsersManager
+from authentication.tokens import CachedBlacklistRefreshToken
 
 
 class Users(AbstractBaseUser, PermissionsMixin):
@@ -55,10 +57,24 @@ class Users(AbstractBaseUser, PermissionsMixin):
 
     class Meta:
         db_table = "users"
+        indexes = [
+            GinIndex(
+                OpClass(Upper("email"), name="gin_trgm_ops"),
+                name="users_email_upper_trgm_idx",
+            ),
+            GinIndex(
+                OpClass(Upper("first_name"), name="gin_trgm_ops"),
+                name="users_first_upper_trgm_idx",
+            ),
+            GinIndex(
+                OpClass(Upper("last_name"), name="gin_trgm_ops"),
+                name="users_last_upper_trgm_idx",
+            ),
+        ]
 
     @property
     def tokens(self) -> dict[str, str]:
-        refresh = RefreshToken.for_user(self)
+        refresh = CachedBlacklistRefreshToken.for_user(self)
         return {"refresh": str(refresh), "access": str(refresh.access_token)}
 
     def get_full_age(self) -> int:
@@ -12,9 +12,10 @@ from rest_framework.serializers import (
     Serializer,
 )
 from rest_framework_simplejwt.exceptions import TokenError, AuthenticationFailed
-from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.serializers import TokenRefreshSerializer
 
 from authentication.models import Users
+from authentication.tokens import CachedBlacklistRefreshToken
 from django.contrib.auth import authenticate
 
 from authentication.validator import UserValidator
@@ -124,12 +125,16 @@ class LogoutSerializer(Serializer[Users]):
 
     def save(self, **kwargs) -> NoReturn:
         try:
-            refresh_token = RefreshToken(self.token)
+            refresh_token = CachedBlacklistRefreshToken(self.token)
             refresh_token.blacklist()
         except TokenError:
             raise AuthenticationFailed(detail={"error": "Refresh token is invalid"})
 
 
+class CookieTokenRefreshSerializer(TokenRefreshSerializer):
+    token_class = CachedBlacklistRefreshToken
+
+
 class PasswordResetSerializer(ModelSerializer[Users]):
     current_password = CharField(required=True)
     new_password = CharField(required=True)
@@ -1,16 +1,116 @@
-from rest_framework.exceptions import Throttled
-from rest_framework.throttling import AnonRateThrottle
+from math import ceil
+from time import time
+from uuid import uuid4
 
+from django.core.cache import cache
+from rest_framework.throttling import SimpleRateThrottle
+
+from caching.reference import get_redis_client
+from config.logger import logger
 from email_confirmation.models import EmailConfirmationLogin
 from contest_backend.settings import settings
 
+# Скользящее окно на отсортированном множестве: в одном вызове удаляются
+# устаревшие отметки, считаются оставшиеся и, если лимит не исчерпан,
+# добавляется новая. Время берётся у Redis, поэтому расхождение часов
+# между воркерами на результат не влияет.
+SLIDING_WINDOW_SCRIPT = """
+local key = KEYS[1]
+local window = tonumber(ARGV[1])
+local limit = tonumber(ARGV[2])
+
+local redis_time = redis.call('TIME')
+local now = tonumber(redis_time[1]) * 1000 + math.floor(tonumber(redis_time[2]) / 1000)
+
+redis.call('ZREMRANGEBYSCORE', key, 0, now - window)
+
+if redis.call('ZCARD', key) < limit then
+    redis.call('ZADD', key, now, ARGV[3])
+    redis.call('PEXPIRE', key, window)
+    return 0
+end
+
+local oldest = redis.call('ZRANGE', key, 0, 0, 'WITHSCORES')
+return tonumber(oldest[2]) + window - now
+"""
+
+_sliding_window_script = None
+
+
+def hit_sliding_window(key: str, limit: int, window: int) -> tuple[bool, float]:
+    """
+    Засчитывает запрос в окне длиной window секунд, если в нём меньше limit
+    запросов.
+
+    В Redis проверка и запись выполняются одним Lua-скриптом, поэтому
+    одновременные запросы из разных воркеров не превышают лимит. Для кэшей
+    без Redis используется фиксированное окно на cache.add/incr. Если Redis
+    недоступен, запрос пропускается.
+
+    :return: разрешён ли запрос и через сколько секунд повторить попытку
+    """
+    global _sliding_window_script
+
+    client = get_redis_client()
+    if client is None:
+        return hit_fixed_window(key=key, limit=limit, window=window)
+
+    try:
+        if _sliding_window_script is None:
+            _sliding_window_script = client.register_script(SLIDING_WINDOW_SCRIPT)
+
+        retry_after_ms = _sliding_window_script(
+            keys=[key], args=[window * 1000, limit, uuid4().hex], client=client
+        )
+    except Exception as e:
+        logger.warning(f"Ограничение частоты {key} не проверено: {e}")
+        return True, 0
+
+    return not retry_after_ms, retry_after_ms / 1000
+
+
+def hit_fixed_window(key: str, limit: int, window: int) -> tuple[bool, float]:
+    window_start = int(time() // window * window)
+    window_key = f"{key}:{window_start}"
+
+    cache.add(key=window_key, value=0, timeout=window)
+    count = cache.incr(key=window_key)
+
+    if count <= limit:
+        return True, 0
+
+    return False, window_start + window - time()
+
+
+class SlidingWindowThrottle(SimpleRateThrottle):
+    """
+    Основа ограничителей частоты: ключ строится в get_cache_key, как в
+    SimpleRateThrottle, а счёт ведётся атомарно в hit_sliding_window.
+    Время до следующей попытки отдаётся в заголовке Retry-After.
+    """
+
+    retry_after: float = 0
+
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        allowed, self.retry_after = hit_sliding_window(
+            key=self.key, limit=self.num_requests, window=self.duration
+        )
+        return allowed
+
+    def wait(self):
+        return ceil(self.retry_after) if self.retry_after else None
+
 
-class CodeBasedThrottle(AnonRateThrottle):
+class CodeBasedThrottle(SlidingWindowThrottle):
     scope = "code_attempt"
     rate = "5/min"
-    throttle_exception = Throttled(
-        detail="Слишком много попыток ввести этот код. Попробуйте позже."
-    )
 
     def get_cache_key(self, request, view):
         code = request.data.get("code")
@@ -24,10 +124,9 @@ class CodeBasedThrottle(AnonRateThrottle):
         }
 
 
-class IpBasedThrottle(AnonRateThrottle):
+class IpBasedThrottle(SlidingWindowThrottle):
     scope = "ip_attempt"
     rate = "30/min"
-    throttle_exception = Throttled(detail="Слишком много попыток. Попробуйте позже.")
 
     def get_cache_key(self, request, view):
         ip = request.META.get("REMOTE_ADDR")
@@ -38,3 +137,51 @@ class IpBasedThrottle(AnonRateThrottle):
             "scope": self.scope,
             "ident": ip,
         }
+
+
+class EmailBasedThrottle(SlidingWindowThrottle):
+    scope = "email_attempt"
+    rate = "10/min"
+
+    def get_cache_key(self, request, view):
+        email = request.data.get("email")
+        if not email or not isinstance(email, str):
+            return None
+
+        return self.cache_format % {
+            "scope": self.scope,
+            "ident": email.strip().lower(),
+        }
+
+
+class UserBasedThrottle(SlidingWindowThrottle):
+    scope = "user_attempt"
+    rate = "60/min"
+
+    def get_cache_key(self, request, view):
+        if not request.user or not request.user.is_authenticated:
+            return None
+
+        return self.cache_format % {
+            "scope": self.scope,
+            "ident": request.user.id,
+        }
+
+
+class ContestBasedThrottle(SlidingWindowThrottle):
+    scope = "contest_attempt"
+    rate = "600/min"
+
+    def get_cache_key(self, request, view):
+        contest_id = request.data.get("contest_id") or getattr(
+            request, "contest_id", None
+        )
+        try:
+            contest_id = int(contest_id)
+        except (TypeError, ValueError):
+            return None
+
+        return self.cache_format % {
+            "scope": self.scope,
+            "ident": contest_id,
+        }
@@ -0,0 +1,58 @@
+from time import time
+
+from django.core.cache import cache
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import BlacklistMixin, RefreshToken
+from rest_framework_simplejwt.token_blacklist.models import OutstandingToken
+
+
+def get_blacklist_key(jti: str) -> str:
+    return f"token_blacklist:{jti}"
+
+
+def blacklist_jti(jti: str, exp: int) -> bool:
+    """
+    Заносит токен в чёрный список до момента его истечения exp (unix time).
+    Истёкший токен и так не пройдёт проверку, поэтому он не сохраняется.
+
+    :return: False, если токен уже был в чёрном списке
+    """
+    timeout = int(exp - time())
+    if timeout <= 0:
+        return True
+
+    return cache.add(key=get_blacklist_key(jti=jti), value=True, timeout=timeout)
+
+
+def is_jti_blacklisted(jti: str) -> bool:
+    return bool(cache.get(key=get_blacklist_key(jti=jti)))
+
+
+class CachedBlacklistRefreshToken(RefreshToken):
+    """
+    Refresh-токен с чёрным списком в кэше (Redis) вместо таблиц
+    token_blacklist: запись живёт ровно до истечения токена, а выданные
+    токены нигде не регистрируются.
+    """
+
+    def check_blacklist(self) -> None:
+        if is_jti_blacklisted(jti=self.payload[api_settings.JTI_CLAIM]):
+            raise TokenError(_("Token is blacklisted"))
+
+    def blacklist(self) -> None:
+        # add() атомарен: из двух одновременных ротаций одного токена
+        # вторая получит ошибку, а не ещё одну пару токенов.
+        if not blacklist_jti(
+            jti=self.payload[api_settings.JTI_CLAIM], exp=self.payload["exp"]
+        ):
+            raise TokenError(_("Token is blacklisted"))
+
+    def outstand(self) -> OutstandingToken | None:
+        return None
+
+    @classmethod
+    def for_user(cls, user) -> "CachedBlacklistRefreshToken":
+        # Пропускаем BlacklistMixin.for_user, который пишет OutstandingToken.
+        return super(BlacklistMixin, cls).for_user(user)
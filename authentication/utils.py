@@ -1,13 +1,13 @@
 from datetime import timedelta
 from typing import NoReturn
-from django.utils import timezone
-
 from django.db import transaction
+from django.utils import timezone
 
 from authentication.email import send_confirmation_email
 from authentication.models import Users
 from config.settings import get_settings
 from email_confirmation.models import EmailConfirmationLogin
+from email_confirmation.utils import LoginConfirmation, get_confirmation_store
 
 settings = get_settings()
 
@@ -32,46 +32,49 @@ def delete_refresh_cookie(response) -> NoReturn:
 
 
 def send_confirmation_code(
-    user: Users, session_id: str
-) -> tuple[None, dict[str, str]] | tuple[EmailConfirmationLogin, None]:
-    with transaction.atomic():
-        confirmation = EmailConfirmationLogin.objects.filter(
-            user=user, session_id=session_id, is_used=False
-        ).first()
-
-        now = timezone.now()
+    user: Users, session_id: str, confirmation: LoginConfirmation | None = None
+) -> tuple[None, dict[str, str]] | tuple[LoginConfirmation, None]:
+    """
+    Отправляет код входа: при первом запросе создаёт попытку, при повторном
+    меняет код. После AUTH_MAX_CODE_SENDS отправок попытка блокируется на
+    AUTH_LOCK_SECONDS секунд.
+    """
+    store = get_confirmation_store()
+    now = timezone.now()
 
+    # Письмо ставится в очередь в той же транзакции, что и запись попытки:
+    # при хранилище в БД код уходит, только если попытка сохранена.
+    with transaction.atomic():
         if confirmation and confirmation.locked_until:
-            if confirmation.locked_until > now:
+            if confirmation.is_locked():
                 return None, {
                     "error": f"Слишком много попыток. Повторите позже — после {confirmation.locked_until.strftime('%H:%M:%S')}"
                 }
             else:
                 confirmation.attempt_number = 0
                 confirmation.locked_until = None
-                confirmation.save(update_fields=["attempt_number", "locked_until"])
 
         code, code_hash = EmailConfirmationLogin.generate_code()
         if not confirmation:
-            confirmation = EmailConfirmationLogin.objects.create(
-                user=user,
-                code_hash=code_hash,
-                session_id=session_id,
-                attempt_number=1,
+            confirmation = store.create(
+                user_id=user.id, session_id=session_id, code_hash=code_hash
             )
             send_confirmation_email(user_email=user.email, code=code)
             return confirmation, None
 
-        if confirmation.attempt_number >= 3:
-            confirmation.locked_until = now + timedelta(minutes=15)
-            confirmation.save(update_fields=["locked_until"])
+        if confirmation.attempt_number >= settings.auth_settings.MAX_CODE_SENDS:
+            confirmation.locked_until = now + timedelta(
+                seconds=settings.auth_settings.LOCK_SECONDS
+            )
+            store.save(confirmation=confirmation)
             return None, {
                 "error": f"Превышено количество попыток. Блокировка до {confirmation.locked_until.strftime('%H:%M:%S')}"
             }
 
         confirmation.code_hash = code_hash
         confirmation.attempt_number += 1
-        confirmation.save(update_fields=["code_hash", "attempt_number"])
+        confirmation.created_at = now
+        store.save(confirmation=confirmation)
 
         send_confirmation_email(user_email=user.email, code=code)
         return confirmation, None
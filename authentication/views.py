@@ -1,4 +1,5 @@
-from django.db import transaction
+from hmac import compare_digest
+
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import OpenApiExample, extend_schema, OpenApiParameter
 from rest_framework.exceptions import ValidationError
@@ -7,9 +8,10 @@ from rest_framework.response import Response
 from rest_framework.request import Request
 from rest_framework.decorators import api_view, permission_classes, throttle_classes
 from rest_framework import status
-from rest_framework_simplejwt.serializers import TokenRefreshSerializer
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
 
 from authentication.serializers import (
+    CookieTokenRefreshSerializer,
     RegistrationSerializer,
     LoginSerializer,
     LogoutSerializer,
@@ -18,14 +20,19 @@ from authentication.serializers import (
 from block_user.permissions import IsNotBlockUserPermission
 from contest_backend.settings import settings
 
-from authentication.throttle import CodeBasedThrottle, IpBasedThrottle
+from authentication.throttle import (
+    CodeBasedThrottle,
+    EmailBasedThrottle,
+    IpBasedThrottle,
+)
 from authentication.utils import (
     set_refresh_cookie,
     delete_refresh_cookie,
     send_confirmation_code,
 )
+from authentication.models import Users
 from email_confirmation.models import EmailConfirmationLogin
-from django.utils import timezone
+from email_confirmation.utils import get_confirmation_store
 
 
 @extend_schema(
@@ -65,7 +72,9 @@ from django.utils import timezone
 )
 @api_view(http_method_names=["POST"])
 @permission_classes(permission_classes=[AllowAny])
-@throttle_classes(throttle_classes=[CodeBasedThrottle, IpBasedThrottle])
+@throttle_classes(
+    throttle_classes=[CodeBasedThrottle, EmailBasedThrottle, IpBasedThrottle]
+)
 def registration_view(request: Request) -> Response:
     serializer = RegistrationSerializer(data=request.data)
     if not serializer.is_valid(raise_exception=True):
@@ -116,7 +125,9 @@ def registration_view(request: Request) -> Response:
 )
 @api_view(http_method_names=["POST"])
 @permission_classes(permission_classes=[AllowAny])
-@throttle_classes(throttle_classes=[CodeBasedThrottle, IpBasedThrottle])
+@throttle_classes(
+    throttle_classes=[CodeBasedThrottle, EmailBasedThrottle, IpBasedThrottle]
+)
 def login_view(request: Request) -> Response:
     serializer = LoginSerializer(data=request.data)
     if not serializer.is_valid(raise_exception=True):
@@ -187,29 +198,36 @@ def resend_code_view(request: Request) -> Response:
             status=status.HTTP_400_BAD_REQUEST,
         )
 
-    try:
-        confirmation = EmailConfirmationLogin.objects.select_related("user").get(
-            id=attempt_id, session_id=session_id, is_used=False
+    confirmation = get_confirmation_store().get(
+        attempt_id=attempt_id, session_id=session_id
+    )
+    if confirmation is None:
+        return Response(
+            data={"detail": "Не найдено активной попытки подтверждения."},
+            status=status.HTTP_404_NOT_FOUND,
         )
 
-        if not confirmation.is_expired():
-            return Response(
-                data={
-                    "error": "Предыдущий код ещё не истёк. Пожалуйста, подождите и отправьте запрос после истечения!"
-                },
-                status=status.HTTP_401_UNAUTHORIZED,
-            )
-
-        _, error = send_confirmation_code(confirmation.user, session_id)
-        if error:
-            return Response(data=error, status=status.HTTP_401_UNAUTHORIZED)
+    if not confirmation.is_expired():
+        return Response(
+            data={
+                "error": "Предыдущий код ещё не истёк. Пожалуйста, подождите и отправьте запрос после истечения!"
+            },
+            status=status.HTTP_401_UNAUTHORIZED,
+        )
 
-    except EmailConfirmationLogin.DoesNotExist:
+    user = Users.objects.filter(id=confirmation.user_id).first()
+    if user is None:
         return Response(
             data={"detail": "Не найдено активной попытки подтверждения."},
             status=status.HTTP_404_NOT_FOUND,
         )
 
+    _, error = send_confirmation_code(
+        user=user, session_id=session_id, confirmation=confirmation
+    )
+    if error:
+        return Response(data=error, status=status.HTTP_401_UNAUTHORIZED)
+
     return Response(
         data={"message": "Код успешно отправлен повторно"}, status=status.HTTP_200_OK
     )
@@ -302,14 +320,10 @@ def confirm_login_view(request: Request) -> Response:
 
     code_hash = EmailConfirmationLogin.hash_code(code=code)
 
-    try:
-        confirmation = EmailConfirmationLogin.objects.select_related("user").get(
-            id=attempt_id,
-            session_id=session_id,
-            code_hash=code_hash,
-            is_used=False,
-        )
-    except EmailConfirmationLogin.DoesNotExist:
+    store = get_confirmation_store()
+    confirmation = store.get(attempt_id=attempt_id, session_id=session_id)
+
+    if confirmation is None or not compare_digest(confirmation.code_hash, code_hash):
         return Response(
             data={"detail": "Неверный или использованный код подтверждения."},
             status=status.HTTP_400_BAD_REQUEST,
@@ -321,12 +335,16 @@ def confirm_login_view(request: Request) -> Response:
             status=status.HTTP_401_UNAUTHORIZED,
         )
 
-    with transaction.atomic():
-        confirmation.is_used = True
-        confirmation.used_at = timezone.now()
-        confirmation.save(update_fields=["is_used", "used_at"])
+    if not store.consume(
+        attempt_id=attempt_id, session_id=session_id, code_hash=code_hash
+    ):
+        return Response(
+            data={"detail": "Неверный или использованный код подтверждения."},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
 
-        user = confirmation.user
+    user = Users.objects.get(id=confirmation.user_id)
+    if not user.is_email_confirmed:
         user.is_email_confirmed = True
         user.save(update_fields=["is_email_confirmed"])
 
@@ -403,12 +421,14 @@ def cookie_tokens_refresh_view(request) -> Response:
     if not refresh_token:
         raise ValidationError("Refresh token is missing")
 
-    token_refresh_serializer = TokenRefreshSerializer(data={"refresh": refresh_token})
+    token_refresh_serializer = CookieTokenRefreshSerializer(
+        data={"refresh": refresh_token}
+    )
 
-    if not token_refresh_serializer.is_valid(raise_exception=True):
-        return Response(
-            token_refresh_serializer.errors, status=status.HTTP_400_BAD_REQUEST
-        )
+    try:
+        token_refresh_serializer.is_valid(raise_exception=True)
+    except TokenError as e:
+        raise InvalidToken(e.args[0])
 
     new_access_token: str = token_refresh_serializer.validated_data.get("access")
     new_refresh_token: str = token_refresh_serializer.validated_data.get("refresh")
@@ -0,0 +1,11 @@
+from django.apps import AppConfig
+
+
+class CachingConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "caching"
+
+    def ready(self):
+        from caching.signals import connect_reference_invalidation
+
+        connect_reference_invalidation()
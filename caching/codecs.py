@@ -0,0 +1,103 @@
+import pickle
+import zlib
+from functools import partial
+from typing import Callable, NamedTuple
+
+from django.core.cache.backends.redis import RedisSerializer
+
+from config.logger import logger
+from config.settings import get_settings
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:
+    lz4_frame = None
+
+settings = get_settings()
+
+
+class Codec(NamedTuple):
+    marker: bytes
+    compress: Callable[[bytes], bytes]
+    decompress: Callable[[bytes], bytes]
+
+
+def get_codecs(level: int) -> dict[str, Codec]:
+    """
+    Доступные алгоритмы сжатия. Маркер — первый байт значения в Redis:
+    pickle протокола 2 и выше начинается с b"\\x80", поэтому несжатые
+    значения, записанные до включения сжатия, читаются без изменений.
+    """
+    codecs = {
+        "zlib": Codec(
+            marker=b"Z",
+            compress=partial(zlib.compress, level=level),
+            decompress=zlib.decompress,
+        ),
+    }
+    if lz4_frame is not None:
+        codecs["lz4"] = Codec(
+            marker=b"L",
+            compress=lz4_frame.compress,
+            decompress=lz4_frame.decompress,
+        )
+
+    return codecs
+
+
+def encode_payload(data: bytes, codec: Codec | None, min_size: int) -> bytes:
+    if codec is None or len(data) < min_size:
+        return data
+
+    compressed = codec.marker + codec.compress(data)
+    return compressed if len(compressed) < len(data) else data
+
+
+def decode_payload(data: bytes, codecs: dict[str, Codec]) -> bytes:
+    marker = data[:1]
+    for codec in codecs.values():
+        if codec.marker == marker:
+            return codec.decompress(data[1:])
+
+    if marker in (b"Z", b"L"):
+        raise ValueError(f"Значение сжато недоступным алгоритмом (маркер {marker!r})")
+
+    return data
+
+
+class CompressedSerializer(RedisSerializer):
+    """
+    Сериализатор значений кэша: pickle с наибольшим протоколом и сжатием
+    значений от CACHE_COMPRESS_MIN_BYTES байт алгоритмом CACHE_COMPRESSION
+    (zlib, lz4 или none). Целые числа, как и в RedisSerializer, хранятся
+    как есть, чтобы incr/decr оставались атомарными.
+    """
+
+    def __init__(self, protocol=None):
+        super().__init__(protocol=protocol)
+        cache_settings = settings.cache_settings
+
+        self.codecs = get_codecs(level=cache_settings.COMPRESS_LEVEL)
+        self.codec = self.codecs.get(cache_settings.COMPRESSION)
+        if self.codec is None and cache_settings.COMPRESSION != "none":
+            logger.warning(
+                f"Алгоритм сжатия кэша {cache_settings.COMPRESSION!r} недоступен, "
+                f"значения сохраняются без сжатия"
+            )
+        self.min_size = cache_settings.COMPRESS_MIN_BYTES
+
+    def dumps(self, obj):
+        if type(obj) is int:
+            return obj
+
+        return encode_payload(
+            data=pickle.dumps(obj, self.protocol),
+            codec=self.codec,
+            min_size=self.min_size,
+        )
+
+    def loads(self, data):
+        try:
+            return int(data)
+        except ValueError:
+            return pickle.loads(decode_payload(data=data, codecs=self.codecs))
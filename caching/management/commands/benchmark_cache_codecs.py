@@ -0,0 +1,131 @@
+import pickle
+from datetime import date
+from statistics import mean
+from time import perf_counter, time
+from typing import Any, Callable
+
+from django.core.management.base import BaseCommand, CommandError
+
+from caching.codecs import Codec, decode_payload, encode_payload, get_codecs
+from caching.reference import get_redis_client, load_reference_rows
+from caching.utils import CacheEntry
+from config.settings import get_settings
+from contests.models import Contest
+from contests.utils import load_current_contest_stage
+from criteria.models import Criteria
+from criteria.serializers import CriteriaSerializer
+from vk_news.utils import build_news_payload
+
+settings = get_settings()
+
+
+def build_criteria_page(page_size: int) -> dict[str, Any]:
+    queryset = Criteria.objects.only("name").order_by("id")[:page_size]
+    return {
+        "count": Criteria.objects.count(),
+        "next": None,
+        "previous": None,
+        "results": {
+            "data": CriteriaSerializer(instance=queryset, many=True).data,
+            "message": "All nominations",
+        },
+    }
+
+
+def build_contest_stage() -> dict[str, Any]:
+    contest = Contest.objects.only("id").order_by("-id").first()
+    if contest is None:
+        return {"name": "Закончен"}
+
+    return load_current_contest_stage(contest_id=contest.id, today=date.today())
+
+
+def measure(func: Callable[[], Any], iterations: int) -> float:
+    """Среднее время вызова func в микросекундах."""
+    timings = []
+    for _ in range(iterations):
+        started_at = perf_counter()
+        func()
+        timings.append(perf_counter() - started_at)
+
+    return mean(timings) * 1_000_000
+
+
+class Command(BaseCommand):
+    help = (
+        "Сравнивает размер и скорость сериализации реальных значений кэша "
+        "без сжатия и с доступными алгоритмами сжатия."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=200)
+        parser.add_argument("--page-size", type=int, default=1000)
+        parser.add_argument(
+            "--live",
+            action="store_true",
+            help="Дополнительно замерить SET/GET и MEMORY USAGE в Redis",
+        )
+
+    def handle(self, *args, **options):
+        iterations: int = options["iterations"]
+        cache_settings = settings.cache_settings
+
+        payloads: dict[str, Callable[[], Any]] = {
+            "vk_news": build_news_payload,
+            "criteria_page": lambda: build_criteria_page(options["page_size"]),
+            "criteria_reference": lambda: load_reference_rows(name="criteria"),
+            "nominations_reference": lambda: load_reference_rows(name="nominations"),
+            "contest_stage": build_contest_stage,
+        }
+
+        codecs = get_codecs(level=cache_settings.COMPRESS_LEVEL)
+        variants: dict[str, Codec | None] = {"pickle": None, **codecs}
+
+        client = get_redis_client() if options["live"] else None
+        if options["live"] and client is None:
+            raise CommandError("Замер --live доступен только для кэша на Redis")
+
+        header = f"{'значение':<24}{'кодек':<8}{'байт':>10}{'dumps, мкс':>12}{'loads, мкс':>12}"
+        if client is not None:
+            header += f"{'SET, мкс':>11}{'GET, мкс':>11}{'Redis, байт':>13}"
+        self.stdout.write(header)
+
+        for payload_name, build in payloads.items():
+            value = build()
+            entry = CacheEntry(value=value, expires_at=time() + 3600, compute_time=0.0)
+
+            for codec_name, codec in variants.items():
+
+                def dumps(codec=codec):
+                    return encode_payload(
+                        data=pickle.dumps(entry, pickle.HIGHEST_PROTOCOL),
+                        codec=codec,
+                        # Сжимаем всё, чтобы было видно, во что обходится кодек.
+                        min_size=0,
+                    )
+
+                encoded = dumps()
+
+                def loads(encoded=encoded):
+                    return pickle.loads(decode_payload(data=encoded, codecs=codecs))
+
+                row = (
+                    f"{payload_name:<24}{codec_name:<8}{len(encoded):>10}"
+                    f"{measure(dumps, iterations):>12.1f}"
+                    f"{measure(loads, iterations):>12.1f}"
+                )
+
+                if client is not None:
+                    key = f"benchmark:{payload_name}:{codec_name}"
+                    set_time = measure(lambda: client.set(key, encoded), iterations)
+                    get_time = measure(lambda: client.get(key), iterations)
+                    memory_usage = client.memory_usage(key) or 0
+                    client.delete(key)
+                    row += f"{set_time:>11.1f}{get_time:>11.1f}{memory_usage:>13}"
+
+                self.stdout.write(row)
+
+        self.stdout.write(
+            f"Текущие настройки: CACHE_COMPRESSION={cache_settings.COMPRESSION}, "
+            f"CACHE_COMPRESS_MIN_BYTES={cache_settings.COMPRESS_MIN_BYTES}"
+        )
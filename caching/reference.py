@@ -0,0 +1,278 @@
+from collections import OrderedDict
+from os import getpid
+from threading import Lock, Thread
+from time import monotonic, sleep
+from typing import Any, NamedTuple
+
+from django.apps import apps
+from django.core.cache import cache
+
+from caching.utils import cached, invalidate_namespace
+from config.logger import logger
+from config.settings import get_settings
+
+settings = get_settings()
+
+LISTENER_RECONNECT_DELAY: float = 5.0
+LISTENER_POLL_TIMEOUT: float = 1.0
+
+
+class ReferenceTable(NamedTuple):
+    model: str
+    fields: tuple[str, ...]
+
+
+class ReferenceSnapshot(NamedTuple):
+    rows: list[dict[str, Any]]
+    by_id: dict[int, dict[str, Any]]
+
+
+REFERENCE_TABLES: dict[str, ReferenceTable] = {
+    "age_categories": ReferenceTable(
+        model="age_categories.AgeCategories",
+        fields=("id", "name", "start_age", "end_age"),
+    ),
+    "contest_stages": ReferenceTable(
+        model="contest_stage.ContestStage", fields=("id", "name")
+    ),
+    "file_constraints": ReferenceTable(
+        model="file_constraints.FileConstraint",
+        fields=("id", "name", "file_formats"),
+    ),
+    "contest_categories": ReferenceTable(
+        model="contest_categories.ContestCategories", fields=("id", "name")
+    ),
+    "criteria": ReferenceTable(model="criteria.Criteria", fields=("id", "name")),
+    "nominations": ReferenceTable(
+        model="nomination.Nominations", fields=("id", "name")
+    ),
+}
+
+
+class LocalLRUCache:
+    """
+    Кэш в памяти процесса: не больше maxsize записей, каждая живёт не
+    дольше ttl секунд, при переполнении вытесняется давно не читавшаяся.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: str) -> Any | None:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+
+            expires_at, value = item
+            if expires_at <= monotonic():
+                del self._data[key]
+                return None
+
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+local_cache = LocalLRUCache(
+    maxsize=settings.cache_settings.LOCAL_MAXSIZE,
+    ttl=settings.cache_settings.LOCAL_TTL,
+)
+
+_listener_pid: int | None = None
+_listener_ready: bool = False
+_listener_lock = Lock()
+# Увеличивается при каждом сбросе: снимок, прочитанный из Redis до сброса,
+# не должен попасть в локальный кэш после него.
+_invalidation_generation: int = 0
+
+
+def get_redis_client():
+    """Возвращает клиент redis-py кэша по умолчанию или None для других бэкендов."""
+    cache_client = getattr(cache, "_cache", None)
+    if cache_client is None or not hasattr(cache_client, "get_client"):
+        return None
+
+    return cache_client.get_client(write=True)
+
+
+def drop_local(name: str | None = None) -> None:
+    global _invalidation_generation
+
+    _invalidation_generation += 1
+    if name is None:
+        local_cache.clear()
+    else:
+        local_cache.delete(key=name)
+
+
+def listen_for_invalidations(client) -> None:
+    global _listener_ready
+
+    channel = settings.cache_settings.INVALIDATION_CHANNEL
+
+    while True:
+        try:
+            pubsub = client.pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(channel)
+            # Пока подписки не было, сообщения могли потеряться.
+            drop_local()
+            _listener_ready = True
+
+            while True:
+                # Ждём сообщение меньше, чем длится CACHE_SOCKET_TIMEOUT,
+                # иначе простаивающая подписка обрывалась бы по таймауту.
+                message = pubsub.get_message(timeout=LISTENER_POLL_TIMEOUT)
+                if message is None:
+                    continue
+
+                name = message["data"]
+                if isinstance(name, bytes):
+                    name = name.decode()
+                drop_local(name=name)
+        except Exception as e:
+            logger.warning(f"Подписка на сброс справочников прервана: {e}")
+        finally:
+            _listener_ready = False
+            drop_local()
+
+        sleep(LISTENER_RECONNECT_DELAY)
+
+
+def ensure_listener() -> bool:
+    """
+    Запускает в текущем процессе поток, который слушает канал сброса
+    справочников. Поток не переживает fork, поэтому проверяется pid.
+
+    :return: True, если локальному кэшу можно доверять
+    """
+    global _listener_pid
+
+    client = get_redis_client()
+    if client is None:
+        # Кэш без общего хранилища (LocMem, Dummy): сброс в пределах процесса.
+        return True
+
+    if _listener_pid != getpid():
+        with _listener_lock:
+            if _listener_pid != getpid():
+                _listener_pid = getpid()
+                Thread(
+                    target=listen_for_invalidations,
+                    args=(client,),
+                    name="reference-cache-invalidation",
+                    daemon=True,
+                ).start()
+
+    return _listener_ready
+
+
+def get_reference_namespace(name: str) -> str:
+    return f"reference:{name}"
+
+
+def load_reference_rows(name: str) -> list[dict[str, Any]]:
+    table = REFERENCE_TABLES[name]
+    model = apps.get_model(table.model)
+    return list(model.objects.order_by("id").values(*table.fields))
+
+
+def get_reference_snapshot(name: str) -> ReferenceSnapshot:
+    """
+    Читает справочник через два уровня кэша: память процесса, затем Redis,
+    затем база данных. Локальная копия используется, только пока работает
+    подписка на канал сброса, иначе каждый запрос идёт в Redis.
+    """
+    use_local = ensure_listener()
+
+    if use_local:
+        snapshot = local_cache.get(key=name)
+        if snapshot is not None:
+            return snapshot
+
+    generation = _invalidation_generation
+    rows = cached(
+        key="rows",
+        namespace=get_reference_namespace(name=name),
+        ttl=settings.cache_settings.REFERENCE_TTL,
+        loader=lambda: load_reference_rows(name=name),
+    )
+    snapshot = ReferenceSnapshot(rows=rows, by_id={row["id"]: row for row in rows})
+
+    if use_local and generation == _invalidation_generation:
+        local_cache.set(key=name, value=snapshot)
+
+    return snapshot
+
+
+def get_reference_rows(name: str) -> list[dict[str, Any]]:
+    """
+    Возвращает все строки справочника в виде словарей, упорядоченных по id.
+
+    Пример:
+        >>> get_reference_rows("contest_stages")
+        [{"id": 1, "name": "Приём заявок"}, ...]
+    """
+    return get_reference_snapshot(name=name).rows
+
+
+def get_reference_ids(name: str) -> set[int]:
+    return set(get_reference_snapshot(name=name).by_id)
+
+
+def get_reference_row(name: str, pk: int) -> dict[str, Any] | None:
+    """
+    Возвращает строку справочника по id. Если строки нет в кэше (например,
+    она создана, а сброс ещё не дошёл), она читается из базы данных.
+    """
+    row = get_reference_snapshot(name=name).by_id.get(pk)
+    if row is not None:
+        return row
+
+    table = REFERENCE_TABLES[name]
+    return (
+        apps.get_model(table.model).objects.filter(id=pk).values(*table.fields).first()
+    )
+
+
+def get_reference_choices(name: str) -> list[tuple[int, str]]:
+    return [(row["id"], row["name"]) for row in get_reference_rows(name=name)]
+
+
+def invalidate_reference(name: str) -> None:
+    """
+    Сбрасывает справочник в Redis и в памяти всех процессов: текущий процесс
+    очищает свою копию сразу, остальные — получив сообщение из канала
+    CACHE_INVALIDATION_CHANNEL.
+    """
+    # Версия пространства имён увеличивается, а не удаляется ключ: читатель,
+    # загрузивший строки до записи изменений, положит их под старую версию,
+    # которую больше никто не читает.
+    invalidate_namespace(namespace=get_reference_namespace(name=name))
+    drop_local(name=name)
+
+    client = get_redis_client()
+    if client is None:
+        return
+
+    try:
+        client.publish(settings.cache_settings.INVALIDATION_CHANNEL, name)
+    except Exception as e:
+        logger.warning(f"Не удалось разослать сброс справочника {name}: {e}")
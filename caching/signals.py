@@ -0,0 +1,32 @@
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+
+from caching.reference import REFERENCE_TABLES, invalidate_reference
+
+
+def connect_reference_invalidation() -> None:
+    """
+    Сбрасывает кэш справочника после фиксации транзакции, в которой
+    изменилась или удалилась его строка. Массовые операции (bulk_create,
+    update) сигналов не отправляют — после них invalidate_reference
+    вызывается явно.
+    """
+    for name, table in REFERENCE_TABLES.items():
+
+        def handler(sender, name=name, **kwargs):
+            transaction.on_commit(partial(invalidate_reference, name))
+
+        post_save.connect(
+            receiver=handler,
+            sender=table.model,
+            weak=False,
+            dispatch_uid=f"reference_cache_save_{name}",
+        )
+        post_delete.connect(
+            receiver=handler,
+            sender=table.model,
+            weak=False,
+            dispatch_uid=f"reference_cache_delete_{name}",
+        )
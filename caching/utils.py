@@ -0,0 +1,205 @@
+from math import log
+from random import random
+from time import monotonic, sleep, time
+from typing import Any, Callable, Hashable, NamedTuple, TypeVar
+
+from django.core.cache import cache
+
+from config.logger import logger
+from config.settings import get_settings
+
+settings = get_settings()
+
+T = TypeVar("T")
+K = TypeVar("K", bound=Hashable)
+
+LOCK_POLL_INTERVAL: float = 0.05
+
+
+class CacheEntry(NamedTuple):
+    value: Any
+    expires_at: float
+    compute_time: float
+
+
+def is_empty_result(value: Any) -> bool:
+    return value is None or (isinstance(value, (list, tuple, dict, set)) and not value)
+
+
+def get_namespace_version(namespace: str) -> int:
+    return cache.get_or_set(key=f"ns:{namespace}", default=1, timeout=None)
+
+
+def invalidate_namespace(namespace: str) -> None:
+    """
+    Делает недействительными все ключи пространства имён разом: ключи
+    содержат номер версии, поэтому после его увеличения старые записи
+    больше не читаются и истекают сами.
+    """
+    namespace_key = f"ns:{namespace}"
+    cache.add(key=namespace_key, value=1, timeout=None)
+    cache.incr(key=namespace_key)
+
+
+def build_cache_key(key: str, namespace: str | None = None) -> str:
+    if not namespace:
+        return key
+
+    return f"{namespace}:v{get_namespace_version(namespace=namespace)}:{key}"
+
+
+def invalidate(key: str, namespace: str | None = None) -> None:
+    cache.delete(key=build_cache_key(key=key, namespace=namespace))
+
+
+def get_entry(full_key: str) -> CacheEntry | None:
+    """
+    Читает запись cached(). Значения другого формата (например, записанные
+    по тому же ключу до перехода на cached()) считаются промахом.
+    """
+    entry = cache.get(key=full_key)
+    if not isinstance(entry, CacheEntry):
+        return None
+
+    return entry
+
+
+def should_refresh_early(entry: CacheEntry) -> bool:
+    """
+    Вероятностное досрочное обновление (XFetch): чем ближе истечение записи и
+    чем дольше она вычислялась, тем выше шанс, что очередной читатель
+    пересчитает её заранее, не дожидаясь одновременного промаха у всех.
+    """
+    beta = settings.cache_settings.EARLY_REFRESH_BETA
+    return (
+        time() - entry.compute_time * beta * log(random() or 1e-12) >= entry.expires_at
+    )
+
+
+def load_and_store(
+    full_key: str, ttl: int | None, loader: Callable[[], T], negative_ttl: int
+) -> T:
+    started_at = monotonic()
+    value = loader()
+    compute_time = monotonic() - started_at
+
+    timeout = negative_ttl if is_empty_result(value) else ttl
+    expires_at = time() + timeout if timeout is not None else float("inf")
+    cache.set(
+        key=full_key,
+        value=CacheEntry(value=value, expires_at=expires_at, compute_time=compute_time),
+        timeout=timeout,
+    )
+    return value
+
+
+def cached(
+    key: str,
+    ttl: int | None,
+    loader: Callable[[], T],
+    namespace: str | None = None,
+    negative_ttl: int | None = None,
+) -> T:
+    """
+    Возвращает значение из кэша или вычисляет его через loader().
+
+    - Пустые результаты (None, пустые коллекции) тоже кэшируются, но на
+      negative_ttl секунд (по умолчанию CACHE_NEGATIVE_TTL).
+    - При промахе значение вычисляет только один процесс (блокировка через
+      cache.add), остальные до CACHE_LOCK_WAIT секунд ждут его результата.
+    - Незадолго до истечения запись с некоторой вероятностью обновляется
+      одним из читателей, пока остальные получают текущее значение.
+    - namespace позволяет сбросить группу ключей через invalidate_namespace.
+
+    Пример:
+        >>> cached(key="criteria_all", ttl=900, loader=load_criteria,
+        ...        namespace="criteria")
+    """
+    if negative_ttl is None:
+        negative_ttl = settings.cache_settings.NEGATIVE_TTL
+
+    full_key = build_cache_key(key=key, namespace=namespace)
+    lock_key = f"lock:{full_key}"
+    lock_timeout = settings.cache_settings.LOCK_TIMEOUT
+
+    entry = get_entry(full_key=full_key)
+
+    if entry is not None:
+        if should_refresh_early(entry=entry) and cache.add(
+            key=lock_key, value=True, timeout=lock_timeout
+        ):
+            try:
+                return load_and_store(full_key, ttl, loader, negative_ttl)
+            finally:
+                cache.delete(key=lock_key)
+
+        return entry.value
+
+    if cache.add(key=lock_key, value=True, timeout=lock_timeout):
+        try:
+            return load_and_store(full_key, ttl, loader, negative_ttl)
+        finally:
+            cache.delete(key=lock_key)
+
+    deadline = monotonic() + settings.cache_settings.LOCK_WAIT
+    while monotonic() < deadline:
+        sleep(LOCK_POLL_INTERVAL)
+        entry = get_entry(full_key=full_key)
+        if entry is not None:
+            return entry.value
+
+    logger.warning(f"Не дождались вычисления {full_key}, вычисляем без блокировки")
+    return load_and_store(full_key, ttl, loader, negative_ttl)
+
+
+def cached_many(
+    keys: dict[K, str],
+    ttl: int | None,
+    loader: Callable[[list[K]], dict[K, T]],
+    negative_ttl: int | None = None,
+) -> dict[K, T]:
+    """
+    Пакетный вариант cached() для списков: записи всех ключей читаются одним
+    cache.get_many, а промахи вычисляются одним вызовом loader(missing_ids)
+    и сохраняются в том же формате, что и у cached(). Блокировки и досрочного
+    обновления нет: пакет пересчитывает только отсутствующие записи.
+
+    Пример:
+        >>> cached_many(keys={1: "stage_1", 2: "stage_2"}, ttl=1800,
+        ...             loader=load_stages)
+    """
+    if negative_ttl is None:
+        negative_ttl = settings.cache_settings.NEGATIVE_TTL
+
+    stored = cache.get_many(keys=list(keys.values()))
+
+    values = {}
+    missing = []
+    for item_id, full_key in keys.items():
+        entry = stored.get(full_key)
+        if isinstance(entry, CacheEntry):
+            values[item_id] = entry.value
+        else:
+            missing.append(item_id)
+
+    if not missing:
+        return values
+
+    started_at = monotonic()
+    loaded = loader(missing)
+    compute_time = (monotonic() - started_at) / len(missing)
+
+    entries_by_timeout: dict[int | None, dict[str, CacheEntry]] = {}
+    for item_id in missing:
+        value = loaded[item_id]
+        timeout = negative_ttl if is_empty_result(value) else ttl
+        expires_at = time() + timeout if timeout is not None else float("inf")
+        entries_by_timeout.setdefault(timeout, {})[keys[item_id]] = CacheEntry(
+            value=value, expires_at=expires_at, compute_time=compute_time
+        )
+        values[item_id] = value
+
+    for timeout, entries in entries_by_timeout.items():
+        cache.set_many(data=entries, timeout=timeout)
+
+    return values
@@ -0,0 +1,14 @@
+from pydantic_settings import SettingsConfigDict
+
+from config.base import ConfigBase
+
+
+class AuthSettings(ConfigBase):
+    model_config = SettingsConfigDict(env_prefix="AUTH_")
+
+    CONFIRMATION_STORE: str = "cache"
+    CONFIRMATION_TTL: int = 3600
+    CODE_LIFETIME: int = 600
+    MAX_CODE_SENDS: int = 3
+    LOCK_SECONDS: int = 900
+    SESSION_ENGINE: str = "django.contrib.sessions.backends.cache"
@@ -0,0 +1,23 @@
+from pydantic_settings import SettingsConfigDict
+
+from config.base import ConfigBase
+
+
+class CacheSettings(ConfigBase):
+    model_config = SettingsConfigDict(env_prefix="CACHE_")
+
+    NEGATIVE_TTL: int = 60
+    LOCK_TIMEOUT: int = 10
+    LOCK_WAIT: float = 3.0
+    EARLY_REFRESH_BETA: float = 1.0
+    REFERENCE_TTL: int = 3600
+    LOCAL_MAXSIZE: int = 64
+    LOCAL_TTL: int = 300
+    INVALIDATION_CHANNEL: str = "cache:invalidate"
+    COMPRESSION: str = "zlib"
+    COMPRESS_MIN_BYTES: int = 1024
+    COMPRESS_LEVEL: int = 6
+    MAX_CONNECTIONS: int = 50
+    SOCKET_TIMEOUT: float = 5.0
+    SOCKET_CONNECT_TIMEOUT: float = 2.0
+    HEALTH_CHECK_INTERVAL: int = 30
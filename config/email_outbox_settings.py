@@ -0,0 +1,13 @@
+from pydantic_settings import SettingsConfigDict
+
+from config.base import ConfigBase
+
+
+class EmailOutboxSettings(ConfigBase):
+    model_config = SettingsConfigDict(env_prefix="EMAIL_OUTBOX_")
+
+    FROM_EMAIL: str = "manager@skazka-design.ru"
+    MAX_ATTEMPTS: int = 8
+    BACKOFF_SECONDS: int = 30
+    BACKOFF_MAX_SECONDS: int = 3600
+    LEASE_SECONDS: int = 300
@@ -0,0 +1,42 @@
+from pydantic_settings import SettingsConfigDict
+
+from config.base import ConfigBase
+
+
+class MonitoringSettings(ConfigBase):
+    model_config = SettingsConfigDict(env_prefix="MONITORING_")
+
+    ENABLED: bool = True
+    SAMPLE_RATE: float = 1.0
+    QUERY_BUDGET: int = 50
+    DUPLICATE_QUERY_BUDGET: int = 5
+    LATENCY_BUDGET_MS: int = 1000
+    # Бюджеты запросов отдельных маршрутов, например {"api/v1/contests/id": 10}.
+    VIEW_QUERY_BUDGETS: dict[str, int] = {}
+    # Значение заголовка X-Server-Timing, при котором Server-Timing отдаётся
+    # не только администраторам (пусто — только администраторам).
+    SERVER_TIMING_TOKEN: str = ""
+    # Токен для /metrics (пусто — /metrics отвечает 403).
+    METRICS_TOKEN: str = ""
+    SLOW_QUERY_MS: int = 200
+    # Маршруты (префиксы), на которых медленные запросы сохраняются в slow_query.
+    SLOW_QUERY_ROUTES: list[str] = [
+        "api/v1/contests/",
+        "api/v1/applications/",
+        "api/v1/winners/",
+    ]
+    # Доля сохраняемых медленных SELECT, для которых в фоне выполняется
+    # EXPLAIN ANALYZE (не больше одного на запрос), и его предельное время.
+    SLOW_QUERY_EXPLAIN_RATE: float = 0.1
+    SLOW_QUERY_EXPLAIN_TIMEOUT_MS: int = 5000
+    # Каталог профилей запросов (.pstats) и сколько последних профилей хранить.
+    PROFILE_DIR: str = "/tmp/contest_backend_profiles"
+    PROFILE_MAX_COUNT: int = 50
+    # Трассировка: доля запросов, для которых пишутся спаны, и куда они
+    # выгружаются в формате OTLP/JSON (файл и/или коллектор, например
+    # http://otel-collector:4318/v1/traces). Без файла и коллектора выключена.
+    TRACE_SAMPLE_RATE: float = 0.01
+    TRACE_FILE: str = ""
+    TRACE_FILE_MAX_BYTES: int = 100 * 1024 * 1024
+    OTLP_ENDPOINT: str = ""
+    TRACE_SERVICE_NAME: str = "contest_backend"
@@ -0,0 +1,12 @@
+from pydantic_settings import SettingsConfigDict
+
+from config.base import ConfigBase
+
+
+class NotificationSettings(ConfigBase):
+    model_config = SettingsConfigDict(env_prefix="NOTIFICATION_")
+
+    RATE_PER_SECOND: float = 5.0
+    BATCH_SIZE: int = 200
+    WINNER_PLACES: int = 3
+    LOCK_TIMEOUT: int = 60 * 60
@@ -0,0 +1,16 @@
+from pydantic_settings import SettingsConfigDict
+
+from config.base import ConfigBase
+
+
+class RetentionSettings(ConfigBase):
+    model_config = SettingsConfigDict(env_prefix="RETENTION_")
+
+    BATCH_SIZE: int = 1000
+    SLEEP_SECONDS: float = 0.2
+    LOCK_TIMEOUT_MS: int = 2000
+    CONFIRMATION_DAYS: int = 1
+    USER_BLOCK_DAYS: int = 90
+    SOFT_DELETED_DAYS: int = 30
+    EMAIL_OUTBOX_DAYS: int = 30
+    SLOW_QUERY_DAYS: int = 14
@@ -1,11 +1,18 @@
+from config.auth_settings import AuthSettings
+from config.cache_settings import CacheSettings
 from config.email_credentials import EmailCredentials
+from config.email_outbox_settings import EmailOutboxSettings
+from config.monitoring_settings import MonitoringSettings
+from config.notification_settings import NotificationSettings
 from config.postgres_credentials import PostgresCredentials
+from config.retention_settings import RetentionSettings
 from config.token_credentials import TokenCredentials
 from functools import lru_cache
 
 from pydantic_settings import BaseSettings
 from pydantic import Field
 
+from config.storage_settings import StorageSettings
 from config.vk_credentials import VkCredentials
 from config.yandex_s3_credentials import YandexS3Credentials
 
@@ -20,6 +27,17 @@ class Settings(BaseSettings):
     token_credentials: TokenCredentials = Field(default_factory=TokenCredentials)
     email_credentials: EmailCredentials = Field(default_factory=EmailCredentials)
     vk_credentials: VkCredentials = Field(default_factory=VkCredentials)
+    storage_settings: StorageSettings = Field(default_factory=StorageSettings)
+    email_outbox_settings: EmailOutboxSettings = Field(
+        default_factory=EmailOutboxSettings
+    )
+    notification_settings: NotificationSettings = Field(
+        default_factory=NotificationSettings
+    )
+    cache_settings: CacheSettings = Field(default_factory=CacheSettings)
+    auth_settings: AuthSettings = Field(default_factory=AuthSettings)
+    retention_settings: RetentionSettings = Field(default_factory=RetentionSettings)
+    monitoring_settings: MonitoringSettings = Field(default_factory=MonitoringSettings)
 
 
 @lru_cache
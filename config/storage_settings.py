@@ -0,0 +1,9 @@
+from pydantic_settings import SettingsConfigDict
+
+from config.base import ConfigBase
+
+
+class StorageSettings(ConfigBase):
+    model_config = SettingsConfigDict(env_prefix="storage_")
+
+    CONTEST_QUOTA_BYTES: int = 10 * 1024 * 1024 * 1024
@@ -10,3 +10,14 @@ class VkCredentials(ConfigBase):
     DOMAIN: str
     COUNT_POSTS: int
     API_VERSION: str
+    API_URL: str = "https://api.vk.com/method"
+    CONNECT_TIMEOUT: float = 3.05
+    READ_TIMEOUT: float = 10
+    MAX_RETRIES: int = 2
+    RETRY_BACKOFF: float = 0.5
+    POOL_SIZE: int = 4
+    CIRCUIT_FAILURE_THRESHOLD: int = 5
+    CIRCUIT_RESET_TIMEOUT: int = 5 * 60
+    REFRESH_INTERVAL: int = 24 * 60 * 60
+    REFRESH_RETRY_INTERVAL: int = 5 * 60
+    REFRESH_LOCK_TIMEOUT: int = 2 * 60
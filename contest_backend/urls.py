@@ -6,6 +6,8 @@ from drf_spectacular.views import (
     SpectacularRedocView,
 )
 
+from monitoring.views import metrics_view
+
 urlpatterns = [
     path(route="admin/", view=admin.site.urls),
     path(route="api/v1/auth/", view=include("authentication.urls")),
@@ -24,6 +26,8 @@ urlpatterns = [
     path(route="api/v1/file_constraints/", view=include("file_constraints.urls")),
     path(route="api/v1/winners/", view=include("winners.urls")),
     path(route="api/v1/admin/", view=include("block_user.urls")),
+    path(route="api/v1/monitoring/", view=include("monitoring.urls")),
+    path(route="metrics", view=metrics_view, name="metrics_view"),
     path("api/v1/schema/", SpectacularAPIView.as_view(), name="schema"),
     path(
         "api/v1/docs/",
@@ -5,7 +5,7 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
 from block_user.permissions import IsNotBlockUserPermission
-from contest_categories.models import ContestCategories
+from caching.reference import get_reference_rows
 from contest_categories.serializers import ContestCategoriesSerializer
 
 
@@ -16,6 +16,6 @@ from contest_categories.serializers import ContestCategoriesSerializer
 @api_view(http_method_names=["GET"])
 @permission_classes(permission_classes=[IsAuthenticated, IsNotBlockUserPermission])
 def all_contest_categories_view(request):
-    contest_categories = ContestCategories.objects.all()
+    contest_categories = get_reference_rows(name="contest_categories")
     serializer = ContestCategoriesSerializer(contest_categories, many=True)
     return Response(data=serializer.data, status=status.HTTP_200_OK)
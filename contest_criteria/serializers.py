@@ -1,8 +1,8 @@
 from rest_framework.fields import SerializerMethodField
 from rest_framework.serializers import ModelSerializer
 
+from caching.reference import get_reference_row
 from contest_criteria.models import ContestCriteria
-from criteria.models import Criteria
 
 
 class ContestCriteriaSerializer(ModelSerializer[ContestCriteria]):
@@ -18,7 +18,7 @@ class ContestCriteriaSerializer(ModelSerializer[ContestCriteria]):
         ]
 
     def get_criteria_name(self, instance):
-        return Criteria.objects.get(id=instance.criteria_id).name
+        return get_reference_row(name="criteria", pk=instance.criteria_id)["name"]
 
 
 class ContestCriteriaFullSerializer(ModelSerializer[ContestCriteria]):
@@ -36,7 +36,7 @@ class ContestCriteriaFullSerializer(ModelSerializer[ContestCriteria]):
         ]
 
     def get_criteria_name(self, instance):
-        return Criteria.objects.get(id=instance.criteria_id).name
+        return get_reference_row(name="criteria", pk=instance.criteria_id)["name"]
 
     def get_criteria_id(self, instance):
-        return Criteria.objects.get(id=instance.criteria_id).id
+        return instance.criteria_id
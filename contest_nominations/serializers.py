@@ -1,8 +1,8 @@
 from rest_framework.fields import SerializerMethodField
 from rest_framework.serializers import ModelSerializer
 
+from caching.reference import get_reference_row
 from contest_nominations.models import ContestNominations
-from nomination.models import Nominations
 
 
 class ContestNominationsSerializer(ModelSerializer[ContestNominations]):
@@ -18,7 +18,7 @@ class ContestNominationsSerializer(ModelSerializer[ContestNominations]):
         ]
 
     def get_nomination_name(self, instance):
-        return Nominations.objects.get(id=instance.nomination_id).name
+        return get_reference_row(name="nominations", pk=instance.nomination_id)["name"]
 
     def get_nomination_id(self, instance):
-        return Nominations.objects.get(id=instance.nomination_id).id
+        return instance.nomination_id
@@ -7,10 +7,11 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 
 from block_user.permissions import IsNotBlockUserPermission
-from contest_stage.models import ContestStage
+from caching.reference import get_reference_rows
 from contest_stage.serializers import ContestStageSerializer
 from contests.models import Contest
 from contests.serializers import ContestChangeStageSerializer
+from contests.utils import invalidate_current_contest_stage
 
 
 @extend_schema(
@@ -20,7 +21,7 @@ from contests.serializers import ContestChangeStageSerializer
 @api_view(http_method_names=["GET"])
 @permission_classes(permission_classes=[AllowAny])
 def all_contest_stage_view(request):
-    all_contest_stages = ContestStage.objects.all()
+    all_contest_stages = get_reference_rows(name="contest_stages")
     serializer = ContestStageSerializer(all_contest_stages, many=True)
     return Response(data=serializer.data, status=status.HTTP_200_OK)
 
@@ -88,6 +89,7 @@ def add_or_remove_contest_stage_in_contest_view(request: Request) -> Response:
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
     data = serializer.change_contest_stages_in_contest()
+    invalidate_current_contest_stage(contest_id=contest.id)
 
     return Response(
         data={"message": "Contest stage updated successfully", "data": data},
@@ -2,28 +2,26 @@ from datetime import date
 
 from django_filters import (
     FilterSet,
-    ModelMultipleChoiceFilter,
+    MultipleChoiceFilter,
     NumberFilter,
     CharFilter,
 )
 
-from age_categories.models import AgeCategories
-from contest_stage.models import ContestStage
+from caching.reference import get_reference_choices
 from contests.models import Contest
 
 
 class ContestFilter(FilterSet):
     contest_title = CharFilter(field_name="title", lookup_expr="icontains")
 
-    age_category = ModelMultipleChoiceFilter(
+    age_category = MultipleChoiceFilter(
         field_name="age_category",
-        queryset=AgeCategories.objects.all(),
+        choices=lambda: get_reference_choices(name="age_categories"),
     )
 
-    contest_stage = ModelMultipleChoiceFilter(
-        queryset=ContestStage.objects.all(),
+    contest_stage = MultipleChoiceFilter(
+        choices=lambda: get_reference_choices(name="contest_stages"),
         field_name="contestsconteststage__stage",
-        to_field_name="id",
         conjoined=False,
         method="filter_contest_stage_with_current_check",
     )
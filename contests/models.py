@@ -22,6 +22,7 @@ class Contest(models.Model):
     )
     is_draft = models.BooleanField(name="is_draft", null=False, default=True)
     is_deleted = models.BooleanField(name="is_deleted", null=False, default=False)
+    deleted_at = models.DateTimeField(name="deleted_at", null=True, blank=True)
     is_published = models.BooleanField(name="is_published", null=False, default=False)
 
     contest_category = models.ForeignKey(
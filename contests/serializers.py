@@ -18,6 +18,12 @@ from age_categories.models import AgeCategories
 from age_categories.serializers import AgeCategoriesSerializer
 from applications.enums import ApplicationStatus
 from applications.models import Applications
+from caching.reference import (
+    get_reference_ids,
+    get_reference_row,
+    invalidate_reference,
+)
+from caching.utils import invalidate_namespace
 from contest_categories.models import ContestCategories
 from contest_criteria.models import ContestCriteria
 from contest_criteria.serializers import ContestCriteriaSerializer
@@ -30,7 +36,6 @@ from contests.utils import get_current_contest_stage
 from contests_contest_stage.models import ContestsContestStage
 from contests_contest_stage.serializers import ContestsContestStageSerializer
 from criteria.models import Criteria
-from file_constraints.models import FileConstraint
 from nomination.models import Nominations
 from participants.enums import ParticipantRole
 from participants.models import Participant
@@ -75,7 +80,7 @@ class ContestByIdSerializer(ModelSerializer[Contest]):
     def get_file_constraint(self, instance):
         contest_file_constraints = ContestFileConstraints.objects.filter(
             contest=instance
-        ).all()
+        ).select_related("file_constraints")
         return ContestFileConstraintsSerializer(
             instance=contest_file_constraints, many=True
         ).data
@@ -83,17 +88,19 @@ class ContestByIdSerializer(ModelSerializer[Contest]):
     def get_org_committee(self, instance):
         org_committee_list = Participant.objects.filter(
             contest_id=instance.id, role=ParticipantRole.org_committee.value
-        ).all()
+        ).select_related("user")
         return PartisipantContestSerializer(instance=org_committee_list, many=True).data
 
     def get_jury(self, instance):
         jury_list = Participant.objects.filter(
             contest_id=instance.id, role=ParticipantRole.jury.value
-        ).all()
+        ).select_related("user")
         return PartisipantContestSerializer(instance=jury_list, many=True).data
 
     def get_contest_category(self, instance):
-        return instance.contest_category.name
+        return get_reference_row(
+            name="contest_categories", pk=instance.contest_category_id
+        )["name"]
 
     def get_criteria(self, instance):
         criteria_list = ContestCriteria.objects.filter(contest_id=instance.id).all()
@@ -118,8 +125,41 @@ class ContestByIdSerializer(ModelSerializer[Contest]):
         ).data
 
 
-class ContestAllSerializer(ModelSerializer[Contest]):
+class ContestAvatarThumbnailsMixin:
+    """
+    Отдаёт ссылки на уменьшенные копии аватара конкурса.
+
+    Карта копий передаётся во view через context["avatar_thumbnails"]
+    (см. storage_s3.utils.get_image_derivatives_map), чтобы список конкурсов
+    получал все копии одним запросом.
+    """
+
+    def get_avatar_thumbnails(self, contest):
+        return self.context.get("avatar_thumbnails", {}).get(contest.avatar, {})
+
+
+class ContestCurrentStageMixin:
+    """
+    Отдаёт текущую стадию конкурса.
+
+    Списки конкурсов передают стадии через context["current_stages"]
+    (см. contests.utils.get_current_contest_stages), чтобы при пустом кэше
+    стадии всех конкурсов загружались одним запросом.
+    """
+
+    def get_contest_current_stage(self, contest):
+        current_stages = self.context.get("current_stages", {})
+        if contest.id in current_stages:
+            return current_stages[contest.id]
+
+        return get_current_contest_stage(contest_id=contest.id)
+
+
+class ContestAllSerializer(
+    ContestAvatarThumbnailsMixin, ContestCurrentStageMixin, ModelSerializer[Contest]
+):
     contest_stage = SerializerMethodField()
+    avatar_thumbnails = SerializerMethodField()
 
     class Meta:
         model = Contest
@@ -127,17 +167,19 @@ class ContestAllSerializer(ModelSerializer[Contest]):
             "id",
             "title",
             "avatar",
+            "avatar_thumbnails",
             "contest_category",
             "contest_stage",
         ]
 
     def get_contest_stage(self, contest):
-        return get_current_contest_stage(contest_id=contest.id)
+        return self.get_contest_current_stage(contest=contest)
 
 
-class ContestAllOwnerSerializer(ModelSerializer[Contest]):
+class ContestAllOwnerSerializer(ContestAvatarThumbnailsMixin, ModelSerializer[Contest]):
     count_application = SerializerMethodField()
     count_jury = SerializerMethodField()
+    avatar_thumbnails = SerializerMethodField()
 
     class Meta:
         model = Contest
@@ -145,6 +187,7 @@ class ContestAllOwnerSerializer(ModelSerializer[Contest]):
             "id",
             "title",
             "avatar",
+            "avatar_thumbnails",
             "count_application",
             "count_jury",
             "is_draft",
@@ -153,29 +196,48 @@ class ContestAllOwnerSerializer(ModelSerializer[Contest]):
         ]
 
     def get_count_application(self, contest):
-        return Applications.objects.filter(contest=contest).count()
+        if hasattr(contest, "application_count"):
+            return contest.application_count
+
+        return Applications.objects.filter(contest=contest, is_deleted=False).count()
 
     def get_count_jury(self, contest):
+        if hasattr(contest, "jury_count"):
+            return contest.jury_count
+
         return Participant.objects.filter(
             contest=contest, role=ParticipantRole.jury.value
         ).count()
 
 
-class ContestAllJurySerializer(ModelSerializer[Contest]):
+class ContestAllJurySerializer(
+    ContestAvatarThumbnailsMixin, ContestCurrentStageMixin, ModelSerializer[Contest]
+):
     current_stage = SerializerMethodField()
     count_application = SerializerMethodField()
+    avatar_thumbnails = SerializerMethodField()
 
     class Meta:
         model = Contest
-        fields = ["id", "avatar", "title", "current_stage", "count_application"]
+        fields = [
+            "id",
+            "avatar",
+            "avatar_thumbnails",
+            "title",
+            "current_stage",
+            "count_application",
+        ]
 
     def get_count_application(self, contest):
+        if hasattr(contest, "application_count"):
+            return contest.application_count
+
         return Applications.objects.filter(
-            status=ApplicationStatus.accepted.value, contest=contest
+            status=ApplicationStatus.accepted.value, contest=contest, is_deleted=False
         ).count()
 
     def get_current_stage(self, contest):
-        return get_current_contest_stage(contest_id=contest.id)
+        return self.get_contest_current_stage(contest=contest)
 
 
 class CreateBaseContestSerializer(ModelSerializer[Contest]):
@@ -235,9 +297,7 @@ class CreateBaseContestSerializer(ModelSerializer[Contest]):
         if not value:
             raise ValidationError("Age categories cannot be empty")
 
-        existing_ids = set(
-            AgeCategories.objects.filter(id__in=value).values_list("id", flat=True)
-        )
+        existing_ids = get_reference_ids(name="age_categories")
 
         invalid_age_categories = [
             age_category_id
@@ -271,9 +331,7 @@ class UpdateBaseContestSerializer(Serializer):
                 detail={"error": "Age categories cannot be empty"}, code=400
             )
 
-        existing_ids = set(
-            AgeCategories.objects.filter(id__in=value).values_list("id", flat=True)
-        )
+        existing_ids = get_reference_ids(name="age_categories")
 
         invalid_age_categories = [
             age_category_id
@@ -333,6 +391,11 @@ class UpdateBaseContestSerializer(Serializer):
         return
 
 
+class CatalogAutocompleteQuerySerializer(Serializer):
+    q = CharField(required=False, allow_blank=True, max_length=100, default="")
+    limit = IntegerField(required=False, min_value=1, max_value=50, default=10)
+
+
 class ContestChangeCriteriaSerializer(Serializer):
     criteria_list = ListField(child=JSONField(), required=True, write_only=True)
 
@@ -461,6 +524,11 @@ class ContestChangeCriteriaSerializer(Serializer):
                     fields=["description", "min_points", "max_points"],
                 )
 
+            if new_names:
+                transaction.on_commit(lambda: invalidate_reference("criteria"))
+            if new_names or to_add or to_remove:
+                transaction.on_commit(lambda: invalidate_namespace("criteria"))
+
         return result
 
 
@@ -548,6 +616,11 @@ class ContestChangeNominationSerializer(Serializer):
                         contest=contest, nomination__name=name
                     ).update(description=nomination_dict[name])
 
+            if new_names:
+                transaction.on_commit(lambda: invalidate_reference("nominations"))
+            if new_names or to_add or to_remove:
+                transaction.on_commit(lambda: invalidate_namespace("nominations"))
+
         return result
 
 
@@ -682,13 +755,9 @@ class FileConstraintChangeSerializer(Serializer):
 
         received_ids = [item.get("id") for item in value]
 
-        existing_ids = list(
-            FileConstraint.objects.filter(id__in=received_ids).values_list(
-                "id", flat=True
-            )
-        )
+        existing_ids = get_reference_ids(name="file_constraints")
 
-        missing_ids = set(received_ids) - set(existing_ids)
+        missing_ids = set(received_ids) - existing_ids
 
         if not missing_ids:
             return value
@@ -757,9 +826,9 @@ class ContestWinnerSerializer(Serializer):
         contest: Contest = self.context.get("contest", None)
 
         with transaction.atomic():
-            applications = Applications.objects.filter(contest_id=contest.id).annotate(
-                total_score=Sum("workrate__rate")
-            )
+            applications = Applications.objects.filter(
+                contest_id=contest.id, is_deleted=False
+            ).annotate(total_score=Sum("workrate__rate"))
 
             existing_winners = {
                 winner.application_id: winner
@@ -1,37 +1,163 @@
 from datetime import date
 from typing import Dict, Any
 
-from django.core.cache import cache
+from django.contrib.postgres.search import TrigramSimilarity
+from django.db.models import (
+    BooleanField,
+    Count,
+    ExpressionWrapper,
+    OuterRef,
+    Q,
+    QuerySet,
+    Subquery,
+)
+from django.db.models.functions import Coalesce
+
+from caching.utils import cached, cached_many, invalidate
 
 from contests.models import Contest
 from contests_contest_stage.models import ContestsContestStage
 
 
+def get_current_contest_stage_cache_key(contest_id: int, today: date) -> str:
+    return f"current_contest_stage_{contest_id}_{today.isoformat()}"
+
+
+def describe_current_stage(
+    contest_stages: list[ContestsContestStage], today: date
+) -> Dict[str, Any]:
+    """
+    Текущая стадия по списку стадий конкурса, упорядоченному по id.
+    """
+    for contest_stage in contest_stages:
+        if contest_stage.start_date <= today <= contest_stage.end_date:
+            return {
+                "name": contest_stage.stage.name,
+                "start_date": contest_stage.start_date,
+                "end_date": contest_stage.end_date,
+            }
+
+    future_stages_exist = any(
+        contest_stage.start_date > today for contest_stage in contest_stages
+    )
+
+    return {"name": "Запланирован" if future_stages_exist else "Закончен"}
+
+
+def load_current_contest_stages(
+    contest_ids: list[int], today: date
+) -> Dict[int, Dict[str, Any]]:
+    stages_by_contest: Dict[int, list[ContestsContestStage]] = {
+        contest_id: [] for contest_id in contest_ids
+    }
+    for contest_stage in (
+        ContestsContestStage.objects.filter(contest_id__in=contest_ids)
+        .select_related("stage")
+        .order_by("id")
+    ):
+        stages_by_contest[contest_stage.contest_id].append(contest_stage)
+
+    return {
+        contest_id: describe_current_stage(contest_stages=contest_stages, today=today)
+        for contest_id, contest_stages in stages_by_contest.items()
+    }
+
+
+def load_current_contest_stage(contest_id: int, today: date) -> Dict[str, Any]:
+    return load_current_contest_stages(contest_ids=[contest_id], today=today)[
+        contest_id
+    ]
+
+
 def get_current_contest_stage(contest_id: int) -> Dict[str, Any]:
     today = date.today()
-    cache_key = f"current_contest_stage_{contest_id}"
-
-    current_stage = cache.get(key=cache_key)
-
-    if not current_stage:
-        current_stage = ContestsContestStage.objects.filter(
-            contest_id=contest_id,
-            start_date__lte=today,
-            end_date__gte=today,
-        ).first()
-        if current_stage:
-            cache.set(cache_key, current_stage, timeout=60 * 30)
-
-    if current_stage:
-        return {
-            "name": current_stage.stage.name,
-            "start_date": current_stage.start_date,
-            "end_date": current_stage.end_date,
-        }
-
-    future_stages_exist = ContestsContestStage.objects.filter(
-        contest_id=contest_id,
-        start_date__gt=today
-    ).exists()
 
-    return {"name": "Запланирован" if future_stages_exist else "Закончен"}
+    return cached(
+        key=get_current_contest_stage_cache_key(contest_id=contest_id, today=today),
+        ttl=60 * 30,
+        loader=lambda: load_current_contest_stage(contest_id=contest_id, today=today),
+    )
+
+
+def get_current_contest_stages(contest_ids: list[int]) -> Dict[int, Dict[str, Any]]:
+    """
+    Текущие стадии списка конкурсов: те же записи кэша, что и у
+    get_current_contest_stage, но промахи загружаются одним запросом.
+    """
+    today = date.today()
+
+    return cached_many(
+        keys={
+            contest_id: get_current_contest_stage_cache_key(
+                contest_id=contest_id, today=today
+            )
+            for contest_id in contest_ids
+        },
+        ttl=60 * 30,
+        loader=lambda missing: load_current_contest_stages(
+            contest_ids=missing, today=today
+        ),
+    )
+
+
+def invalidate_current_contest_stage(contest_id: int) -> None:
+    invalidate(
+        key=get_current_contest_stage_cache_key(
+            contest_id=contest_id, today=date.today()
+        )
+    )
+
+
+def count_by_contest(queryset: QuerySet) -> Coalesce:
+    """
+    Подзапрос с числом строк queryset у каждого конкурса: для annotate
+    списков конкурсов вместо отдельного COUNT на каждую строку.
+
+    Пример:
+        >>> Contest.objects.annotate(
+        ...     application_count=count_by_contest(Applications.objects.all())
+        ... )
+    """
+    return Coalesce(
+        Subquery(
+            queryset.filter(contest_id=OuterRef("pk"))
+            .order_by()
+            .values("contest_id")
+            .annotate(count=Count("id"))
+            .values("count")
+        ),
+        0,
+    )
+
+
+def autocomplete_catalog_names(
+    queryset: QuerySet, usage_field: str, query: str, limit: int
+) -> list[dict[str, Any]]:
+    """
+    Подсказки для справочников критериев и номинаций.
+
+    Совпадения по началу названия идут первыми, затем — чаще используемые в
+    конкурсах, затем — более похожие по триграммам. Поиск по подстроке и по
+    сходству использует GIN-индексы gin_trgm_ops на name и UPPER(name).
+
+    :param usage_field: обратная связь на промежуточную модель конкурса
+        (например, "contestcriteria")
+    """
+    queryset = queryset.annotate(usage=Count(usage_field))
+
+    if not query:
+        return list(
+            queryset.order_by("-usage", "name").values("id", "name", "usage")[:limit]
+        )
+
+    return list(
+        queryset.annotate(
+            is_prefix=ExpressionWrapper(
+                Q(name__istartswith=query), output_field=BooleanField()
+            ),
+            similarity=TrigramSimilarity("name", query),
+        )
+        .filter(Q(name__icontains=query) | Q(name__trigram_similar=query))
+        .order_by("-is_prefix", "-usage", "-similarity", "name")
+        .values("id", "name", "usage")[:limit]
+    )
@@ -1,3 +1,4 @@
+from django.utils import timezone
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import OpenApiExample, extend_schema, OpenApiParameter
 from rest_framework import status
@@ -7,6 +8,8 @@ from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.response import Response
 from rest_framework.request import Request
 
+from applications.enums import ApplicationStatus
+from applications.models import Applications
 from authentication.permissions import IsAdminSystemPermission
 from block_user.permissions import IsNotBlockUserPermission
 from contests.filter import ContestFilter
@@ -20,8 +23,11 @@ from contests.serializers import (
     ContestAllOwnerSerializer,
     ContestAllJurySerializer,
 )
+from contests.utils import count_by_contest, get_current_contest_stages
 from participants.enums import ParticipantRole
+from participants.models import Participant
 from participants.permissions import IsContestOwnerPermission
+from storage_s3.utils import get_image_derivatives_map
 
 
 @extend_schema(
@@ -206,9 +212,17 @@ def reject_publish_contest_view(request: Request) -> Response:
     permission_classes=[IsAdminSystemPermission, IsNotBlockUserPermission]
 )
 def get_published_contest_view(request: Request) -> Response:
-    contest_list = Contest.objects.all().filter(is_published=True)
-
-    serializer = ContestAllSerializer(instance=contest_list, many=True)
+    contest_list = list(Contest.objects.all().filter(is_published=True))
+
+    serializer = ContestAllSerializer(
+        instance=contest_list,
+        many=True,
+        context={
+            "current_stages": get_current_contest_stages(
+                contest_ids=[contest.id for contest in contest_list]
+            )
+        },
+    )
     return Response(data=serializer.data, status=status.HTTP_200_OK)
 
 
@@ -249,14 +263,9 @@ def get_published_contest_view(request: Request) -> Response:
 @api_view(http_method_names=["GET"])
 @permission_classes(permission_classes=[AllowAny])
 def get_contest_by_id_view(request: Request) -> Response:
-    instance = Contest.objects.prefetch_related(
-        "criteria",
-        "nominations",
-        "age_category",
-        "participants",
-        "contest_stage",
-        "file_constraint",
-    ).get(id=request.contest_id)
+    # Связанные строки ContestByIdSerializer загружает сам, по запросу на
+    # каждый список.
+    instance = Contest.objects.get(id=request.contest_id)
 
     serializer = ContestByIdSerializer(instance=instance)
 
@@ -292,14 +301,9 @@ def get_contest_by_id_view(request: Request) -> Response:
     ]
 )
 def get_contest_by_id_owner_view(request: Request) -> Response:
-    instance = Contest.objects.prefetch_related(
-        "criteria",
-        "nominations",
-        "age_category",
-        "participants",
-        "contest_stage",
-        "file_constraint",
-    ).get(id=request.contest_id)
+    # Связанные строки ContestByIdSerializer загружает сам, по запросу на
+    # каждый список.
+    instance = Contest.objects.get(id=request.contest_id)
 
     serializer = ContestByIdSerializer(instance=instance)
 
@@ -329,9 +333,22 @@ def get_contest_by_id_owner_view(request: Request) -> Response:
 @api_view(http_method_names=["GET"])
 @permission_classes(permission_classes=[AllowAny])
 def get_all_contests_not_permissions_view(request: Request) -> Response:
-    contest_list = Contest.objects.filter(is_published=True, is_deleted=False).all()
+    contest_list = list(
+        Contest.objects.filter(is_published=True, is_deleted=False).all()
+    )
 
-    serializer = ContestAllSerializer(instance=contest_list, many=True)
+    serializer = ContestAllSerializer(
+        instance=contest_list,
+        many=True,
+        context={
+            "avatar_thumbnails": get_image_derivatives_map(
+                urls=[contest.avatar for contest in contest_list]
+            ),
+            "current_stages": get_current_contest_stages(
+                contest_ids=[contest.id for contest in contest_list]
+            ),
+        },
+    )
 
     return Response(data=serializer.data, status=status.HTTP_200_OK)
 
@@ -398,7 +415,18 @@ def get_all_contests_view(request: Request) -> Response:
         queryset=contest_filter.qs, request=request
     )
 
-    serializer = ContestAllSerializer(instance=paginated_queryset, many=True)
+    serializer = ContestAllSerializer(
+        instance=paginated_queryset,
+        many=True,
+        context={
+            "avatar_thumbnails": get_image_derivatives_map(
+                urls=[contest.avatar for contest in paginated_queryset]
+            ),
+            "current_stages": get_current_contest_stages(
+                contest_ids=[contest.id for contest in paginated_queryset]
+            ),
+        },
+    )
 
     return paginator.get_paginated_response(serializer.data)
 
@@ -430,13 +458,32 @@ def get_all_contests_view(request: Request) -> Response:
 @api_view(http_method_names=["GET"])
 @permission_classes(permission_classes=[IsAuthenticated, IsNotBlockUserPermission])
 def get_all_contests_owner_view(request: Request) -> Response:
-    contests = Contest.objects.filter(
-        participant__user_id=request.user.id,
-        participant__role=ParticipantRole.owner.value,
-        is_deleted=False,
-    ).distinct()
+    contests = list(
+        Contest.objects.filter(
+            participant__user_id=request.user.id,
+            participant__role=ParticipantRole.owner.value,
+            is_deleted=False,
+        )
+        .annotate(
+            application_count=count_by_contest(
+                Applications.objects.filter(is_deleted=False)
+            ),
+            jury_count=count_by_contest(
+                Participant.objects.filter(role=ParticipantRole.jury.value)
+            ),
+        )
+        .distinct()
+    )
 
-    serializer = ContestAllOwnerSerializer(instance=contests, many=True)
+    serializer = ContestAllOwnerSerializer(
+        instance=contests,
+        many=True,
+        context={
+            "avatar_thumbnails": get_image_derivatives_map(
+                urls=[contest.avatar for contest in contests]
+            )
+        },
+    )
 
     return Response(data=serializer.data, status=status.HTTP_200_OK)
 
@@ -465,13 +512,32 @@ def get_all_contests_owner_view(request: Request) -> Response:
 @api_view(http_method_names=["GET"])
 @permission_classes(permission_classes=[IsAuthenticated, IsNotBlockUserPermission])
 def get_all_contests_jury_view(request: Request) -> Response:
-    conntests = Contest.objects.filter(
-        participant__user_id=request.user.id,
-        participant__role=ParticipantRole.jury.value,
-        is_deleted=False,
+    conntests = list(
+        Contest.objects.filter(
+            participant__user_id=request.user.id,
+            participant__role=ParticipantRole.jury.value,
+            is_deleted=False,
+        ).annotate(
+            application_count=count_by_contest(
+                Applications.objects.filter(
+                    status=ApplicationStatus.accepted.value, is_deleted=False
+                )
+            )
+        )
     )
 
-    serializer = ContestAllJurySerializer(instance=conntests, many=True)
+    serializer = ContestAllJurySerializer(
+        instance=conntests,
+        many=True,
+        context={
+            "avatar_thumbnails": get_image_derivatives_map(
+                urls=[contest.avatar for contest in conntests]
+            ),
+            "current_stages": get_current_contest_stages(
+                contest_ids=[contest.id for contest in conntests]
+            ),
+        },
+    )
     return Response(data=serializer.data, status=status.HTTP_200_OK)
 
 
@@ -487,6 +553,7 @@ def delete_contest_view(request: Request) -> Response:
     contest = get_object_or_404(Contest, id=request.contest_id)
 
     contest.is_deleted = True
-    contest.save(update_fields=["is_deleted"])
+    contest.deleted_at = timezone.now()
+    contest.save(update_fields=["is_deleted", "deleted_at"])
 
     return Response(status=status.HTTP_204_NO_CONTENT)
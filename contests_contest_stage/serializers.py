@@ -1,11 +1,14 @@
+from drf_spectacular.utils import extend_schema_field
+from rest_framework.fields import SerializerMethodField
 from rest_framework.serializers import ModelSerializer
 
+from caching.reference import get_reference_row
 from contest_stage.serializers import ContestStageSerializer
 from contests_contest_stage.models import ContestsContestStage
 
 
 class ContestsContestStageSerializer(ModelSerializer[ContestsContestStage]):
-    stage = ContestStageSerializer()
+    stage = SerializerMethodField()
 
     class Meta:
         model = ContestsContestStage
@@ -14,3 +17,7 @@ class ContestsContestStageSerializer(ModelSerializer[ContestsContestStage]):
             "start_date",
             "end_date",
         ]
+
+    @extend_schema_field(ContestStageSerializer)
+    def get_stage(self, instance):
+        return get_reference_row(name="contest_stages", pk=instance.stage_id)
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.2 on 2026-10-19 13:03
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+import django.db.models.functions.text
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("criteria", "0002_alter_criteria_name_and_more"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name="criteria",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["name"], name="criteria_trgm_idx", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="criteria",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("name"), name="gin_trgm_ops"
+                ),
+                name="criteria_upper_trgm_idx",
+            ),
+        ),
+    ]
@@ -1,4 +1,6 @@
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Upper
 
 
 class Criteria(models.Model):
@@ -10,4 +12,13 @@ class Criteria(models.Model):
         db_table = "criteria"
         indexes = [
             models.Index(fields=["name"]),
+            GinIndex(
+                fields=["name"],
+                opclasses=["gin_trgm_ops"],
+                name="criteria_trgm_idx",
+            ),
+            GinIndex(
+                OpClass(Upper("name"), name="gin_trgm_ops"),
+                name="criteria_upper_trgm_idx",
+            ),
         ]
@@ -2,6 +2,7 @@ from django.urls import path
 
 from criteria.views import (
     add_or_remove_criteria_contest_view,
+    autocomplete_criteria_view,
     get_all_criteria_view,
     get_criteria_by_contest_view,
 )
@@ -13,6 +14,11 @@ urlpatterns = [
         name="change_criteria_contest_view",
     ),
     path(route="all", view=get_all_criteria_view, name="get_all_criteria_view"),
+    path(
+        route="autocomplete",
+        view=autocomplete_criteria_view,
+        name="autocomplete_criteria_view",
+    ),
     path(
         route="contest",
         view=get_criteria_by_contest_view,
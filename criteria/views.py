@@ -1,3 +1,5 @@
+from urllib.parse import urlencode
+
 from drf_spectacular.utils import OpenApiExample, extend_schema, OpenApiParameter
 from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
@@ -6,15 +8,19 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 
 from block_user.permissions import IsNotBlockUserPermission
+from caching.utils import cached
 from contest_criteria.models import ContestCriteria
 from contest_criteria.serializers import ContestCriteriaFullSerializer
 from contests.models import Contest
-from contests.serializers import ContestChangeCriteriaSerializer
+from contests.serializers import (
+    CatalogAutocompleteQuerySerializer,
+    ContestChangeCriteriaSerializer,
+)
+from contests.utils import autocomplete_catalog_names
 from criteria.models import Criteria
 from criteria.pagginator import CriteriaPaginator
 from criteria.serializers import CriteriaSerializer
 from participants.permissions import IsContestOwnerPermission
-from django.core.cache import cache
 
 
 @extend_schema(
@@ -129,30 +135,33 @@ def add_or_remove_criteria_contest_view(request: Request) -> Response:
     ]
 )
 def get_all_criteria_view(request: Request) -> Response:
-    cache_key = f"criteria_all_{request.query_params.get('search', 'all')}"
-    cached_data = cache.get(cache_key)
-    if cached_data:
-        return Response(data=cached_data, status=status.HTTP_200_OK)
-
-    queryset = Criteria.objects.only("name").all()
     search = request.query_params.get("search", None)
 
-    if search:
-        queryset = queryset.filter(name__icontains=search)
+    def load_page() -> dict:
+        queryset = Criteria.objects.only("name").all()
 
-    paginator = CriteriaPaginator()
-    paginated_queryset = paginator.paginate_queryset(queryset, request)
+        if search:
+            queryset = queryset.filter(name__icontains=search)
 
-    serializer = CriteriaSerializer(instance=paginated_queryset, many=True)
+        paginator = CriteriaPaginator()
+        paginated_queryset = paginator.paginate_queryset(queryset, request)
 
-    response_data = {
-        "data": serializer.data,
-        "message": f"All names by {search}" if search else "All nominations",
-    }
+        serializer = CriteriaSerializer(instance=paginated_queryset, many=True)
+        response_data = {
+            "data": serializer.data,
+            "message": f"All names by {search}" if search else "All nominations",
+        }
 
-    cache.set(cache_key, response_data, timeout=60 * 15)
+        return paginator.get_paginated_response(response_data).data
 
-    return paginator.get_paginated_response(response_data)
+    response_data = cached(
+        key=f"criteria_all_{urlencode(sorted(request.query_params.items()))}",
+        ttl=60 * 15,
+        loader=load_page,
+        namespace="criteria",
+    )
+
+    return Response(data=response_data, status=status.HTTP_200_OK)
 
 
 @extend_schema(
@@ -168,3 +177,77 @@ def get_criteria_by_contest_view(request: Request) -> Response:
 
     serializer = ContestCriteriaFullSerializer(instance=criteria_by_contest, many=True)
     return Response(data=serializer.data, status=status.HTTP_200_OK)
+
+
+@extend_schema(
+    summary="Подсказки критериев при вводе",
+    description=(
+        "Возвращает до `limit` критериев, подходящих под `q`: сначала совпадения по "
+        "началу названия, затем чаще используемые в конкурсах, затем похожие по "
+        "написанию. Без `q` возвращает самые используемые."
+    ),
+    parameters=[
+        OpenApiParameter(
+            name="q", type=str, location="query", description="Введённый текст"
+        ),
+        OpenApiParameter(
+            name="limit",
+            type=int,
+            location="query",
+            description="Количество подсказок (1-50, по умолчанию 10)",
+        ),
+    ],
+    responses={
+        200: {
+            "type": "object",
+            "properties": {
+                "data": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "id": {"type": "integer"},
+                            "name": {"type": "string"},
+                            "usage": {"type": "integer"},
+                        },
+                    },
+                }
+            },
+        }
+    },
+    examples=[
+        OpenApiExample(
+            name="Успешный ответ",
+            value={"data": [{"id": 1, "name": "Креативность", "usage": 12}]},
+            response_only=True,
+        )
+    ],
+)
+@api_view(http_method_names=["GET"])
+@permission_classes(
+    permission_classes=[
+        IsAuthenticated,
+        IsContestOwnerPermission,
+        IsNotBlockUserPermission,
+    ]
+)
+def autocomplete_criteria_view(request: Request) -> Response:
+    query_serializer = CatalogAutocompleteQuerySerializer(data=request.query_params)
+    query_serializer.is_valid(raise_exception=True)
+
+    query: str = " ".join(query_serializer.validated_data["q"].split())
+    limit: int = query_serializer.validated_data["limit"]
+
+    suggestions = cached(
+        key=f"autocomplete_{limit}_{query.casefold()}",
+        ttl=60 * 15,
+        loader=lambda: autocomplete_catalog_names(
+            queryset=Criteria.objects.all(),
+            usage_field="contestcriteria",
+            query=query,
+            limit=limit,
+        ),
+        namespace="criteria",
+    )
+
+    return Response(data={"data": suggestions}, status=status.HTTP_200_OK)
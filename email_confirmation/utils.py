@@ -0,0 +1,207 @@
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from functools import lru_cache
+from hmac import compare_digest
+
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+
+from config.settings import get_settings
+from email_confirmation.models import EmailConfirmationLogin
+
+settings = get_settings()
+
+
+@dataclass
+class LoginConfirmation:
+    """Попытка входа по коду из письма, независимая от способа хранения."""
+
+    id: str
+    user_id: int
+    session_id: str
+    code_hash: str
+    attempt_number: int
+    created_at: datetime
+    locked_until: datetime | None = None
+
+    def is_expired(self) -> bool:
+        return timezone.now() > self.created_at + timedelta(
+            seconds=settings.auth_settings.CODE_LIFETIME
+        )
+
+    def is_locked(self) -> bool:
+        return bool(self.locked_until and self.locked_until > timezone.now())
+
+
+class ConfirmationStore:
+    """
+    Хранилище попыток входа по коду. Во всех методах попытка ищется вместе
+    с session_id, поэтому чужой идентификатор попытки из другой сессии не
+    подойдёт.
+    """
+
+    def get(self, attempt_id: str, session_id: str) -> LoginConfirmation | None:
+        raise NotImplementedError
+
+    def create(
+        self, user_id: int, session_id: str, code_hash: str
+    ) -> LoginConfirmation:
+        raise NotImplementedError
+
+    def save(self, confirmation: LoginConfirmation) -> None:
+        raise NotImplementedError
+
+    def consume(
+        self, attempt_id: str, session_id: str, code_hash: str
+    ) -> LoginConfirmation | None:
+        """
+        Погашает код: возвращает попытку, только если код совпал и ещё не был
+        использован. Из двух одновременных запросов с одним кодом успешен
+        только один.
+        """
+        raise NotImplementedError
+
+
+class DatabaseConfirmationStore(ConfirmationStore):
+    """Попытки хранятся в таблице email_confirmation."""
+
+    @staticmethod
+    def to_confirmation(row: EmailConfirmationLogin) -> LoginConfirmation:
+        return LoginConfirmation(
+            id=str(row.id),
+            user_id=row.user_id,
+            session_id=row.session_id,
+            code_hash=row.code_hash,
+            attempt_number=row.attempt_number,
+            created_at=row.created_at,
+            locked_until=row.locked_until,
+        )
+
+    def get(self, attempt_id: str, session_id: str) -> LoginConfirmation | None:
+        row = EmailConfirmationLogin.objects.filter(
+            id=attempt_id, session_id=session_id, is_used=False
+        ).first()
+        return self.to_confirmation(row=row) if row else None
+
+    def create(
+        self, user_id: int, session_id: str, code_hash: str
+    ) -> LoginConfirmation:
+        row = EmailConfirmationLogin.objects.create(
+            user_id=user_id,
+            code_hash=code_hash,
+            session_id=session_id,
+            attempt_number=1,
+        )
+        return self.to_confirmation(row=row)
+
+    def save(self, confirmation: LoginConfirmation) -> None:
+        EmailConfirmationLogin.objects.filter(id=confirmation.id).update(
+            code_hash=confirmation.code_hash,
+            attempt_number=confirmation.attempt_number,
+            created_at=confirmation.created_at,
+            locked_until=confirmation.locked_until,
+        )
+
+    def consume(
+        self, attempt_id: str, session_id: str, code_hash: str
+    ) -> LoginConfirmation | None:
+        with transaction.atomic():
+            row = (
+                EmailConfirmationLogin.objects.select_for_update()
+                .filter(
+                    id=attempt_id,
+                    session_id=session_id,
+                    code_hash=code_hash,
+                    is_used=False,
+                )
+                .first()
+            )
+            if row is None:
+                return None
+
+            row.is_used = True
+            row.used_at = timezone.now()
+            row.save(update_fields=["is_used", "used_at"])
+
+        return self.to_confirmation(row=row)
+
+
+class CacheConfirmationStore(ConfirmationStore):
+    """
+    Попытки хранятся в кэше (Redis) под ключом сессии входа и удаляются по
+    истечении AUTH_CONFIRMATION_TTL секунд после последнего изменения.
+    Идентификатор попытки совпадает с session_id: на одну сессию входа
+    приходится одна попытка.
+    """
+
+    @staticmethod
+    def get_key(session_id: str) -> str:
+        return f"login_confirmation:{session_id}"
+
+    @staticmethod
+    def get_timeout(confirmation: LoginConfirmation) -> int:
+        timeout = settings.auth_settings.CONFIRMATION_TTL
+        if confirmation.locked_until:
+            lock_left = (confirmation.locked_until - timezone.now()).total_seconds()
+            timeout = max(timeout, int(lock_left) + 1)
+
+        return timeout
+
+    def get(self, attempt_id: str, session_id: str) -> LoginConfirmation | None:
+        if attempt_id != session_id:
+            return None
+
+        data = cache.get(key=self.get_key(session_id=session_id))
+        return LoginConfirmation(**data) if data else None
+
+    def create(
+        self, user_id: int, session_id: str, code_hash: str
+    ) -> LoginConfirmation:
+        confirmation = LoginConfirmation(
+            id=session_id,
+            user_id=user_id,
+            session_id=session_id,
+            code_hash=code_hash,
+            attempt_number=1,
+            created_at=timezone.now(),
+        )
+        self.save(confirmation=confirmation)
+        return confirmation
+
+    def save(self, confirmation: LoginConfirmation) -> None:
+        cache.set(
+            key=self.get_key(session_id=confirmation.session_id),
+            value=asdict(confirmation),
+            timeout=self.get_timeout(confirmation=confirmation),
+        )
+
+    def consume(
+        self, attempt_id: str, session_id: str, code_hash: str
+    ) -> LoginConfirmation | None:
+        confirmation = self.get(attempt_id=attempt_id, session_id=session_id)
+        if confirmation is None or not compare_digest(
+            confirmation.code_hash, code_hash
+        ):
+            return None
+
+        # delete() вернёт True только одному из одновременных запросов.
+        if not cache.delete(key=self.get_key(session_id=session_id)):
+            return None
+
+        return confirmation
+
+
+CONFIRMATION_STORES: dict[str, type[ConfirmationStore]] = {
+    "cache": CacheConfirmationStore,
+    "database": DatabaseConfirmationStore,
+}
+
+
+@lru_cache
+def get_confirmation_store() -> ConfirmationStore:
+    """
+    Возвращает хранилище попыток входа, выбранное в AUTH_CONFIRMATION_STORE
+    (cache или database).
+    """
+    return CONFIRMATION_STORES[settings.auth_settings.CONFIRMATION_STORE]()
@@ -0,0 +1,12 @@
+from enum import Enum
+
+
+class OutboxStatus(Enum):
+    pending = "PENDING"
+    sending = "SENDING"
+    sent = "SENT"
+    failed = "FAILED"
+
+    @classmethod
+    def choices(cls):
+        return [(item.value, item.name) for item in cls]
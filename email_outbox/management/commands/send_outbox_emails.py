@@ -0,0 +1,54 @@
+from time import sleep
+
+from django.core.management.base import BaseCommand
+
+from config.logger import logger
+from email_outbox.utils import OutboxSender, claim_outbox_batch
+
+
+class Command(BaseCommand):
+    help = (
+        "Отправляет письма из очереди email_outbox через одно переиспользуемое "
+        "SMTP-соединение с повторными попытками."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=50)
+        parser.add_argument("--poll-interval", type=float, default=1.0)
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Отправить накопившиеся письма и завершиться",
+        )
+
+    def handle(self, *args, **options):
+        batch_size: int = options["batch_size"]
+        poll_interval: float = options["poll_interval"]
+        once: bool = options["once"]
+
+        sender = OutboxSender()
+        total_sent, total_failed = 0, 0
+
+        try:
+            while True:
+                batch = claim_outbox_batch(batch_size=batch_size)
+
+                if not batch:
+                    # Простаивающее соединение SMTP-сервер всё равно закроет,
+                    # поэтому между порциями его лучше отпустить самим.
+                    sender.close()
+                    if once:
+                        break
+                    sleep(poll_interval)
+                    continue
+
+                sent, failed = sender.send_batch(batch=batch)
+                total_sent += sent
+                total_failed += failed
+                logger.info(f"Очередь писем: отправлено {sent}, с ошибкой {failed}")
+        except KeyboardInterrupt:
+            pass
+        finally:
+            sender.close()
+
+        self.stdout.write(f"Отправлено писем: {total_sent}, с ошибкой: {total_failed}")
@@ -0,0 +1,29 @@
+from django.db import models
+from django.utils import timezone
+
+from email_outbox.enums import OutboxStatus
+
+
+class EmailOutbox(models.Model):
+    subject = models.CharField(name="subject", max_length=255, null=False)
+    body = models.TextField(name="body", null=False)
+    content_subtype = models.CharField(
+        name="content_subtype", max_length=32, null=False, default="html"
+    )
+    from_email = models.CharField(name="from_email", max_length=255, null=False)
+    recipients = models.JSONField(name="recipients", null=False, default=list)
+    status = models.CharField(
+        name="status",
+        max_length=255,
+        choices=OutboxStatus.choices(),
+        default=OutboxStatus.pending.value,
+    )
+    attempts = models.PositiveIntegerField(name="attempts", null=False, default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(name="last_error", null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = "email_outbox"
+        indexes = [models.Index(fields=["status", "next_attempt_at"])]
@@ -0,0 +1,186 @@
+from datetime import timedelta
+from random import uniform
+from smtplib import SMTPException
+
+from django.core.mail import EmailMessage, get_connection
+from django.core.mail.backends.base import BaseEmailBackend
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from config.logger import logger
+from config.settings import get_settings
+from email_outbox.enums import OutboxStatus
+from email_outbox.models import EmailOutbox
+from monitoring.collector import track
+
+settings = get_settings()
+
+
+def enqueue_email(
+    subject: str,
+    body: str,
+    to: list[str],
+    content_subtype: str = "html",
+    from_email: str | None = None,
+) -> EmailOutbox:
+    """
+    Кладёт письмо в очередь отправки.
+
+    Запись создаётся в текущей транзакции, поэтому письмо уйдёт только если
+    транзакция будет зафиксирована. Отправкой занимается команда
+    send_outbox_emails.
+    """
+    return EmailOutbox.objects.create(
+        subject=subject,
+        body=body,
+        content_subtype=content_subtype,
+        from_email=from_email or settings.email_outbox_settings.FROM_EMAIL,
+        recipients=to,
+    )
+
+
+def get_retry_delay(attempts: int) -> timedelta:
+    delay = min(
+        settings.email_outbox_settings.BACKOFF_SECONDS * 2 ** max(attempts - 1, 0),
+        settings.email_outbox_settings.BACKOFF_MAX_SECONDS,
+    )
+    return timedelta(seconds=delay * uniform(0.8, 1.2))
+
+
+def claim_outbox_batch(batch_size: int) -> list[EmailOutbox]:
+    """
+    Забирает порцию писем, готовых к отправке, и помечает их как SENDING.
+
+    Строки блокируются через SKIP LOCKED, поэтому несколько воркеров не
+    получат одно и то же письмо. Вместо блокировки на время отправки письму
+    выдаётся аренда: если воркер упадёт, после LEASE_SECONDS письмо снова
+    станет доступным.
+    """
+    now = timezone.now()
+    lease_until = now + timedelta(seconds=settings.email_outbox_settings.LEASE_SECONDS)
+
+    with transaction.atomic():
+        outbox_ids = list(
+            EmailOutbox.objects.select_for_update(skip_locked=True)
+            .filter(
+                status__in=[OutboxStatus.pending.value, OutboxStatus.sending.value],
+                next_attempt_at__lte=now,
+            )
+            .order_by("next_attempt_at", "id")
+            .values_list("id", flat=True)[:batch_size]
+        )
+
+        if not outbox_ids:
+            return []
+
+        EmailOutbox.objects.filter(id__in=outbox_ids).update(
+            status=OutboxStatus.sending.value,
+            attempts=F("attempts") + 1,
+            next_attempt_at=lease_until,
+        )
+
+    return list(EmailOutbox.objects.filter(id__in=outbox_ids).order_by("id"))
+
+
+def build_outbox_message(
+    outbox: EmailOutbox, connection: BaseEmailBackend
+) -> EmailMessage:
+    message = EmailMessage(
+        subject=outbox.subject,
+        body=outbox.body,
+        from_email=outbox.from_email,
+        to=outbox.recipients,
+        connection=connection,
+    )
+    message.content_subtype = outbox.content_subtype
+    return message
+
+
+def mark_outbox_sent(outbox: EmailOutbox) -> None:
+    outbox.status = OutboxStatus.sent.value
+    outbox.sent_at = timezone.now()
+    outbox.last_error = None
+    outbox.save(update_fields=["status", "sent_at", "last_error"])
+
+
+def mark_outbox_failed(outbox: EmailOutbox, error: Exception) -> None:
+    outbox.last_error = f"{type(error).__name__}: {error}"
+
+    if outbox.attempts >= settings.email_outbox_settings.MAX_ATTEMPTS:
+        outbox.status = OutboxStatus.failed.value
+        logger.error(
+            f"Письмо {outbox.id} не отправлено после {outbox.attempts} попыток: "
+            f"{outbox.last_error}"
+        )
+    else:
+        outbox.status = OutboxStatus.pending.value
+        outbox.next_attempt_at = timezone.now() + get_retry_delay(outbox.attempts)
+        logger.warning(
+            f"Письмо {outbox.id} не отправлено (попытка {outbox.attempts}), "
+            f"повтор в {outbox.next_attempt_at:%H:%M:%S}: {outbox.last_error}"
+        )
+
+    outbox.save(update_fields=["status", "next_attempt_at", "last_error"])
+
+
+class OutboxSender:
+    """
+    Отправляет письма из очереди через одно SMTP-соединение.
+
+    Соединение открывается при первой отправке и переиспользуется для всех
+    последующих писем. При обрыве оно переоткрывается, а письмо отправляется
+    повторно один раз, прежде чем попытка будет засчитана как неудачная.
+    """
+
+    def __init__(self):
+        self.connection: BaseEmailBackend = get_connection(fail_silently=False)
+        self.is_open: bool = False
+
+    def open(self) -> None:
+        if not self.is_open:
+            self.connection.open()
+            self.is_open = True
+
+    def close(self) -> None:
+        if self.is_open:
+            try:
+                self.connection.close()
+            except Exception as e:
+                logger.warning(f"Ошибка при закрытии SMTP-соединения: {e}")
+            finally:
+                self.is_open = False
+
+    def send(self, outbox: EmailOutbox) -> None:
+        self.send_message(
+            message=build_outbox_message(outbox=outbox, connection=self.connection)
+        )
+
+    def send_message(self, message: EmailMessage) -> None:
+        message.connection = self.connection
+
+        with track("smtp"):
+            try:
+                self.open()
+                self.connection.send_messages([message])
+            except (SMTPException, OSError):
+                self.close()
+                self.open()
+                self.connection.send_messages([message])
+
+    def send_batch(self, batch: list[EmailOutbox]) -> tuple[int, int]:
+        sent, failed = 0, 0
+
+        for outbox in batch:
+            try:
+                self.send(outbox=outbox)
+            except Exception as e:
+                self.close()
+                mark_outbox_failed(outbox=outbox, error=e)
+                failed += 1
+                continue
+
+            mark_outbox_sent(outbox=outbox)
+            sent += 1
+
+        return sent, failed
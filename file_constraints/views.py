@@ -7,9 +7,9 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 
 from block_user.permissions import IsNotBlockUserPermission
+from caching.reference import get_reference_rows
 from contests.models import Contest
 from contests.serializers import FileConstraintChangeSerializer
-from file_constraints.models import FileConstraint
 from file_constraints.serailizers import FileConstraintSerializer
 from participants.permissions import IsContestOwnerPermission
 
@@ -21,7 +21,7 @@ from participants.permissions import IsContestOwnerPermission
 @api_view(http_method_names=["GET"])
 @permission_classes(permission_classes=[IsAuthenticated, IsNotBlockUserPermission])
 def get_all_file_constraints_view(request: Request) -> Response:
-    queryset = FileConstraint.objects.all()
+    queryset = get_reference_rows(name="file_constraints")
 
     serializer = FileConstraintSerializer(instance=queryset, many=True)
 
@@ -0,0 +1,27 @@
+from os import environ, makedirs, scandir, unlink
+
+# Каталог для метрик Prometheus должен быть задан до импорта
+# prometheus_client: воркеры наследуют окружение мастера и пишут значения
+# в файлы этого каталога, а /metrics суммирует их.
+environ.setdefault("PROMETHEUS_MULTIPROC_DIR", "/tmp/contest_backend_metrics")
+
+from prometheus_client import multiprocess  # noqa: E402
+
+wsgi_app = "contest_backend.wsgi:application"
+bind = environ.get("GUNICORN_BIND", "0.0.0.0:8000")
+workers = int(environ.get("GUNICORN_WORKERS", "4"))
+timeout = int(environ.get("GUNICORN_TIMEOUT", "60"))
+
+
+def on_starting(server):
+    """Удаляет файлы метрик предыдущего запуска: счётчики начинаются с нуля."""
+    metrics_dir = environ["PROMETHEUS_MULTIPROC_DIR"]
+    makedirs(metrics_dir, exist_ok=True)
+
+    for entry in scandir(metrics_dir):
+        if entry.is_file() and entry.name.endswith(".db"):
+            unlink(entry.path)
+
+
+def child_exit(server, worker):
+    multiprocess.mark_process_dead(worker.pid)
@@ -0,0 +1,70 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from config.settings import get_settings
+from maintenance.utils import get_retention_policies, purge_policy
+
+settings = get_settings()
+
+
+class Command(BaseCommand):
+    help = (
+        "Удаляет устаревшие данные (коды входа, сессии, токены, истёкшие "
+        "блокировки, письма очереди, мягко удалённые конкурсы и заявки, "
+        "журнал медленных запросов) "
+        "небольшими пачками. Можно запускать под нагрузкой."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--only",
+            nargs="+",
+            help="Политики для очистки (по умолчанию все)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.retention_settings.BATCH_SIZE,
+        )
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            default=settings.retention_settings.SLEEP_SECONDS,
+            help="Пауза между пачками, с",
+        )
+        parser.add_argument(
+            "--max-batches",
+            type=int,
+            default=0,
+            help="Не больше стольких пачек на политику (0 — без ограничения)",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Только посчитать строки, подлежащие удалению",
+        )
+
+    def handle(self, *args, **options):
+        policies = get_retention_policies()
+
+        names = options["only"] or list(policies)
+        unknown = set(names) - set(policies)
+        if unknown:
+            raise CommandError(
+                f"Неизвестные политики: {', '.join(sorted(unknown))}. "
+                f"Доступны: {', '.join(policies)}"
+            )
+
+        for name in names:
+            deleted = purge_policy(
+                policy=policies[name],
+                batch_size=options["batch_size"],
+                sleep_seconds=options["sleep"],
+                max_batches=options["max_batches"],
+                dry_run=options["dry_run"],
+            )
+
+            verb = "к удалению" if options["dry_run"] else "удалено"
+            details = ", ".join(
+                f"{label}: {count}" for label, count in sorted(deleted.items())
+            )
+            self.stdout.write(f"{name}: {verb} {details or 0}")
@@ -0,0 +1,170 @@
+from collections import Counter
+from datetime import timedelta
+from time import sleep
+from typing import Callable, NamedTuple
+
+from django.contrib.sessions.models import Session
+from django.db import OperationalError, connection, transaction
+from django.db.models import Q, QuerySet
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import OutstandingToken
+
+from applications.models import Applications
+from block_user.models import UserBlock
+from config.logger import logger
+from config.settings import get_settings
+from contests.models import Contest
+from email_confirmation.models import EmailConfirmationLogin
+from email_outbox.enums import OutboxStatus
+from email_outbox.models import EmailOutbox
+from monitoring.models import SlowQuery
+
+settings = get_settings()
+
+LOCK_RETRY_LIMIT: int = 3
+
+
+class RetentionPolicy(NamedTuple):
+    name: str
+    get_queryset: Callable[[], QuerySet]
+    # Строки с каскадом (конкурсы, заявки) удаляются меньшими пачками.
+    batch_divisor: int = 1
+
+
+def days_ago(days: int):
+    return timezone.now() - timedelta(days=days)
+
+
+def get_retention_policies() -> dict[str, RetentionPolicy]:
+    retention = settings.retention_settings
+
+    policies = [
+        RetentionPolicy(
+            name="email_confirmation",
+            get_queryset=lambda: EmailConfirmationLogin.objects.filter(
+                created_at__lt=days_ago(retention.CONFIRMATION_DAYS)
+            ),
+        ),
+        RetentionPolicy(
+            name="django_session",
+            get_queryset=lambda: Session.objects.filter(expire_date__lt=timezone.now()),
+        ),
+        RetentionPolicy(
+            name="token_blacklist",
+            # Вместе с токеном каскадом удаляется и его запись BlacklistedToken.
+            get_queryset=lambda: OutstandingToken.objects.filter(
+                expires_at__lt=timezone.now()
+            ),
+        ),
+        RetentionPolicy(
+            name="user_blocks",
+            get_queryset=lambda: UserBlock.objects.filter(
+                Q(blocked_until__lt=days_ago(retention.USER_BLOCK_DAYS))
+                | Q(
+                    is_blocked=False,
+                    updated_at__lt=days_ago(retention.USER_BLOCK_DAYS),
+                )
+            ),
+        ),
+        RetentionPolicy(
+            name="email_outbox",
+            get_queryset=lambda: EmailOutbox.objects.filter(
+                status__in=[OutboxStatus.sent.value, OutboxStatus.failed.value],
+                created_at__lt=days_ago(retention.EMAIL_OUTBOX_DAYS),
+            ),
+        ),
+        RetentionPolicy(
+            name="applications",
+            get_queryset=lambda: Applications.objects.filter(
+                is_deleted=True,
+                deleted_at__lt=days_ago(retention.SOFT_DELETED_DAYS),
+            ),
+            batch_divisor=10,
+        ),
+        RetentionPolicy(
+            name="contests",
+            get_queryset=lambda: Contest.objects.filter(
+                is_deleted=True,
+                deleted_at__lt=days_ago(retention.SOFT_DELETED_DAYS),
+            ),
+            batch_divisor=100,
+        ),
+        RetentionPolicy(
+            name="slow_queries",
+            get_queryset=lambda: SlowQuery.objects.filter(
+                created_at__lt=days_ago(retention.SLOW_QUERY_DAYS)
+            ),
+        ),
+    ]
+
+    return {policy.name: policy for policy in policies}
+
+
+def delete_batch(queryset: QuerySet, ids: list) -> Counter:
+    """
+    Удаляет пачку строк в отдельной короткой транзакции. В PostgreSQL
+    ожидание блокировки ограничено RETENTION_LOCK_TIMEOUT_MS, чтобы очистка
+    уступала рабочим запросам, а не выстраивала их в очередь за собой.
+    """
+    with transaction.atomic():
+        if connection.vendor == "postgresql":
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SET LOCAL lock_timeout = %s",
+                    [f"{settings.retention_settings.LOCK_TIMEOUT_MS}ms"],
+                )
+
+        _, deleted_by_model = queryset.filter(pk__in=ids).delete()
+
+    return Counter(deleted_by_model)
+
+
+def purge_policy(
+    policy: RetentionPolicy,
+    batch_size: int,
+    sleep_seconds: float,
+    max_batches: int = 0,
+    dry_run: bool = False,
+) -> Counter:
+    """
+    Удаляет строки политики пачками по возрастанию первичного ключа.
+
+    :return: количество удалённых строк по моделям (включая каскадные)
+    """
+    queryset = policy.get_queryset()
+
+    if dry_run:
+        return Counter({queryset.model._meta.label: queryset.count()})
+
+    batch_size = max(1, batch_size // policy.batch_divisor)
+    deleted = Counter()
+    last_pk = None
+    batches = 0
+    lock_failures = 0
+
+    while not max_batches or batches < max_batches:
+        batch_queryset = queryset.order_by("pk")
+        if last_pk is not None:
+            batch_queryset = batch_queryset.filter(pk__gt=last_pk)
+
+        ids = list(batch_queryset.values_list("pk", flat=True)[:batch_size])
+        if not ids:
+            break
+
+        try:
+            deleted += delete_batch(queryset=queryset, ids=ids)
+        except OperationalError as e:
+            lock_failures += 1
+            logger.warning(
+                f"Очистка {policy.name}: пачка {ids[0]}..{ids[-1]} не удалена: {e}"
+            )
+            if lock_failures >= LOCK_RETRY_LIMIT:
+                break
+            sleep(sleep_seconds * 10)
+            continue
+
+        last_pk = ids[-1]
+        batches += 1
+        sleep(sleep_seconds)
+
+    return deleted
@@ -0,0 +1,305 @@
+from datetime import date, timedelta
+from typing import TYPE_CHECKING, Any, Callable, NamedTuple
+
+from django.utils import timezone
+
+if TYPE_CHECKING:
+    from authentication.models import Users
+    from monitoring.factories import QueryBudgetDataset
+
+# Стадии конкурса, на которых доступны маршруты с CanSubmitApplicationPermission,
+# CanCheckWorksPermission и CanFinalizeResultsPermission.
+STAGE_APPLICATIONS: str = "Сбор заявок"
+STAGE_RATING: str = "Оценка работы"
+STAGE_RESULTS: str = "Подведение итогов"
+
+# Пароль администратора тестовых данных и новый пароль для регистрации и
+# смены пароля. Оба удовлетворяют правилам UserValidator.
+BUDGET_PASSWORD: str = "Bu1-dg2Et!q"
+BUDGET_NEW_PASSWORD: str = "Nw5-pa6Ss!z"
+
+# Строит параметры, тело или cookies запроса из тестовых данных.
+Payload = Callable[["QueryBudgetDataset"], dict[str, Any]]
+
+
+class ViewBudget(NamedTuple):
+    """
+    Бюджет SQL-запросов маршрута вместе с учётом аутентификации и проверок
+    прав, а также запрос, которым его проверяет check_query_budgets. Метод
+    запроса берётся из view. params, data и cookies вызываются перед каждым
+    запросом, поэтому могут создавать свежие токены.
+    """
+
+    max_queries: int
+    # Параметры строки запроса.
+    params: Payload | None = None
+    # Тело запроса в JSON: его читают и некоторые GET-маршруты.
+    data: Payload | None = None
+    # Cookies запроса, например refresh_token.
+    cookies: Payload | None = None
+    # Автор запроса; по умолчанию — администратор тестовых данных.
+    user: Callable[["QueryBudgetDataset"], "Users"] | None = None
+    # Стадия, которая должна идти у конкурса во время запроса.
+    stage: str = STAGE_APPLICATIONS
+    # Причина, по которой маршрут не проверяется (пусто — проверяется).
+    skip: str = ""
+
+
+def get_refresh_cookie(dataset: "QueryBudgetDataset") -> dict[str, Any]:
+    return {"refresh_token": dataset.admin.tokens["refresh"]}
+
+
+def get_contest_stage_list(dataset: "QueryBudgetDataset") -> dict[str, Any]:
+    # Стадии идут друг за другом, сбор заявок остаётся текущей стадией.
+    today = date.today()
+    return {
+        "contest_stage_list": [
+            {
+                "stage_id": stage.id,
+                "start_date": (today + timedelta(days=3 * index - 1)).isoformat(),
+                "end_date": (today + timedelta(days=3 * index + 1)).isoformat(),
+            }
+            for index, stage in enumerate(dataset.stages)
+        ]
+    }
+
+
+def get_criteria_list(dataset: "QueryBudgetDataset") -> dict[str, Any]:
+    # Один критерий меняется, один добавляется, остальные удаляются.
+    return {
+        "criteria_list": [
+            {
+                "name": dataset.criteria[0].name,
+                "description": "Новое описание",
+                "min_points": 0,
+                "max_points": 5,
+            },
+            {
+                "name": "Новый критерий бюджетов",
+                "description": "Описание",
+                "min_points": 0,
+                "max_points": 10,
+            },
+        ]
+    }
+
+
+def get_nomination_list(dataset: "QueryBudgetDataset") -> dict[str, Any]:
+    return {
+        "nomination_list": [
+            {"name": dataset.nominations[0].name, "description": "Новое описание"},
+            {"name": "Новая номинация бюджетов", "description": "Описание"},
+        ]
+    }
+
+
+# Каждый маршрут из contest_backend/urls.py должен быть здесь: для маршрута
+# без бюджета check_query_budgets завершается ошибкой. Эти же бюджеты
+# проверяет RequestMetricsMiddleware, если маршрут не переопределён
+# в MONITORING_VIEW_QUERY_BUDGETS.
+VIEW_BUDGETS: dict[str, ViewBudget] = {
+    "api/v1/auth/registration": ViewBudget(
+        max_queries=8,
+        data=lambda dataset: {
+            "first_name": "Новый",
+            "last_name": "Участник",
+            "email": "budget-new-user@example.com",
+            "birth_date": "2010-01-01",
+            "password": BUDGET_NEW_PASSWORD,
+        },
+    ),
+    "api/v1/auth/login": ViewBudget(
+        max_queries=8,
+        data=lambda dataset: {
+            "email": dataset.admin.email,
+            "password": BUDGET_PASSWORD,
+        },
+    ),
+    "api/v1/auth/logout": ViewBudget(max_queries=10, cookies=get_refresh_cookie),
+    "api/v1/auth/verify": ViewBudget(
+        max_queries=3,
+        data=lambda dataset: {"token": dataset.admin.tokens["access"]},
+    ),
+    "api/v1/auth/refresh": ViewBudget(max_queries=10, cookies=get_refresh_cookie),
+    "api/v1/auth/reset": ViewBudget(
+        max_queries=8,
+        data=lambda dataset: {
+            "current_password": BUDGET_PASSWORD,
+            "new_password": BUDGET_NEW_PASSWORD,
+        },
+    ),
+    "api/v1/auth/confirm_login": ViewBudget(
+        max_queries=10, skip="нужна сессия входа и код из письма"
+    ),
+    "api/v1/competencies/all": ViewBudget(max_queries=5),
+    "api/v1/users/user_info": ViewBudget(max_queries=8),
+    "api/v1/users/contest_data": ViewBudget(
+        max_queries=12,
+        data=lambda dataset: {
+            "competencies": [
+                dataset.competencies[0].name,
+                "Новая компетенция бюджетов",
+            ],
+            "education_or_work": "Школа",
+        },
+    ),
+    "api/v1/users/user_data": ViewBudget(
+        max_queries=8, data=lambda dataset: {"first_name": "Администратор"}
+    ),
+    "api/v1/users/all": ViewBudget(max_queries=8),
+    "api/v1/users/search": ViewBudget(
+        max_queries=8, params=lambda dataset: {"q": "Участник"}
+    ),
+    "api/v1/users/info": ViewBudget(max_queries=8),
+    "api/v1/users/info/competencies": ViewBudget(
+        max_queries=8, data=lambda dataset: {"email": dataset.users[0].email}
+    ),
+    "api/v1/applications/send": ViewBudget(
+        max_queries=16,
+        data=lambda dataset: {
+            "name": "Новая работа",
+            "annotation": "Аннотация",
+            "link_to_work": "https://example.com/work",
+            "nomination_id": dataset.nominations[0].id,
+            "contest_id": dataset.contest.id,
+        },
+        user=lambda dataset: dataset.applicant,
+    ),
+    "api/v1/applications/approve": ViewBudget(
+        max_queries=12,
+        data=lambda dataset: {"application_ids": [dataset.pending_application.id]},
+    ),
+    "api/v1/applications/reject": ViewBudget(
+        max_queries=12,
+        data=lambda dataset: {
+            "application_id": dataset.pending_application.id,
+            "rejection_reason": "Не соответствует требованиям",
+        },
+    ),
+    "api/v1/applications/rate": ViewBudget(
+        max_queries=16,
+        data=lambda dataset: {
+            "application_id": dataset.unrated_application.id,
+            "rates": [
+                {"criteria_id": criteria.id, "rate": 5} for criteria in dataset.criteria
+            ],
+        },
+        stage=STAGE_RATING,
+    ),
+    "api/v1/applications/rate/update": ViewBudget(
+        max_queries=14,
+        data=lambda dataset: {
+            "application_id": dataset.own_application.id,
+            "rates": [{"criteria_id": dataset.criteria[0].id, "rate": 7}],
+        },
+        stage=STAGE_RATING,
+    ),
+    "api/v1/applications/update": ViewBudget(
+        max_queries=12,
+        data=lambda dataset: {
+            "application_id": dataset.own_application.id,
+            "name": "Новое название",
+        },
+    ),
+    "api/v1/applications/delete": ViewBudget(
+        max_queries=8,
+        data=lambda dataset: {"application_id": dataset.own_application.id},
+    ),
+    "api/v1/applications/all/pending": ViewBudget(max_queries=10),
+    "api/v1/applications/all/accepted": ViewBudget(max_queries=12),
+    "api/v1/applications/all/rejected": ViewBudget(max_queries=10),
+    "api/v1/applications/": ViewBudget(
+        max_queries=10,
+        data=lambda dataset: {"application_id": dataset.application.id},
+    ),
+    "api/v1/applications/all/contest/rate": ViewBudget(
+        max_queries=12, stage=STAGE_RATING
+    ),
+    "api/v1/applications/all/user": ViewBudget(max_queries=8),
+    "api/v1/applications/all/rate": ViewBudget(max_queries=12, stage=STAGE_RATING),
+    "api/v1/applications/jury/stats": ViewBudget(max_queries=10, stage=STAGE_RATING),
+    "api/v1/applications/bundle": ViewBudget(max_queries=8),
+    "api/v1/contest_categories/": ViewBudget(max_queries=5),
+    "api/v1/contests/": ViewBudget(
+        max_queries=12,
+        data=lambda dataset: {
+            "title": "Новый конкурс",
+            "description": "Описание",
+            "organizer": "Организатор",
+            "contest_category_name": "Бюджеты запросов",
+            "age_category": [category.id for category in dataset.age_categories],
+        },
+    ),
+    "api/v1/contests/update": ViewBudget(
+        max_queries=10, data=lambda dataset: {"title": "Новое название"}
+    ),
+    "api/v1/contests/admin/publish": ViewBudget(max_queries=10),
+    "api/v1/contests/admin/reject": ViewBudget(max_queries=8),
+    "api/v1/contests/owner/delete": ViewBudget(max_queries=10),
+    "api/v1/contests/id": ViewBudget(max_queries=14),
+    "api/v1/contests/owner/id": ViewBudget(max_queries=16),
+    "api/v1/contests/all": ViewBudget(max_queries=6),
+    "api/v1/contests/all/all": ViewBudget(max_queries=6),
+    "api/v1/contests/all/owner": ViewBudget(max_queries=8),
+    "api/v1/contests/all/jury": ViewBudget(max_queries=8),
+    "api/v1/contests/admin/all/published": ViewBudget(max_queries=8),
+    "api/v1/criteria/change": ViewBudget(max_queries=16, data=get_criteria_list),
+    "api/v1/criteria/all": ViewBudget(max_queries=8),
+    "api/v1/criteria/autocomplete": ViewBudget(max_queries=8),
+    "api/v1/criteria/contest": ViewBudget(max_queries=8),
+    "api/v1/nomination/change": ViewBudget(max_queries=16, data=get_nomination_list),
+    "api/v1/nomination/all": ViewBudget(max_queries=8),
+    "api/v1/nomination/autocomplete": ViewBudget(max_queries=8),
+    "api/v1/contest_stage/change": ViewBudget(
+        max_queries=10, data=get_contest_stage_list
+    ),
+    "api/v1/contest_stage/all": ViewBudget(max_queries=5),
+    "api/v1/participants/change_jury": ViewBudget(
+        max_queries=12,
+        data=lambda dataset: {"jury_ids": [dataset.admin.id, dataset.applicant.id]},
+    ),
+    "api/v1/participants/change_org_committe": ViewBudget(
+        max_queries=12,
+        data=lambda dataset: {
+            "org_committee_ids": [dataset.admin.id, dataset.applicant.id]
+        },
+    ),
+    "api/v1/age_category/all": ViewBudget(max_queries=5),
+    "api/v1/news/latest": ViewBudget(max_queries=5, skip="обращается к VK API"),
+    "api/v1/storage/upload": ViewBudget(max_queries=10, skip="загружает файл в S3"),
+    "api/v1/storage/upload_contest_work": ViewBudget(
+        max_queries=12, skip="загружает файл в S3"
+    ),
+    "api/v1/file_constraints/change": ViewBudget(
+        max_queries=10,
+        data=lambda dataset: {
+            "file_constraint_ids": [
+                {"id": file_constraint.id}
+                for file_constraint in dataset.file_constraints[:2]
+            ]
+        },
+    ),
+    "api/v1/file_constraints/all": ViewBudget(max_queries=6),
+    "api/v1/winners/all": ViewBudget(max_queries=25, stage=STAGE_RESULTS),
+    "api/v1/admin/block_user": ViewBudget(
+        max_queries=12,
+        data=lambda dataset: {
+            "user_id": dataset.applicant.id,
+            "blocked_until": (timezone.now() + timedelta(days=7)).isoformat(),
+            "reason_blocked": "Проверка бюджетов запросов",
+        },
+    ),
+    "api/v1/admin/unblock_user": ViewBudget(
+        max_queries=10, data=lambda dataset: {"user_id": dataset.users[0].id}
+    ),
+    "api/v1/admin/all_blocked_user": ViewBudget(max_queries=8),
+    "api/v1/admin/all_users": ViewBudget(max_queries=8),
+    "api/v1/monitoring/profiles": ViewBudget(max_queries=8),
+    "api/v1/monitoring/profiles/download": ViewBudget(
+        max_queries=6, skip="отдаёт файл профиля с диска"
+    ),
+    "metrics": ViewBudget(max_queries=3),
+    "api/v1/schema/": ViewBudget(max_queries=3, skip="схема OpenAPI, без БД"),
+    "api/v1/docs/": ViewBudget(max_queries=3, skip="страница Swagger UI, без БД"),
+    "api/v1/redoc/": ViewBudget(max_queries=3, skip="страница ReDoc, без БД"),
+}
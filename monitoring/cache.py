@@ -0,0 +1,84 @@
+from time import perf_counter
+
+from django.core.cache.backends.redis import RedisCache
+
+from monitoring.collector import get_cache_namespace, record_cache_call
+from monitoring.tracing import SPAN_KIND_CLIENT, start_span
+
+MISSING = object()
+
+
+def cache_span(operation: str, key: str | None = None):
+    attributes = {"db.system": "redis", "db.operation": operation}
+    if key is not None:
+        attributes["cache.namespace"] = get_cache_namespace(key=key)
+
+    return start_span(f"redis.{operation}", kind=SPAN_KIND_CLIENT, **attributes)
+
+
+class InstrumentedRedisCache(RedisCache):
+    """
+    RedisCache, учитывающий обращения к кэшу в метриках текущего запроса:
+    попадания и промахи чтений и суммарное время всех операций. get_or_set,
+    has_key и другие методы BaseCache работают через get/add и учитываются
+    сами. В трассируемых запросах каждое обращение записывается спаном.
+    """
+
+    def get(self, key, default=None, version=None):
+        started_at = perf_counter()
+        with cache_span(operation="get", key=key) as span:
+            value = super().get(key, MISSING, version)
+            if span is not None:
+                span.attributes["cache.hit"] = value is not MISSING
+        record_cache_call(
+            duration=perf_counter() - started_at, hit=value is not MISSING, key=key
+        )
+        return default if value is MISSING else value
+
+    def get_many(self, keys, version=None):
+        keys = list(keys)
+        started_at = perf_counter()
+        with cache_span(operation="get_many"):
+            values = super().get_many(keys, version)
+        duration = perf_counter() - started_at
+
+        for key in keys:
+            record_cache_call(duration=0, hit=key in values, key=key)
+        record_cache_call(duration=duration)
+        return values
+
+    def set(self, key, value, timeout=MISSING, version=None):
+        started_at = perf_counter()
+        try:
+            with cache_span(operation="set", key=key):
+                if timeout is MISSING:
+                    return super().set(key, value, version=version)
+                return super().set(key, value, timeout, version)
+        finally:
+            record_cache_call(duration=perf_counter() - started_at)
+
+    def add(self, key, value, timeout=MISSING, version=None):
+        started_at = perf_counter()
+        try:
+            with cache_span(operation="add", key=key):
+                if timeout is MISSING:
+                    return super().add(key, value, version=version)
+                return super().add(key, value, timeout, version)
+        finally:
+            record_cache_call(duration=perf_counter() - started_at)
+
+    def delete(self, key, version=None):
+        started_at = perf_counter()
+        try:
+            with cache_span(operation="delete", key=key):
+                return super().delete(key, version)
+        finally:
+            record_cache_call(duration=perf_counter() - started_at)
+
+    def incr(self, key, delta=1, version=None):
+        started_at = perf_counter()
+        try:
+            with cache_span(operation="incr", key=key):
+                return super().incr(key, delta, version)
+        finally:
+            record_cache_call(duration=perf_counter() - started_at)
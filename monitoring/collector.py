@@ -0,0 +1,206 @@
+import re
+import sys
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from time import perf_counter
+from typing import Any, NamedTuple
+
+PROJECT_DIR = str(Path(__file__).resolve().parent.parent)
+MONITORING_DIR = str(Path(__file__).resolve().parent)
+
+QUERY_LITERALS = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+QUERY_PLACEHOLDER_LISTS = re.compile(r"\((?:\s*(?:%s|\?)\s*,)+\s*(?:%s|\?)\s*\)")
+QUERY_WHITESPACE = re.compile(r"\s+")
+
+# Пространства имён ключей кэша для метрик попаданий: первый подходящий
+# префикс ключа, остальные ключи попадают в other.
+CACHE_NAMESPACES: tuple[tuple[str, str], ...] = (
+    ("current_contest_stage_", "contest_stage"),
+    ("criteria:", "criteria"),
+    ("nominations:", "nominations"),
+    ("latest_vk_news", "news"),
+    ("vk_api_circuit_", "news"),
+    ("reference:", "reference"),
+    ("token_blacklist:", "token_blacklist"),
+    ("login_confirmation:", "login_confirmation"),
+    ("throttle_", "throttle"),
+    ("ns:", "namespace_version"),
+    ("lock:", "lock"),
+)
+
+
+class SlowQueryCandidate(NamedTuple):
+    sql: str
+    params: Any
+    alias: str
+    duration: float
+    call_site: str
+
+
+@dataclass
+class RequestMetrics:
+    """
+    Счётчики одного запроса к API: SQL, кэш, общее время, а также время
+    отрисовки ответа и внешних вызовов (S3, VK, SMTP) в timings.
+    """
+
+    # Отпечатки запросов и проверка бюджетов — только для выборки запросов.
+    detailed: bool = True
+    # Запросы не короче этого времени попадают в slow_queries (None — не искать).
+    slow_query_seconds: float | None = None
+    started_at: float = field(default_factory=perf_counter)
+    duration: float = 0.0
+    route: str = ""
+    query_count: int = 0
+    db_time: float = 0.0
+    query_fingerprints: Counter = field(default_factory=Counter)
+    cache_hits: int = 0
+    cache_misses: int = 0
+    cache_time: float = 0.0
+    cache_namespaces: Counter = field(default_factory=Counter)
+    timings: Counter = field(default_factory=Counter)
+    slow_queries: list[SlowQueryCandidate] = field(default_factory=list)
+
+    def finish(self, route: str) -> None:
+        self.duration = perf_counter() - self.started_at
+        self.route = route
+
+    def get_duplicate_queries(self) -> list[tuple[str, int]]:
+        """Запросы одного вида, выполненные больше одного раза (признак N+1)."""
+        return [
+            (fingerprint, count)
+            for fingerprint, count in self.query_fingerprints.most_common()
+            if count > 1
+        ]
+
+
+current_metrics: ContextVar[RequestMetrics | None] = ContextVar(
+    "current_metrics", default=None
+)
+
+
+def fingerprint_sql(sql: str) -> str:
+    """
+    Приводит SQL к виду без значений: запросы, различающиеся только
+    параметрами или длиной списка в IN (...), дают одинаковый отпечаток.
+
+    Пример:
+        >>> fingerprint_sql('SELECT * FROM "users" WHERE "id" IN (%s, %s, %s)')
+        'SELECT * FROM "users" WHERE "id" IN (...)'
+    """
+    sql = QUERY_LITERALS.sub("?", sql)
+    sql = QUERY_PLACEHOLDER_LISTS.sub("(...)", sql)
+    return QUERY_WHITESPACE.sub(" ", sql).strip()
+
+
+def get_cache_namespace(key: str) -> str:
+    for prefix, namespace in CACHE_NAMESPACES:
+        if key.startswith(prefix):
+            return namespace
+
+    return "other"
+
+
+def get_call_site() -> str:
+    """
+    Ближайшая к запросу строка кода проекта (view, сериализатор, утилита),
+    без кадров Django, библиотек и самого мониторинга.
+
+    Пример:
+        'contests/serializers.py:120 in get_stage'
+    """
+    frame = sys._getframe(1)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if (
+            filename.startswith(PROJECT_DIR)
+            and not filename.startswith(MONITORING_DIR)
+            and "site-packages" not in filename
+        ):
+            relative_name = filename[len(PROJECT_DIR) :].lstrip("/\\")
+            return f"{relative_name}:{frame.f_lineno} in {frame.f_code.co_name}"
+        frame = frame.f_back
+
+    return "unknown"
+
+
+def record_query(execute, sql, params, many, context):
+    """
+    Обёртка connection.execute_wrapper: считает запросы и время в БД и
+    запоминает медленные запросы вместе с местом вызова.
+    """
+    metrics = current_metrics.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+
+    started_at = perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        duration = perf_counter() - started_at
+        metrics.db_time += duration
+        metrics.query_count += 1
+        if metrics.detailed:
+            metrics.query_fingerprints[fingerprint_sql(sql=sql)] += 1
+
+        if (
+            metrics.slow_query_seconds is not None
+            and duration >= metrics.slow_query_seconds
+            and not many
+        ):
+            metrics.slow_queries.append(
+                SlowQueryCandidate(
+                    sql=sql,
+                    params=params,
+                    alias=context["connection"].alias,
+                    duration=duration,
+                    call_site=get_call_site(),
+                )
+            )
+
+
+def record_cache_call(
+    duration: float, hit: bool | None = None, key: str | None = None
+) -> None:
+    """Учитывает обращение к кэшу; hit=None — запись или удаление."""
+    metrics = current_metrics.get()
+    if metrics is None:
+        return
+
+    metrics.cache_time += duration
+    if hit is None:
+        return
+
+    if hit:
+        metrics.cache_hits += 1
+    else:
+        metrics.cache_misses += 1
+
+    if key is not None:
+        metrics.cache_namespaces[
+            (get_cache_namespace(key=key), "hit" if hit else "miss")
+        ] += 1
+
+
+@contextmanager
+def track(name: str):
+    """
+    Добавляет время выполнения блока к timings[name] текущего запроса.
+
+    Пример:
+        >>> with track("s3"):
+        ...     client.upload_file(file_path, bucket, file_key)
+    """
+    metrics = current_metrics.get()
+    if metrics is None:
+        yield
+        return
+
+    started_at = perf_counter()
+    try:
+        yield
+    finally:
+        metrics.timings[name] += perf_counter() - started_at
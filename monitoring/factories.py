@@ -0,0 +1,327 @@
+from dataclasses import dataclass
+from datetime import date, timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.utils import timezone
+
+from age_categories.models import AgeCategories
+from applications.enums import ApplicationStatus
+from applications.models import Applications
+from authentication.enums import UserRole
+from authentication.models import Users
+from block_user.models import UserBlock
+from competencies.models import Competencies
+from contest_categories.models import ContestCategories
+from contest_criteria.models import ContestCriteria
+from contest_file_constraints.models import ContestFileConstraints
+from contest_nominations.models import ContestNominations
+from contest_stage.models import ContestStage
+from contests.models import Contest
+from contests_contest_stage.models import ContestsContestStage
+from criteria.models import Criteria
+from file_constraints.models import FileConstraint
+from monitoring.budgets import (
+    BUDGET_PASSWORD,
+    STAGE_APPLICATIONS,
+    STAGE_RATING,
+    STAGE_RESULTS,
+)
+from monitoring.models import RequestProfile
+from nomination.models import Nominations
+from participants.enums import ParticipantRole
+from participants.models import Participant
+from work_rate.models import WorkRate
+
+CONTEST_STAGES: tuple[str, ...] = (STAGE_APPLICATIONS, STAGE_RATING, STAGE_RESULTS)
+
+
+@dataclass
+class QueryBudgetDataset:
+    """
+    Данные для check_query_budgets. Администратор системы одновременно
+    владелец, жюри, оргкомитет и участник основного конкурса, поэтому
+    проходит проверки прав всех маршрутов, кроме подачи заявки: её
+    отправляет applicant, который не участвует в конкурсах и не заблокирован.
+    Пользователи из users заблокированы.
+    """
+
+    scale: int
+    admin: Users
+    contest: Contest
+    users: list[Users]
+    applicant: Users
+    competencies: list[Competencies]
+    nominations: list[Nominations]
+    criteria: list[Criteria]
+    stages: list[ContestStage]
+    age_categories: list[AgeCategories]
+    file_constraints: list[FileConstraint]
+    # Принятая заявка пользователя users[0].
+    application: Applications
+    # Заявка на рассмотрении: её можно принять или отклонить.
+    pending_application: Applications
+    # Принятая заявка администратора с оценками по всем критериям.
+    own_application: Applications
+    # Принятая заявка без оценок.
+    unrated_application: Applications
+
+
+def create_users(scale: int) -> list[Users]:
+    password = make_password(None)
+    return Users.objects.bulk_create(
+        [
+            Users(
+                first_name=f"Участник{index}",
+                last_name=f"Бюджетов{index}",
+                email=f"budget-user-{index}@example.com",
+                birth_date=date(2010, 1, 1),
+                password=password,
+            )
+            for index in range(scale)
+        ]
+    )
+
+
+def set_current_stage(contest: Contest, stage_name: str) -> None:
+    """
+    Делает stage_name текущей стадией конкурса, остальные стадии
+    переносит в прошлое.
+    """
+    today = date.today()
+    for contest_stage in ContestsContestStage.objects.filter(
+        contest=contest
+    ).select_related("stage"):
+        if contest_stage.stage.name == stage_name:
+            contest_stage.start_date = today - timedelta(days=1)
+            contest_stage.end_date = today + timedelta(days=1)
+        else:
+            contest_stage.start_date = date(2000, 1, 1)
+            contest_stage.end_date = date(2000, 1, 2)
+        contest_stage.save(update_fields=["start_date", "end_date"])
+
+
+def create_contests(
+    admin: Users, scale: int, age_categories: list[AgeCategories]
+) -> list[Contest]:
+    category, _ = ContestCategories.objects.get_or_create(name="Бюджеты запросов")
+    contests = Contest.objects.bulk_create(
+        [
+            Contest(
+                title=f"Конкурс бюджетов {index}",
+                description="Конкурс для проверки бюджетов запросов",
+                link_to_rules="https://example.com/rules",
+                organizer="Организатор",
+                prizes="Призы",
+                contacts_for_participants="contest@example.com",
+                is_draft=False,
+                is_published=True,
+                contest_category=category,
+            )
+            for index in range(scale)
+        ]
+    )
+
+    stages = [
+        ContestStage.objects.get_or_create(name=name)[0] for name in CONTEST_STAGES
+    ]
+    ContestsContestStage.objects.bulk_create(
+        [
+            ContestsContestStage(
+                contest=contest,
+                stage=stage,
+                start_date=date(2000, 1, 1),
+                end_date=date(2000, 1, 2),
+            )
+            for contest in contests
+            for stage in stages
+        ]
+    )
+    Participant.objects.bulk_create(
+        [
+            Participant(user=admin, contest=contest, role=role.value)
+            for contest in contests
+            for role in (ParticipantRole.owner, ParticipantRole.jury)
+        ]
+    )
+
+    for contest in contests:
+        contest.age_category.set(age_categories)
+        set_current_stage(contest=contest, stage_name=STAGE_APPLICATIONS)
+
+    return contests
+
+
+def build_dataset(scale: int) -> QueryBudgetDataset:
+    """
+    Создаёт данные, объём которых растёт вместе со scale: пользователей,
+    конкурсы, номинации, критерии, заявки по каждому статусу, оценки,
+    блокировки и профили запросов.
+    """
+    admin = Users.objects.create(
+        first_name="Администратор",
+        last_name="Бюджетов",
+        email="budget-admin@example.com",
+        birth_date=date(1990, 1, 1),
+        password=make_password(BUDGET_PASSWORD),
+        user_role=UserRole.admin.value,
+    )
+    users = create_users(scale=scale)
+    applicant = Users.objects.create(
+        first_name="Заявитель",
+        last_name="Бюджетов",
+        email="budget-applicant@example.com",
+        birth_date=date(2010, 1, 1),
+        password=make_password(None),
+    )
+
+    competencies = [
+        Competencies.objects.get_or_create(name=f"Компетенция бюджетов {index}")[0]
+        for index in range(scale)
+    ]
+    for user in [admin, *users]:
+        user.competencies.set(competencies)
+
+    age_categories = list(AgeCategories.objects.all())
+    contests = create_contests(admin=admin, scale=scale, age_categories=age_categories)
+    contest = contests[0]
+    stages = [ContestStage.objects.get(name=name) for name in CONTEST_STAGES]
+
+    Participant.objects.bulk_create(
+        [
+            Participant(user=admin, contest=contest, role=role.value)
+            for role in (ParticipantRole.org_committee, ParticipantRole.member)
+        ]
+        + [
+            Participant(user=user, contest=contest, role=role.value)
+            for user in users
+            for role in (ParticipantRole.member, ParticipantRole.jury)
+        ]
+    )
+    jury = Participant.objects.get(
+        user=admin, contest=contest, role=ParticipantRole.jury.value
+    )
+
+    nominations = Nominations.objects.bulk_create(
+        [Nominations(name=f"Номинация бюджетов {index}") for index in range(scale)]
+    )
+    ContestNominations.objects.bulk_create(
+        [
+            ContestNominations(
+                contest=contest, nomination=nomination, description="Описание"
+            )
+            for nomination in nominations
+        ]
+    )
+
+    criteria = Criteria.objects.bulk_create(
+        [Criteria(name=f"Критерий бюджетов {index}") for index in range(scale)]
+    )
+    ContestCriteria.objects.bulk_create(
+        [
+            ContestCriteria(
+                contest=contest,
+                criteria=item,
+                description="Описание",
+                min_points=0,
+                max_points=10,
+            )
+            for item in criteria
+        ]
+    )
+
+    file_constraints = list(FileConstraint.objects.all())
+    ContestFileConstraints.objects.bulk_create(
+        [
+            ContestFileConstraints(contest=contest, file_constraints=file_constraint)
+            for file_constraint in file_constraints
+        ]
+    )
+
+    authors = [(user, status) for user in users for status in ApplicationStatus] + [
+        (admin, ApplicationStatus.accepted) for _ in range(scale)
+    ]
+    applications = Applications.objects.bulk_create(
+        [
+            Applications(
+                name=f"Работа бюджетов {index}",
+                annotation="Аннотация",
+                link_to_work="https://example.com/work",
+                status=status.value,
+                age_category=age_categories[index % len(age_categories)].name,
+                nomination=nominations[index % len(nominations)],
+                contest=contest,
+                user=author,
+            )
+            for index, (author, status) in enumerate(authors)
+        ]
+    )
+    # Заявка без оценок подана в другой конкурс: подведение итогов основного
+    # конкурса ожидает оценки у каждой принятой заявки.
+    unrated_application = Applications.objects.create(
+        name="Работа бюджетов без оценок",
+        annotation="Аннотация",
+        link_to_work="https://example.com/work",
+        status=ApplicationStatus.accepted.value,
+        age_category=age_categories[0].name,
+        nomination=nominations[0],
+        contest=contests[-1],
+        user=users[0],
+    )
+
+    # Оценки у всех заявок конкурса: подведение итогов суммирует баллы
+    # каждой заявки.
+    WorkRate.objects.bulk_create(
+        [
+            WorkRate(criteria=item, application=application, rate=5, jury=jury)
+            for application in applications
+            for item in criteria
+        ]
+    )
+
+    UserBlock.objects.bulk_create(
+        [
+            UserBlock(
+                user=user,
+                blocked_by=admin,
+                blocked_until=timezone.now() + timedelta(days=1),
+            )
+            for user in users
+        ]
+    )
+
+    RequestProfile.objects.bulk_create(
+        [
+            RequestProfile(
+                user=admin,
+                method="GET",
+                path="/api/v1/contests/all",
+                route="api/v1/contests/all",
+                status_code=200,
+                duration_ms=100.0,
+                file_name=f"budget-{index}.pstats",
+            )
+            for index in range(scale)
+        ]
+    )
+
+    return QueryBudgetDataset(
+        scale=scale,
+        admin=admin,
+        contest=contest,
+        users=users,
+        applicant=applicant,
+        competencies=competencies,
+        nominations=nominations,
+        criteria=criteria,
+        stages=stages,
+        age_categories=age_categories,
+        file_constraints=file_constraints,
+        application=applications[0],
+        pending_application=next(
+            application
+            for application in applications
+            if application.status == ApplicationStatus.pending.value
+        ),
+        own_application=applications[-1],
+        unrated_application=unrated_application,
+    )
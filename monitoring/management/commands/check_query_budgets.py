@@ -0,0 +1,302 @@
+import json
+from collections import Counter
+from typing import NamedTuple
+from urllib.parse import urlencode
+
+from django.conf import settings as django_settings
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test.utils import (
+    CaptureQueriesContext,
+    override_settings,
+    setup_databases,
+    setup_test_environment,
+    teardown_databases,
+    teardown_test_environment,
+)
+from django.urls import URLPattern, URLResolver, get_resolver
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from caching.reference import drop_local
+from monitoring.budgets import VIEW_BUDGETS, ViewBudget
+from monitoring.collector import fingerprint_sql
+from monitoring.factories import QueryBudgetDataset, build_dataset, set_current_stage
+
+TEST_CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "check-query-budgets",
+    }
+}
+
+
+class Measurement(NamedTuple):
+    status_code: int
+    query_count: int
+    duplicates: list[tuple[str, int]]
+
+
+class RouteMeasurement(NamedTuple):
+    # Первый вызов на пустом кэше и повторный — на заполненном.
+    cold: Measurement
+    warm: Measurement
+
+
+def walk_patterns(patterns, prefix: str = ""):
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            yield from walk_patterns(
+                pattern.url_patterns, prefix + str(pattern.pattern)
+            )
+        elif isinstance(pattern, URLPattern):
+            yield prefix + str(pattern.pattern), pattern.callback
+
+
+def get_view_method(callback) -> str:
+    """
+    Метод, на который отвечает view. У view DRF это первый метод из
+    http_method_names, реализованный классом; обычные view Django
+    считаются доступными по GET.
+    """
+    view_class = getattr(callback, "cls", None)
+    if view_class is None:
+        return "GET"
+
+    for method in view_class.http_method_names:
+        if method not in ("head", "options") and hasattr(view_class, method):
+            return method.upper()
+
+    return "GET"
+
+
+def get_routes() -> dict[str, str]:
+    """
+    Маршруты contest_backend/urls.py без админки Django и их методы.
+    """
+    return {
+        route: get_view_method(callback=callback)
+        for route, callback in walk_patterns(get_resolver().url_patterns)
+        if not route.startswith("admin/")
+    }
+
+
+def get_duplicates(queries: list[dict]) -> list[tuple[str, int]]:
+    fingerprints = Counter(fingerprint_sql(sql=query["sql"]) for query in queries)
+    return [
+        (fingerprint, count)
+        for fingerprint, count in fingerprints.most_common()
+        if count > 1
+    ]
+
+
+class Command(BaseCommand):
+    help = (
+        "Вызывает каждый маршрут API на тестовой базе при двух объёмах данных, "
+        "на пустом и на заполненном кэше, и проверяет, что число SQL-запросов "
+        "не растёт вместе с числом строк, а первый вызов укладывается в бюджет "
+        "из monitoring/budgets.py. Изменения, сделанные view, откатываются."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--scales",
+            type=int,
+            nargs=2,
+            default=[2, 10],
+            metavar=("SMALL", "LARGE"),
+            help="Объёмы данных: число пользователей, конкурсов, номинаций и т. д.",
+        )
+        parser.add_argument("--route", help="Только маршруты с этим префиксом")
+        parser.add_argument(
+            "--keepdb",
+            action="store_true",
+            help="Не пересоздавать тестовую базу между запусками",
+        )
+
+    def handle(self, *args, **options):
+        small_scale, large_scale = options["scales"]
+        # Заявка без оценок подаётся во второй конкурс, поэтому конкурсов
+        # должно быть хотя бы два.
+        if not 1 < small_scale < large_scale:
+            raise CommandError("--scales: ожидаются два числа, 1 < SMALL < LARGE")
+
+        routes = get_routes()
+        missing = [route for route in routes if route not in VIEW_BUDGETS]
+        if missing:
+            raise CommandError(
+                "Нет бюджета в monitoring/budgets.py для маршрутов: "
+                + ", ".join(missing)
+            )
+
+        routes = {
+            route: method
+            for route, method in routes.items()
+            if not VIEW_BUDGETS[route].skip
+            and (not options["route"] or route.startswith(options["route"]))
+        }
+
+        middleware = [
+            name
+            for name in django_settings.MIDDLEWARE
+            if not name.startswith("monitoring.")
+        ]
+
+        # Middleware мониторинга отключены: считаются только запросы самих view.
+        with override_settings(CACHES=TEST_CACHES, MIDDLEWARE=middleware):
+            setup_test_environment()
+            old_config = setup_databases(
+                verbosity=0, interactive=False, keepdb=options["keepdb"]
+            )
+            try:
+                small = self.measure_scale(scale=small_scale, routes=routes)
+                large = self.measure_scale(scale=large_scale, routes=routes)
+            finally:
+                teardown_databases(
+                    old_config=old_config, verbosity=0, keepdb=options["keepdb"]
+                )
+                teardown_test_environment()
+
+        failures = 0
+        for route, method in routes.items():
+            problems = self.check_route(
+                budget=VIEW_BUDGETS[route], small=small[route], large=large[route]
+            )
+            if problems:
+                failures += 1
+                self.report(
+                    route=f"{method} {route}", problems=problems, large=large[route]
+                )
+            elif options["verbosity"] > 1:
+                self.stdout.write(
+                    f"{method} {route}: "
+                    f"пустой кэш {small[route].cold.query_count} -> "
+                    f"{large[route].cold.query_count} из "
+                    f"{VIEW_BUDGETS[route].max_queries}, "
+                    f"заполненный {small[route].warm.query_count} -> "
+                    f"{large[route].warm.query_count}"
+                )
+
+        self.stdout.write(
+            f"Проверено маршрутов: {len(routes)}, с нарушениями: {failures} "
+            f"(объёмы данных {small_scale} и {large_scale})"
+        )
+        if failures:
+            raise CommandError("Бюджеты SQL-запросов превышены")
+
+    def measure_scale(
+        self, scale: int, routes: dict[str, str]
+    ) -> dict[str, RouteMeasurement]:
+        results = {}
+
+        with transaction.atomic():
+            dataset = build_dataset(scale=scale)
+
+            for route, method in routes.items():
+                results[route] = self.measure_route(
+                    route=route,
+                    method=method,
+                    budget=VIEW_BUDGETS[route],
+                    dataset=dataset,
+                )
+
+            transaction.set_rollback(True)
+
+        return results
+
+    def measure_route(
+        self, route: str, method: str, budget: ViewBudget, dataset: QueryBudgetDataset
+    ) -> RouteMeasurement:
+        # Каждый маршрут видит одни и те же данные: изменения, сделанные
+        # view (например, пересчёт победителей), откатываются.
+        with transaction.atomic():
+            set_current_stage(contest=dataset.contest, stage_name=budget.stage)
+            cache.clear()
+            drop_local()
+
+            cold = self.measure_call(
+                route=route, method=method, budget=budget, dataset=dataset
+            )
+            warm = self.measure_call(
+                route=route, method=method, budget=budget, dataset=dataset
+            )
+
+            transaction.set_rollback(True)
+
+        return RouteMeasurement(cold=cold, warm=warm)
+
+    @staticmethod
+    def measure_call(
+        route: str, method: str, budget: ViewBudget, dataset: QueryBudgetDataset
+    ) -> Measurement:
+        """
+        Один вызов маршрута в собственной точке сохранения: повторный вызов
+        пишущего маршрута видит базу в том же состоянии, что и первый, а
+        кэш — заполненным первым вызовом.
+        """
+        with transaction.atomic():
+            # Токены и тело запроса создаются до начала подсчёта запросов.
+            user = budget.user(dataset) if budget.user else dataset.admin
+            client = APIClient(raise_request_exception=False)
+            client.credentials(
+                HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(user)}",
+                HTTP_X_CONTEST_ID=str(dataset.contest.id),
+            )
+            if budget.cookies:
+                for key, value in budget.cookies(dataset).items():
+                    client.cookies[key] = value
+
+            path = f"/{route}"
+            if budget.params:
+                path = f"{path}?{urlencode(budget.params(dataset))}"
+            data = json.dumps(budget.data(dataset)) if budget.data else ""
+
+            with CaptureQueriesContext(connection) as context:
+                response = client.generic(
+                    method, path, data=data, content_type="application/json"
+                )
+
+            transaction.set_rollback(True)
+
+        return Measurement(
+            status_code=response.status_code,
+            query_count=len(context.captured_queries),
+            duplicates=get_duplicates(queries=context.captured_queries),
+        )
+
+    @staticmethod
+    def check_route(
+        budget: ViewBudget, small: RouteMeasurement, large: RouteMeasurement
+    ) -> list[str]:
+        problems = []
+
+        for measurement in (small.cold, small.warm, large.cold, large.warm):
+            if measurement.status_code >= 400:
+                problems.append(f"ответ {measurement.status_code}")
+                return problems
+
+        for cache_state, small_call, large_call in (
+            ("пустой кэш", small.cold, large.cold),
+            ("заполненный кэш", small.warm, large.warm),
+        ):
+            if large_call.query_count > small_call.query_count:
+                problems.append(
+                    f"{cache_state}: число запросов растёт с объёмом данных: "
+                    f"{small_call.query_count} -> {large_call.query_count}"
+                )
+
+        # Бюджет задан для первого вызова: так view работает после
+        # инвалидации или истечения кэша.
+        if large.cold.query_count > budget.max_queries:
+            problems.append(
+                f"пустой кэш: запросов {large.cold.query_count} > "
+                f"{budget.max_queries}"
+            )
+
+        return problems
+
+    def report(self, route: str, problems: list[str], large: RouteMeasurement) -> None:
+        self.stdout.write(self.style.ERROR(f"{route}: {'; '.join(problems)}"))
+        for fingerprint, count in large.cold.duplicates[:5]:
+            self.stdout.write(f"   {count} раз: {fingerprint[:300]}")
@@ -0,0 +1,66 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db.models import Avg, Count, Max, Sum
+from django.utils import timezone
+
+from monitoring.models import SlowQuery
+
+
+class Command(BaseCommand):
+    help = (
+        "Сводка журнала медленных запросов: запросы одного вида, отсортированные "
+        "по суммарному времени, с местом вызова и последним планом выполнения."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days", type=int, default=7, help="За сколько последних дней"
+        )
+        parser.add_argument("--limit", type=int, default=20)
+        parser.add_argument("--route", help="Только маршруты с этим префиксом")
+        parser.add_argument(
+            "--explain",
+            action="store_true",
+            help="Печатать последний сохранённый план выполнения",
+        )
+
+    def handle(self, *args, **options):
+        queryset = SlowQuery.objects.filter(
+            created_at__gte=timezone.now() - timedelta(days=options["days"])
+        )
+        if options["route"]:
+            queryset = queryset.filter(route__startswith=options["route"])
+
+        offenders = list(
+            queryset.values("fingerprint_hash")
+            .annotate(
+                count=Count("id"),
+                total_ms=Sum("duration_ms"),
+                avg_ms=Avg("duration_ms"),
+                max_ms=Max("duration_ms"),
+            )
+            .order_by("-total_ms")[: options["limit"]]
+        )
+        if not offenders:
+            self.stdout.write("Медленных запросов не найдено")
+            return
+
+        latest = {}
+        for row in queryset.filter(
+            fingerprint_hash__in=[item["fingerprint_hash"] for item in offenders]
+        ).order_by("-created_at"):
+            latest.setdefault(row.fingerprint_hash, row)
+            if row.explain and not latest[row.fingerprint_hash].explain:
+                latest[row.fingerprint_hash].explain = row.explain
+
+        for position, item in enumerate(offenders, start=1):
+            row = latest[item["fingerprint_hash"]]
+            self.stdout.write(
+                f"{position}. {item['count']} раз, всего {item['total_ms']:.0f} мс, "
+                f"в среднем {item['avg_ms']:.0f} мс, максимум {item['max_ms']:.0f} мс\n"
+                f"   {row.route} — {row.call_site}\n"
+                f"   {row.fingerprint[:500]}"
+            )
+            if options["explain"] and row.explain:
+                self.stdout.write(f"{row.explain}\n")
@@ -0,0 +1,138 @@
+from os import environ
+
+from django.db.models import Count
+from prometheus_client import (
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    generate_latest,
+)
+from prometheus_client.core import GaugeMetricFamily
+from prometheus_client.multiprocess import MultiProcessCollector
+
+from config.logger import logger
+from email_outbox.enums import OutboxStatus
+from email_outbox.models import EmailOutbox
+from monitoring.collector import RequestMetrics
+
+# Метрики процесса. Под gunicorn с PROMETHEUS_MULTIPROC_DIR (см.
+# gunicorn.conf.py) каждый воркер пишет значения в файлы этого каталога,
+# а /metrics суммирует их по всем воркерам.
+REQUEST_LATENCY = Histogram(
+    name="http_request_duration_seconds",
+    documentation="Время ответа API",
+    labelnames=("method", "route"),
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+REQUESTS = Counter(
+    name="http_requests",
+    documentation="Ответы API по кодам статуса",
+    labelnames=("method", "route", "status"),
+)
+DB_QUERIES = Counter(
+    name="db_queries",
+    documentation="SQL-запросы, выполненные при обработке запросов API",
+    labelnames=("route",),
+)
+DB_QUERY_SECONDS = Counter(
+    name="db_query_seconds",
+    documentation="Время SQL-запросов при обработке запросов API",
+    labelnames=("route",),
+)
+CACHE_REQUESTS = Counter(
+    name="cache_requests",
+    documentation="Чтения кэша по пространствам имён (result: hit или miss)",
+    labelnames=("namespace", "result"),
+)
+S3_UPLOAD_BYTES = Counter(
+    name="s3_upload_bytes",
+    documentation="Объём файлов, загруженных в S3",
+    labelnames=("kind",),
+)
+S3_UPLOAD_DURATION = Histogram(
+    name="s3_upload_duration_seconds",
+    documentation="Время загрузки файла в S3",
+    labelnames=("kind",),
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60),
+)
+
+
+class EmailOutboxCollector:
+    """
+    Глубина очереди писем по статусам. Считается запросом к БД в момент
+    выгрузки метрик, поэтому не зависит от того, какой воркер её отдаёт.
+    """
+
+    def collect(self):
+        depth = GaugeMetricFamily(
+            name="email_outbox_depth",
+            documentation="Письма в очереди по статусам",
+            labels=("status",),
+        )
+
+        try:
+            counts = dict(
+                EmailOutbox.objects.filter(
+                    status__in=[
+                        OutboxStatus.pending.value,
+                        OutboxStatus.sending.value,
+                        OutboxStatus.failed.value,
+                    ]
+                )
+                .values_list("status")
+                .annotate(count=Count("id"))
+            )
+        except Exception as e:
+            logger.warning(f"Не удалось посчитать очередь писем для метрик: {e}")
+            return
+
+        for status in (OutboxStatus.pending, OutboxStatus.sending, OutboxStatus.failed):
+            depth.add_metric(labels=(status.value,), value=counts.get(status.value, 0))
+
+        yield depth
+
+
+def get_route_label(request) -> str:
+    resolver_match = getattr(request, "resolver_match", None)
+    if resolver_match is None:
+        # Адреса без маршрута не попадают в метки по отдельности, иначе
+        # сканеры порождали бы неограниченное число рядов.
+        return "unmatched"
+
+    return resolver_match.route
+
+
+def observe_request(request, response, metrics: RequestMetrics) -> None:
+    route = get_route_label(request=request)
+
+    REQUEST_LATENCY.labels(method=request.method, route=route).observe(metrics.duration)
+    REQUESTS.labels(
+        method=request.method, route=route, status=str(response.status_code)
+    ).inc()
+    DB_QUERIES.labels(route=route).inc(metrics.query_count)
+    DB_QUERY_SECONDS.labels(route=route).inc(metrics.db_time)
+
+    for (namespace, result), count in metrics.cache_namespaces.items():
+        CACHE_REQUESTS.labels(namespace=namespace, result=result).inc(count)
+
+
+def observe_s3_upload(kind: str, size: int, duration: float) -> None:
+    S3_UPLOAD_BYTES.labels(kind=kind).inc(size)
+    S3_UPLOAD_DURATION.labels(kind=kind).observe(duration)
+
+
+def get_metrics_registry() -> CollectorRegistry:
+    registry = CollectorRegistry()
+
+    if environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        MultiProcessCollector(registry)
+    else:
+        registry.register(REGISTRY)
+
+    registry.register(EmailOutboxCollector())
+    return registry
+
+
+def render_metrics() -> bytes:
+    return generate_latest(registry=get_metrics_registry())
@@ -0,0 +1,181 @@
+from cProfile import Profile
+from contextlib import ExitStack
+from random import random
+from time import perf_counter
+
+from django.db import connections
+
+from config.logger import logger
+from config.settings import get_settings
+from monitoring.collector import RequestMetrics, current_metrics, record_query
+from monitoring.metrics import get_route_label, observe_request
+from monitoring.profiling import (
+    get_profiling_user,
+    is_profiling_requested,
+    save_profile,
+)
+from monitoring.tracing import (
+    SPAN_KIND_SERVER,
+    current_trace,
+    exporter,
+    start_span,
+    start_trace,
+    trace_query,
+)
+from monitoring.utils import (
+    build_server_timing,
+    can_view_server_timing,
+    check_budgets,
+    format_metrics,
+    is_server_timing_requested,
+    save_slow_queries,
+)
+
+settings = get_settings()
+
+
+class RequestMetricsMiddleware:
+    """
+    Считает число и время SQL-запросов, обращения к кэшу и общее время
+    ответа и передаёт их в метрики Prometheus. Для доли
+    MONITORING_SAMPLE_RATE запросов дополнительно собираются отпечатки
+    повторяющихся запросов и проверяются бюджеты: при превышении в лог
+    пишется предупреждение. Запросы к БД дольше MONITORING_SLOW_QUERY_MS
+    на горячих маршрутах сохраняются в slow_query.
+
+    Запросы с заголовком X-Server-Timing измеряются всегда, а в ответ
+    добавляется заголовок Server-Timing, если он разрешён пользователю.
+    """
+
+    def __init__(self, response):
+        self.response = response
+
+    def __call__(self, request):
+        monitoring = settings.monitoring_settings
+        server_timing_requested = is_server_timing_requested(request=request)
+        if not monitoring.ENABLED:
+            return self.response(request)
+
+        metrics = RequestMetrics(
+            detailed=server_timing_requested or random() < monitoring.SAMPLE_RATE,
+            slow_query_seconds=monitoring.SLOW_QUERY_MS / 1000,
+        )
+        token = current_metrics.set(metrics)
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(record_query))
+                response = self.response(request)
+        finally:
+            current_metrics.reset(token)
+
+        metrics.finish(route=get_route_label(request=request))
+        observe_request(request=request, response=response, metrics=metrics)
+        save_slow_queries(metrics=metrics)
+
+        violations = check_budgets(metrics=metrics) if metrics.detailed else []
+        if violations:
+            logger.warning(
+                f"{request.method} {metrics.route}: превышен бюджет "
+                f"({'; '.join(violations)}). {format_metrics(metrics=metrics)}"
+            )
+
+        if server_timing_requested and can_view_server_timing(request=request):
+            response["Server-Timing"] = build_server_timing(metrics=metrics)
+
+        return response
+
+
+class ProfilingMiddleware:
+    """
+    Выполняет запрос администратора под cProfile, если передан заголовок
+    X-Profile: 1 или параметр ?_profile=1. Идентификатор сохранённого
+    профиля возвращается в заголовке X-Profile-Id, сам профиль скачивается
+    через api/v1/monitoring/profiles/download.
+    """
+
+    def __init__(self, response):
+        self.response = response
+
+    def __call__(self, request):
+        if not is_profiling_requested(request=request):
+            return self.response(request)
+
+        user = get_profiling_user(request=request)
+        if user is None:
+            return self.response(request)
+
+        profiler = Profile()
+        started_at = perf_counter()
+        profiler.enable()
+        try:
+            response = self.response(request)
+        finally:
+            profiler.disable()
+        duration = perf_counter() - started_at
+
+        profile = save_profile(
+            profiler=profiler,
+            request=request,
+            response=response,
+            user=user,
+            duration=duration,
+        )
+        if profile is not None:
+            response["X-Profile-Id"] = str(profile.id)
+
+        return response
+
+
+class TracingMiddleware:
+    """
+    Записывает трассу запроса: корневой спан на весь запрос и дочерние спаны
+    SQL-запросов, обращений к Redis и вызовов S3, VK и почты. Решение о
+    трассировке принимается в начале запроса (заголовок traceparent или
+    MONITORING_TRACE_SAMPLE_RATE). Ко всем спанам добавляются contest.id и
+    user.id.
+    """
+
+    def __init__(self, response):
+        self.response = response
+
+    def __call__(self, request):
+        monitoring = settings.monitoring_settings
+        if not monitoring.TRACE_FILE and not monitoring.OTLP_ENDPOINT:
+            return self.response(request)
+
+        started = start_trace(traceparent=request.headers.get("traceparent"))
+        if started is None:
+            return self.response(request)
+
+        trace, parent_span_id = started
+        trace.attributes["contest.id"] = getattr(request, "contest_id", None)
+
+        token = current_trace.set(trace)
+        try:
+            with ExitStack() as stack:
+                span = stack.enter_context(
+                    start_span(
+                        f"{request.method} {request.path}",
+                        kind=SPAN_KIND_SERVER,
+                        parent_span_id=parent_span_id,
+                        **{"http.method": request.method, "http.target": request.path},
+                    )
+                )
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(trace_query))
+                response = self.response(request)
+        finally:
+            current_trace.reset(token)
+
+        route = get_route_label(request=request)
+        span.name = f"{request.method} {route}"
+        span.attributes["http.route"] = route
+        span.attributes["http.status_code"] = response.status_code
+
+        user = getattr(request, "user", None)
+        if user is not None and user.is_authenticated:
+            trace.attributes["user.id"] = user.id
+
+        exporter.export(trace=trace)
+        return response
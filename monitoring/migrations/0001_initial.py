@@ -0,0 +1,42 @@
+# Generated by Django 5.2.2 on 2026-10-19 13:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="SlowQuery",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("fingerprint", models.TextField()),
+                ("fingerprint_hash", models.CharField(max_length=32)),
+                ("route", models.CharField(max_length=255)),
+                ("call_site", models.CharField(max_length=512)),
+                ("duration_ms", models.FloatField()),
+                ("explain", models.TextField(blank=True, null=True)),
+                ("created_at", models.DateTimeField(auto_now_add=True, db_index=True)),
+            ],
+            options={
+                "db_table": "slow_query",
+                "indexes": [
+                    models.Index(
+                        fields=["fingerprint_hash", "created_at"],
+                        name="slow_query_fingerp_370ccd_idx",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,33 @@
+from django.db import models
+
+
+class SlowQuery(models.Model):
+    fingerprint = models.TextField(name="fingerprint", null=False)
+    fingerprint_hash = models.CharField(
+        name="fingerprint_hash", max_length=32, null=False
+    )
+    route = models.CharField(name="route", max_length=255, null=False)
+    call_site = models.CharField(name="call_site", max_length=512, null=False)
+    duration_ms = models.FloatField(name="duration_ms", null=False)
+    explain = models.TextField(name="explain", null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    class Meta:
+        db_table = "slow_query"
+        indexes = [models.Index(fields=["fingerprint_hash", "created_at"])]
+
+
+class RequestProfile(models.Model):
+    user = models.ForeignKey(
+        to="authentication.Users", on_delete=models.SET_NULL, null=True
+    )
+    method = models.CharField(name="method", max_length=10, null=False)
+    path = models.CharField(name="path", max_length=2048, null=False)
+    route = models.CharField(name="route", max_length=255, null=False)
+    status_code = models.PositiveSmallIntegerField(name="status_code", null=False)
+    duration_ms = models.FloatField(name="duration_ms", null=False)
+    file_name = models.CharField(name="file_name", max_length=255, null=False)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    class Meta:
+        db_table = "request_profile"
@@ -0,0 +1,109 @@
+from cProfile import Profile
+from os import makedirs, path, unlink
+from types import SimpleNamespace
+from uuid import uuid4
+
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+
+from authentication.permissions import IsAdminSystemPermission
+from config.logger import logger
+from config.settings import get_settings
+from monitoring.metrics import get_route_label
+from monitoring.models import RequestProfile
+
+settings = get_settings()
+
+PROFILE_REQUEST_HEADER: str = "X-Profile"
+PROFILE_QUERY_PARAM: str = "_profile"
+
+
+def is_profiling_requested(request) -> bool:
+    return (
+        request.headers.get(PROFILE_REQUEST_HEADER) == "1"
+        or request.GET.get(PROFILE_QUERY_PARAM) == "1"
+    )
+
+
+def get_profiling_user(request):
+    """
+    Проверяет JWT запроса до выполнения view: профилировать можно только
+    запросы пользователей, прошедших IsAdminSystemPermission.
+
+    :return: администратор или None
+    """
+    try:
+        authenticated = JWTAuthentication().authenticate(request=request)
+    except (AuthenticationFailed, InvalidToken, TokenError):
+        return None
+
+    if authenticated is None:
+        return None
+
+    user, _ = authenticated
+    if not IsAdminSystemPermission().has_permission(
+        request=SimpleNamespace(user=user), view=None
+    ):
+        return None
+
+    return user
+
+
+def get_profile_path(file_name: str) -> str:
+    return path.join(settings.monitoring_settings.PROFILE_DIR, file_name)
+
+
+def save_profile(
+    profiler: Profile, request, response, user, duration: float
+) -> RequestProfile | None:
+    """
+    Сохраняет профиль в MONITORING_PROFILE_DIR в формате pstats (его
+    открывают snakeviz, flameprof, gprof2dot) и запись о нём в
+    request_profile, после чего удаляет профили сверх
+    MONITORING_PROFILE_MAX_COUNT.
+    """
+    file_name = f"{uuid4().hex}.pstats"
+
+    try:
+        makedirs(settings.monitoring_settings.PROFILE_DIR, exist_ok=True)
+        profiler.dump_stats(get_profile_path(file_name=file_name))
+
+        profile = RequestProfile.objects.create(
+            user_id=user.id,
+            method=request.method,
+            path=request.get_full_path()[:2048],
+            route=get_route_label(request=request),
+            status_code=response.status_code,
+            duration_ms=duration * 1000,
+            file_name=file_name,
+        )
+    except Exception as e:
+        logger.warning(f"Не удалось сохранить профиль {request.path}: {e}")
+        delete_profile_file(file_name=file_name)
+        return None
+
+    prune_profiles()
+    return profile
+
+
+def delete_profile_file(file_name: str) -> None:
+    try:
+        unlink(get_profile_path(file_name=file_name))
+    except FileNotFoundError:
+        pass
+
+
+def prune_profiles() -> None:
+    expired = list(
+        RequestProfile.objects.order_by("-created_at", "-id").values_list(
+            "id", "file_name"
+        )[settings.monitoring_settings.PROFILE_MAX_COUNT :]
+    )
+    if not expired:
+        return
+
+    for _, file_name in expired:
+        delete_profile_file(file_name=file_name)
+
+    RequestProfile.objects.filter(id__in=[pk for pk, _ in expired]).delete()
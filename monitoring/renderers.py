@@ -0,0 +1,15 @@
+from rest_framework.renderers import JSONRenderer
+
+from monitoring.collector import track
+
+
+class TimedJSONRenderer(JSONRenderer):
+    """JSONRenderer, время которого попадает в метрики запроса как render."""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        with track("render"):
+            return super().render(
+                data=data,
+                accepted_media_type=accepted_media_type,
+                renderer_context=renderer_context,
+            )
@@ -0,0 +1,22 @@
+from rest_framework.serializers import IntegerField, ModelSerializer, Serializer
+
+from monitoring.models import RequestProfile
+
+
+class RequestProfileSerializer(ModelSerializer[RequestProfile]):
+    class Meta:
+        model = RequestProfile
+        fields = [
+            "id",
+            "user_id",
+            "method",
+            "path",
+            "route",
+            "status_code",
+            "duration_ms",
+            "created_at",
+        ]
+
+
+class RequestProfileIdSerializer(Serializer):
+    profile_id = IntegerField(required=True, min_value=1)
@@ -0,0 +1,339 @@
+import json
+from fcntl import LOCK_EX, LOCK_UN, flock
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import wraps
+from os import getpid, path, replace, urandom
+from queue import Empty, Full, Queue
+from random import random
+from threading import Lock, Thread
+from time import time_ns
+from typing import Any
+
+from requests import post
+
+from config.logger import logger
+from config.settings import get_settings
+from monitoring.collector import fingerprint_sql
+
+settings = get_settings()
+
+# Виды спанов OTLP (SpanKind).
+SPAN_KIND_INTERNAL: int = 1
+SPAN_KIND_SERVER: int = 2
+SPAN_KIND_CLIENT: int = 3
+
+STATUS_CODE_ERROR: int = 2
+
+EXPORT_QUEUE_SIZE: int = 1000
+EXPORT_BATCH_SIZE: int = 50
+EXPORT_FLUSH_INTERVAL: float = 2.0
+EXPORT_TIMEOUT: float = 5.0
+
+
+@dataclass
+class Span:
+    trace_id: str
+    span_id: str
+    parent_span_id: str | None
+    name: str
+    kind: int
+    start_time: int = field(default_factory=time_ns)
+    end_time: int | None = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+    error: str | None = None
+
+    def end(self) -> None:
+        self.end_time = time_ns()
+
+
+@dataclass
+class Trace:
+    """Спаны одного запроса; attributes добавляются ко всем спанам при выгрузке."""
+
+    trace_id: str
+    spans: list[Span] = field(default_factory=list)
+    attributes: dict[str, Any] = field(default_factory=dict)
+
+
+current_trace: ContextVar[Trace | None] = ContextVar("current_trace", default=None)
+current_span: ContextVar[Span | None] = ContextVar("current_span", default=None)
+
+
+def new_id(size: int) -> str:
+    return urandom(size).hex()
+
+
+def parse_traceparent(value: str | None) -> tuple[str, str, bool] | None:
+    """
+    Разбирает заголовок W3C traceparent вида
+    00-<trace_id>-<parent_span_id>-<flags>.
+
+    :return: trace_id, parent_span_id и признак sampled или None
+    """
+    if not value:
+        return None
+
+    parts = value.strip().split("-")
+    if len(parts) != 4 or len(parts[1]) != 32 or len(parts[2]) != 16:
+        return None
+
+    try:
+        flags = int(parts[3], 16)
+        int(parts[1], 16)
+        int(parts[2], 16)
+    except ValueError:
+        return None
+
+    return parts[1], parts[2], bool(flags & 1)
+
+
+def start_trace(traceparent: str | None) -> tuple[Trace, str | None] | None:
+    """
+    Решает в начале запроса, трассируется ли он (head sampling): решение
+    вызывающего сервиса из traceparent соблюдается, иначе запрос попадает
+    в выборку с вероятностью MONITORING_TRACE_SAMPLE_RATE.
+
+    :return: трасса и родительский спан или None, если запрос не трассируется
+    """
+    parent = parse_traceparent(value=traceparent)
+    if parent is not None:
+        trace_id, parent_span_id, sampled = parent
+        return (Trace(trace_id=trace_id), parent_span_id) if sampled else None
+
+    if random() >= settings.monitoring_settings.TRACE_SAMPLE_RATE:
+        return None
+
+    return Trace(trace_id=new_id(16)), None
+
+
+@contextmanager
+def start_span(
+    name: str,
+    kind: int = SPAN_KIND_INTERNAL,
+    parent_span_id: str | None = None,
+    **attributes,
+):
+    """
+    Открывает дочерний спан текущего спана. Вне трассируемого запроса
+    ничего не делает и возвращает None.
+
+    Пример:
+        >>> with start_span("vk.wall.get", kind=SPAN_KIND_CLIENT, count=100):
+        ...     call_vk_method(method="wall.get", params=params)
+    """
+    trace = current_trace.get()
+    if trace is None:
+        yield None
+        return
+
+    parent = current_span.get()
+    span = Span(
+        trace_id=trace.trace_id,
+        span_id=new_id(8),
+        parent_span_id=parent.span_id if parent else parent_span_id,
+        name=name,
+        kind=kind,
+        attributes=attributes,
+    )
+    trace.spans.append(span)
+    token = current_span.set(span)
+    try:
+        yield span
+    except Exception as e:
+        span.error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        span.end()
+        current_span.reset(token)
+
+
+def traced(name: str, kind: int = SPAN_KIND_INTERNAL):
+    """Декоратор: выполняет функцию в спане name."""
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with start_span(name, kind=kind, **{"code.function": func.__qualname__}):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def trace_query(execute, sql, params, many, context):
+    """Обёртка connection.execute_wrapper: спан на каждый SQL-запрос."""
+    connection = context["connection"]
+    with start_span(
+        "db.query",
+        kind=SPAN_KIND_CLIENT,
+        **{
+            "db.system": connection.vendor,
+            "db.statement": fingerprint_sql(sql=sql),
+            "db.operation": sql.lstrip()[:6].upper(),
+        },
+    ):
+        return execute(sql, params, many, context)
+
+
+def encode_value(value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        # int64 в OTLP/JSON передаётся строкой.
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+
+    return {"stringValue": str(value)}
+
+
+def encode_attributes(attributes: dict[str, Any]) -> list[dict[str, Any]]:
+    return [
+        {"key": key, "value": encode_value(value=value)}
+        for key, value in attributes.items()
+        if value is not None
+    ]
+
+
+def encode_span(span: Span, trace: Trace) -> dict[str, Any]:
+    data = {
+        "traceId": span.trace_id,
+        "spanId": span.span_id,
+        "name": span.name,
+        "kind": span.kind,
+        "startTimeUnixNano": str(span.start_time),
+        "endTimeUnixNano": str(span.end_time or span.start_time),
+        "attributes": encode_attributes({**trace.attributes, **span.attributes}),
+    }
+    if span.parent_span_id:
+        data["parentSpanId"] = span.parent_span_id
+    if span.error:
+        data["status"] = {"code": STATUS_CODE_ERROR, "message": span.error}
+
+    return data
+
+
+def encode_traces(traces: list[Trace]) -> dict[str, Any]:
+    """Пакет трасс в формате OTLP/JSON (ExportTraceServiceRequest)."""
+    resource = {
+        "service.name": settings.monitoring_settings.TRACE_SERVICE_NAME,
+        "process.pid": getpid(),
+    }
+
+    return {
+        "resourceSpans": [
+            {
+                "resource": {"attributes": encode_attributes(resource)},
+                "scopeSpans": [
+                    {
+                        "scope": {"name": "monitoring.tracing"},
+                        "spans": [
+                            encode_span(span=span, trace=trace)
+                            for trace in traces
+                            for span in trace.spans
+                        ],
+                    }
+                ],
+            }
+        ]
+    }
+
+
+def write_to_file(payload: dict[str, Any]) -> None:
+    """
+    Дописывает пакет строкой JSON в MONITORING_TRACE_FILE (формат приёмника
+    otlpjsonfile коллектора OpenTelemetry). Файл больше
+    MONITORING_TRACE_FILE_MAX_BYTES переименовывается в <файл>.1.
+
+    Файл общий для всех воркеров gunicorn, поэтому проверка размера,
+    переименование и запись выполняются под блокировкой flock на
+    <файл>.lock.
+    """
+    file_name = settings.monitoring_settings.TRACE_FILE
+    line = json.dumps(payload, ensure_ascii=False) + "\n"
+
+    with open(f"{file_name}.lock", "a") as lock_file:
+        flock(lock_file, LOCK_EX)
+        try:
+            if path.exists(file_name) and (
+                path.getsize(file_name)
+                >= settings.monitoring_settings.TRACE_FILE_MAX_BYTES
+            ):
+                replace(file_name, f"{file_name}.1")
+
+            with open(file_name, "a", encoding="utf-8") as trace_file:
+                trace_file.write(line)
+        finally:
+            flock(lock_file, LOCK_UN)
+
+
+def send_to_collector(payload: dict[str, Any]) -> None:
+    post(
+        url=settings.monitoring_settings.OTLP_ENDPOINT,
+        json=payload,
+        timeout=EXPORT_TIMEOUT,
+    ).raise_for_status()
+
+
+class TraceExporter:
+    """
+    Выгружает законченные трассы в фоновом потоке пачками, чтобы запись в
+    файл и отправка в коллектор не задерживали ответы. Если очередь
+    переполнена, трасса отбрасывается.
+    """
+
+    def __init__(self):
+        self.queue: Queue[Trace] = Queue(maxsize=EXPORT_QUEUE_SIZE)
+        self.pid: int | None = None
+        self.lock = Lock()
+
+    def ensure_worker(self) -> None:
+        # Поток не переживает fork воркера gunicorn, поэтому проверяется pid.
+        if self.pid == getpid():
+            return
+
+        with self.lock:
+            if self.pid != getpid():
+                self.pid = getpid()
+                Thread(target=self.run, name="trace-exporter", daemon=True).start()
+
+    def export(self, trace: Trace) -> None:
+        self.ensure_worker()
+        try:
+            self.queue.put_nowait(trace)
+        except Full:
+            logger.warning("Очередь трасс переполнена, трасса отброшена")
+
+    def run(self) -> None:
+        while True:
+            try:
+                batch = [self.queue.get(timeout=EXPORT_FLUSH_INTERVAL)]
+            except Empty:
+                continue
+
+            while len(batch) < EXPORT_BATCH_SIZE:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except Empty:
+                    break
+
+            self.flush(traces=batch)
+
+    @staticmethod
+    def flush(traces: list[Trace]) -> None:
+        monitoring = settings.monitoring_settings
+        payload = encode_traces(traces=traces)
+
+        try:
+            if monitoring.TRACE_FILE:
+                write_to_file(payload=payload)
+            if monitoring.OTLP_ENDPOINT:
+                send_to_collector(payload=payload)
+        except Exception as e:
+            logger.warning(f"Не удалось выгрузить {len(traces)} трасс: {e}")
+
+
+exporter = TraceExporter()
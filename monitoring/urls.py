@@ -0,0 +1,12 @@
+from django.urls import path
+
+from monitoring.views import download_profile_view, get_all_profiles_view
+
+urlpatterns = [
+    path(route="profiles", view=get_all_profiles_view, name="get_all_profiles_view"),
+    path(
+        route="profiles/download",
+        view=download_profile_view,
+        name="download_profile_view",
+    ),
+]
@@ -0,0 +1,277 @@
+from hashlib import md5
+from hmac import compare_digest
+from os import getpid
+from queue import Full, Queue
+from random import random
+from threading import Lock, Thread
+from typing import NamedTuple
+
+from django.db import DatabaseError, connections, transaction
+
+from authentication.enums import UserRole
+from config.logger import logger
+from config.settings import get_settings
+from monitoring.budgets import VIEW_BUDGETS
+from monitoring.collector import RequestMetrics, SlowQueryCandidate, fingerprint_sql
+from monitoring.models import SlowQuery
+
+settings = get_settings()
+
+SERVER_TIMING_REQUEST_HEADER: str = "X-Server-Timing"
+EXTERNAL_SERVICES: tuple[str, ...] = ("s3", "vk", "smtp")
+EXPLAIN_QUEUE_SIZE: int = 100
+
+
+def get_query_budget(route: str) -> int:
+    """
+    Бюджет SQL-запросов маршрута: MONITORING_VIEW_QUERY_BUDGETS, затем
+    объявленный в VIEW_BUDGETS, затем MONITORING_QUERY_BUDGET.
+    """
+    monitoring = settings.monitoring_settings
+    if route in monitoring.VIEW_QUERY_BUDGETS:
+        return monitoring.VIEW_QUERY_BUDGETS[route]
+
+    if route in VIEW_BUDGETS:
+        return VIEW_BUDGETS[route].max_queries
+
+    return monitoring.QUERY_BUDGET
+
+
+def check_budgets(metrics: RequestMetrics) -> list[str]:
+    """
+    Сверяет метрики запроса с бюджетами MONITORING_*.
+
+    :return: описания превышенных бюджетов (пустой список, если всё в норме)
+    """
+    monitoring = settings.monitoring_settings
+    violations = []
+
+    query_budget = get_query_budget(route=metrics.route)
+    if metrics.query_count > query_budget:
+        violations.append(f"SQL-запросов {metrics.query_count} > {query_budget}")
+
+    duplicates = metrics.get_duplicate_queries()
+    if duplicates and duplicates[0][1] > monitoring.DUPLICATE_QUERY_BUDGET:
+        fingerprint, count = duplicates[0]
+        violations.append(
+            f"повторов одного запроса {count} > "
+            f"{monitoring.DUPLICATE_QUERY_BUDGET}: {fingerprint[:300]}"
+        )
+
+    duration_ms = metrics.duration * 1000
+    if duration_ms > monitoring.LATENCY_BUDGET_MS:
+        violations.append(
+            f"время ответа {duration_ms:.0f} мс > {monitoring.LATENCY_BUDGET_MS} мс"
+        )
+
+    return violations
+
+
+def format_metrics(metrics: RequestMetrics) -> str:
+    return (
+        f"{metrics.duration * 1000:.0f} мс, "
+        f"SQL: {metrics.query_count} за {metrics.db_time * 1000:.0f} мс, "
+        f"кэш: {metrics.cache_hits} попаданий / {metrics.cache_misses} промахов "
+        f"за {metrics.cache_time * 1000:.0f} мс"
+    )
+
+
+def is_server_timing_requested(request) -> bool:
+    return SERVER_TIMING_REQUEST_HEADER in request.headers
+
+
+def can_view_server_timing(request) -> bool:
+    """
+    Server-Timing раскрывает устройство бэкенда, поэтому отдаётся
+    администраторам или по заголовку X-Server-Timing со значением
+    MONITORING_SERVER_TIMING_TOKEN. Пользователь определяется после
+    выполнения view, когда DRF уже проверил JWT.
+    """
+    token = settings.monitoring_settings.SERVER_TIMING_TOKEN
+    if token and compare_digest(
+        request.headers.get(SERVER_TIMING_REQUEST_HEADER, ""), token
+    ):
+        return True
+
+    user = getattr(request, "user", None)
+    return getattr(user, "user_role", None) == UserRole.admin.value
+
+
+def format_timing(name: str, seconds: float, description: str) -> str:
+    return f'{name};dur={seconds * 1000:.1f};desc="{description}"'
+
+
+def build_server_timing(metrics: RequestMetrics) -> str:
+    """
+    Значение заголовка Server-Timing. serialize — время, не попавшее в
+    остальные метрики: код view и сериализаторов без SQL, кэша, внешних
+    вызовов и отрисовки JSON.
+    """
+    render_time = metrics.timings.get("render", 0.0)
+    external_time = sum(metrics.timings.get(name, 0.0) for name in EXTERNAL_SERVICES)
+    serialize_time = max(
+        0.0,
+        metrics.duration
+        - metrics.db_time
+        - metrics.cache_time
+        - render_time
+        - external_time,
+    )
+
+    timings = [
+        format_timing("db", metrics.db_time, f"SQL x{metrics.query_count}"),
+        format_timing(
+            "cache",
+            metrics.cache_time,
+            f"hit {metrics.cache_hits} / miss {metrics.cache_misses}",
+        ),
+        format_timing("serialize", serialize_time, "view and serializers"),
+        format_timing("render", render_time, "JSON"),
+    ]
+    timings.extend(
+        format_timing(name, metrics.timings[name], name.upper())
+        for name in EXTERNAL_SERVICES
+        if name in metrics.timings
+    )
+    timings.append(format_timing("total", metrics.duration, "total"))
+
+    return ", ".join(timings)
+
+
+def is_slow_query_route(route: str) -> bool:
+    return any(
+        route.startswith(prefix)
+        for prefix in settings.monitoring_settings.SLOW_QUERY_ROUTES
+    )
+
+
+def can_explain(candidate: SlowQueryCandidate) -> bool:
+    """
+    EXPLAIN ANALYZE действительно выполняет запрос, поэтому анализируются
+    только SELECT без блокировок в PostgreSQL.
+    """
+    sql = candidate.sql.lstrip()
+    return (
+        connections[candidate.alias].vendor == "postgresql"
+        and sql[:6].upper() == "SELECT"
+        and " FOR UPDATE" not in sql.upper()
+    )
+
+
+def explain_query(candidate: SlowQueryCandidate) -> str | None:
+    """
+    Повторяет медленный запрос под EXPLAIN (ANALYZE, BUFFERS), прерывая его
+    через MONITORING_SLOW_QUERY_EXPLAIN_TIMEOUT_MS.
+    """
+    timeout_ms = settings.monitoring_settings.SLOW_QUERY_EXPLAIN_TIMEOUT_MS
+
+    try:
+        with transaction.atomic(using=candidate.alias):
+            with connections[candidate.alias].cursor() as cursor:
+                cursor.execute("SET LOCAL statement_timeout = %s", [timeout_ms])
+                cursor.execute(
+                    f"EXPLAIN (ANALYZE, BUFFERS) {candidate.sql}", candidate.params
+                )
+                return "\n".join(row[0] for row in cursor.fetchall())
+    except DatabaseError as e:
+        logger.warning(f"Не удалось выполнить EXPLAIN медленного запроса: {e}")
+        return None
+
+
+class ExplainTask(NamedTuple):
+    slow_query_id: int
+    candidate: SlowQueryCandidate
+
+
+class SlowQueryExplainer:
+    """
+    Снимает планы медленных запросов в фоновом потоке и дописывает их в
+    slow_query, чтобы повтор запроса под EXPLAIN ANALYZE не задерживал
+    ответ. Если очередь переполнена, план не снимается.
+    """
+
+    def __init__(self):
+        self.queue: Queue[ExplainTask] = Queue(maxsize=EXPLAIN_QUEUE_SIZE)
+        self.pid: int | None = None
+        self.lock = Lock()
+
+    def ensure_worker(self) -> None:
+        # Поток не переживает fork воркера gunicorn, поэтому проверяется pid.
+        if self.pid == getpid():
+            return
+
+        with self.lock:
+            if self.pid != getpid():
+                self.pid = getpid()
+                Thread(
+                    target=self.run, name="slow-query-explainer", daemon=True
+                ).start()
+
+    def submit(self, task: ExplainTask) -> None:
+        self.ensure_worker()
+        try:
+            self.queue.put_nowait(task)
+        except Full:
+            logger.warning("Очередь EXPLAIN переполнена, план не снят")
+
+    def run(self) -> None:
+        while True:
+            task = self.queue.get()
+            try:
+                explain = explain_query(candidate=task.candidate)
+                if explain:
+                    SlowQuery.objects.filter(id=task.slow_query_id).update(
+                        explain=explain
+                    )
+            except DatabaseError as e:
+                logger.warning(f"Не удалось сохранить план медленного запроса: {e}")
+            finally:
+                # Соединения потока не закрываются обработчиками запросов.
+                connections.close_all()
+
+
+explainer = SlowQueryExplainer()
+
+
+def save_slow_queries(metrics: RequestMetrics) -> None:
+    """
+    Сохраняет медленные запросы горячих маршрутов (MONITORING_SLOW_QUERY_ROUTES)
+    в slow_query. С вероятностью MONITORING_SLOW_QUERY_EXPLAIN_RATE для
+    одного из них в фоне снимается план выполнения. Параметры запросов не
+    сохраняются.
+    """
+    if not metrics.slow_queries or not is_slow_query_route(route=metrics.route):
+        return
+
+    rows = []
+    for candidate in metrics.slow_queries:
+        fingerprint = fingerprint_sql(sql=candidate.sql)
+        rows.append(
+            SlowQuery(
+                fingerprint=fingerprint,
+                fingerprint_hash=md5(
+                    fingerprint.encode(), usedforsecurity=False
+                ).hexdigest(),
+                route=metrics.route,
+                call_site=candidate.call_site[:512],
+                duration_ms=candidate.duration * 1000,
+            )
+        )
+
+    try:
+        SlowQuery.objects.bulk_create(rows)
+    except DatabaseError as e:
+        logger.warning(f"Не удалось сохранить медленные запросы {metrics.route}: {e}")
+        return
+
+    # Не больше одного EXPLAIN на запрос: каждый повторяет медленный запрос.
+    for row, candidate in zip(rows, metrics.slow_queries):
+        if (
+            row.id is not None
+            and random() < settings.monitoring_settings.SLOW_QUERY_EXPLAIN_RATE
+            and can_explain(candidate=candidate)
+        ):
+            explainer.submit(
+                task=ExplainTask(slow_query_id=row.id, candidate=candidate)
+            )
+            break
@@ -0,0 +1,123 @@
+from hmac import compare_digest
+
+from django.http import FileResponse, HttpResponse, HttpResponseBase
+from django.views.decorators.http import require_GET
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter, extend_schema
+from prometheus_client import CONTENT_TYPE_LATEST
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from authentication.permissions import IsAdminSystemPermission
+from block_user.permissions import IsNotBlockUserPermission
+from config.settings import get_settings
+from monitoring.metrics import render_metrics
+from monitoring.models import RequestProfile
+from monitoring.paginator import RequestProfilePagination
+from monitoring.profiling import get_profile_path
+from monitoring.serializers import RequestProfileIdSerializer, RequestProfileSerializer
+
+settings = get_settings()
+
+
+@require_GET
+def metrics_view(request):
+    """
+    Метрики в текстовом формате Prometheus. Требуется заголовок
+    Authorization: Bearer <MONITORING_METRICS_TOKEN>; пока токен не задан,
+    метрики не отдаются.
+    """
+    token = settings.monitoring_settings.METRICS_TOKEN
+    if not token:
+        return HttpResponse(status=403)
+
+    if not compare_digest(request.headers.get("Authorization", ""), f"Bearer {token}"):
+        return HttpResponse(status=401)
+
+    return HttpResponse(content=render_metrics(), content_type=CONTENT_TYPE_LATEST)
+
+
+@extend_schema(
+    summary="Список профилей запросов",
+    description="Возвращает последние профили запросов, снятые по заголовку X-Profile: 1 "
+    "или параметру ?_profile=1. Доступно только администраторам.",
+    responses={200: RequestProfileSerializer(many=True)},
+)
+@api_view(http_method_names=["GET"])
+@permission_classes(
+    permission_classes=[
+        IsAuthenticated,
+        IsAdminSystemPermission,
+        IsNotBlockUserPermission,
+    ]
+)
+def get_all_profiles_view(request: Request) -> Response:
+    queryset = RequestProfile.objects.order_by("-created_at", "-id")
+
+    paginator = RequestProfilePagination()
+    result_page = paginator.paginate_queryset(queryset=queryset, request=request)
+
+    serializer = RequestProfileSerializer(instance=result_page, many=True)
+    return paginator.get_paginated_response(data=serializer.data)
+
+
+@extend_schema(
+    summary="Скачивание профиля запроса",
+    description="Отдаёт профиль запроса в формате pstats (snakeviz, flameprof, gprof2dot). "
+    "Доступно только администраторам.",
+    parameters=[
+        OpenApiParameter(
+            name="profile_id",
+            type=OpenApiTypes.INT,
+            location="query",
+            required=True,
+            description="ID профиля",
+        ),
+    ],
+    responses={
+        (200, "application/octet-stream"): OpenApiTypes.BINARY,
+        400: {"type": "object", "properties": {"profile_id": {"type": "array"}}},
+        404: {"type": "object", "properties": {"error": {"type": "string"}}},
+    },
+)
+@api_view(http_method_names=["GET"])
+@permission_classes(
+    permission_classes=[
+        IsAuthenticated,
+        IsAdminSystemPermission,
+        IsNotBlockUserPermission,
+    ]
+)
+def download_profile_view(request: Request) -> HttpResponseBase:
+    query_serializer = RequestProfileIdSerializer(data=request.query_params)
+    if not query_serializer.is_valid():
+        return Response(
+            data=query_serializer.errors, status=status.HTTP_400_BAD_REQUEST
+        )
+
+    profile = RequestProfile.objects.filter(
+        id=query_serializer.validated_data["profile_id"]
+    ).first()
+    if profile is None:
+        return Response(
+            data={"error": "Профиль не найден"}, status=status.HTTP_404_NOT_FOUND
+        )
+
+    try:
+        profile_file = open(get_profile_path(file_name=profile.file_name), "rb")
+    except FileNotFoundError:
+        # Профиль снят на другом сервере или файл уже удалён.
+        return Response(
+            data={"error": "Файл профиля не найден"},
+            status=status.HTTP_404_NOT_FOUND,
+        )
+
+    return FileResponse(
+        profile_file,
+        as_attachment=True,
+        filename=f"profile_{profile.id}.pstats",
+        content_type="application/octet-stream",
+    )
@@ -1,4 +1,6 @@
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Upper
 
 # реализовать поиск по имени
 
@@ -12,4 +14,13 @@ class Nominations(models.Model):
         db_table = "nominations"
         indexes = [
             models.Index(fields=["name"]),
+            GinIndex(
+                fields=["name"],
+                opclasses=["gin_trgm_ops"],
+                name="nominations_trgm_idx",
+            ),
+            GinIndex(
+                OpClass(Upper("name"), name="gin_trgm_ops"),
+                name="nominations_upper_trgm_idx",
+            ),
         ]
@@ -1,6 +1,10 @@
 from django.urls import path
 
-from nomination.views import add_or_remove_nomination_contest_view
+from nomination.views import (
+    add_or_remove_nomination_contest_view,
+    autocomplete_nominations_view,
+    get_all_nominations,
+)
 
 urlpatterns = [
     path(
@@ -8,4 +12,10 @@ urlpatterns = [
         view=add_or_remove_nomination_contest_view,
         name="change_nomination_view",
     ),
+    path(route="all", view=get_all_nominations, name="get_all_nominations"),
+    path(
+        route="autocomplete",
+        view=autocomplete_nominations_view,
+        name="autocomplete_nominations_view",
+    ),
 ]
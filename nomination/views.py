@@ -1,3 +1,5 @@
+from urllib.parse import urlencode
+
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import OpenApiParameter, OpenApiExample, extend_schema
 from rest_framework import status
@@ -6,11 +8,15 @@ from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.request import Request
 from rest_framework.response import Response
-from django.core.cache import cache
 
 from block_user.permissions import IsNotBlockUserPermission
+from caching.utils import cached
 from contests.models import Contest
-from contests.serializers import ContestChangeNominationSerializer
+from contests.serializers import (
+    CatalogAutocompleteQuerySerializer,
+    ContestChangeNominationSerializer,
+)
+from contests.utils import autocomplete_catalog_names
 from nomination.models import Nominations
 from nomination.pagginator import NominationsPaginator
 from nomination.serializers import NominationsSerializer
@@ -46,31 +52,33 @@ from participants.permissions import IsContestOwnerPermission
 @api_view(http_method_names=["GET"])
 @permission_classes(permission_classes=[IsAuthenticated, IsNotBlockUserPermission])
 def get_all_nominations(request: Request) -> Response:
-    cache_key = f"nominations_all_{request.query_params.get('search', 'all')}"
-    cached_data = cache.get(cache_key)
-
-    if cached_data:
-        return Response(data=cached_data, status=status.HTTP_200_OK)
+    search = request.query_params.get("search", None)
 
-    queryset = Nominations.objects.only("name").all()
+    def load_page() -> dict:
+        queryset = Nominations.objects.only("name").all()
 
-    search = request.query_params.get("search", None)
+        if search:
+            queryset = queryset.filter(name__icontains=search)
 
-    if search:
-        queryset = queryset.filter(name__icontains=search)
+        paginator = NominationsPaginator()
+        paginated_queryset = paginator.paginate_queryset(queryset, request)
 
-    paginator = NominationsPaginator()
-    paginated_queryset = paginator.paginate_queryset(queryset, request)
+        serializer = NominationsSerializer(instance=paginated_queryset, many=True)
+        response_data = {
+            "data": serializer.data,
+            "message": f"All names by {search}" if search else "All nominations",
+        }
 
-    serializer = NominationsSerializer(instance=paginated_queryset, many=True)
-    response_data = {
-        "data": serializer.data,
-        "message": f"All names by {search}" if search else "All nominations",
-    }
+        return paginator.get_paginated_response(response_data).data
 
-    cache.set(cache_key, response_data, timeout=60 * 15)
+    response_data = cached(
+        key=f"nominations_all_{urlencode(sorted(request.query_params.items()))}",
+        ttl=60 * 15,
+        loader=load_page,
+        namespace="nominations",
+    )
 
-    return paginator.get_paginated_response(response_data)
+    return Response(data=response_data, status=status.HTTP_200_OK)
 
 
 @extend_schema(
@@ -146,3 +154,74 @@ def add_or_remove_nomination_contest_view(request: Request) -> Response:
         data={"message": "Nominations updated successfully", "data": data},
         status=status.HTTP_200_OK,
     )
+
+
+@extend_schema(
+    summary="Подсказки номинаций при вводе",
+    description=(
+        "Возвращает до `limit` номинаций, подходящих под `q`: сначала совпадения по "
+        "началу названия, затем чаще используемые в конкурсах, затем похожие по "
+        "написанию. Без `q` возвращает самые используемые."
+    ),
+    parameters=[
+        OpenApiParameter(
+            name="q",
+            type=OpenApiTypes.STR,
+            location="query",
+            description="Введённый текст",
+        ),
+        OpenApiParameter(
+            name="limit",
+            type=OpenApiTypes.INT,
+            location="query",
+            description="Количество подсказок (1-50, по умолчанию 10)",
+        ),
+    ],
+    responses={
+        200: {
+            "type": "object",
+            "properties": {
+                "data": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "id": {"type": "integer"},
+                            "name": {"type": "string"},
+                            "usage": {"type": "integer"},
+                        },
+                    },
+                }
+            },
+        }
+    },
+    examples=[
+        OpenApiExample(
+            name="Успешный ответ",
+            value={"data": [{"id": 1, "name": "Лучший фильм", "usage": 12}]},
+            response_only=True,
+        )
+    ],
+)
+@api_view(http_method_names=["GET"])
+@permission_classes(permission_classes=[IsAuthenticated, IsNotBlockUserPermission])
+def autocomplete_nominations_view(request: Request) -> Response:
+    query_serializer = CatalogAutocompleteQuerySerializer(data=request.query_params)
+    query_serializer.is_valid(raise_exception=True)
+
+    query: str = " ".join(query_serializer.validated_data["q"].split())
+    limit: int = query_serializer.validated_data["limit"]
+
+    suggestions = cached(
+        key=f"autocomplete_{limit}_{query.casefold()}",
+        ttl=60 * 15,
+        loader=lambda: autocomplete_catalog_names(
+            queryset=Nominations.objects.all(),
+            usage_field="contestnominations",
+            query=query,
+            limit=limit,
+        ),
+        namespace="nominations",
+    )
+
+    return Response(data={"data": suggestions}, status=status.HTTP_200_OK)
@@ -0,0 +1,20 @@
+from enum import Enum
+
+
+class NotificationKind(Enum):
+    stage_changed = "STAGE_CHANGED"
+    results = "RESULTS"
+
+    @classmethod
+    def choices(cls):
+        return [(item.value, item.name) for item in cls]
+
+
+class CampaignStatus(Enum):
+    pending = "PENDING"
+    running = "RUNNING"
+    completed = "COMPLETED"
+
+    @classmethod
+    def choices(cls):
+        return [(item.value, item.name) for item in cls]
@@ -0,0 +1,110 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from config.settings import get_settings
+from contests.models import Contest
+from contests_contest_stage.models import ContestsContestStage
+from email_outbox.utils import OutboxSender
+from notifications.enums import CampaignStatus, NotificationKind
+from notifications.models import NotificationCampaign
+from notifications.utils import (
+    run_campaign,
+    schedule_results_campaign,
+    schedule_stage_campaigns,
+)
+
+settings = get_settings()
+
+
+class Command(BaseCommand):
+    help = (
+        "Рассылает участникам уведомления о смене этапа и об итогах конкурса. "
+        "Без аргументов продолжает все незавершённые рассылки."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--stage-started",
+            action="store_true",
+            help="Создать рассылки по этапам, начинающимся сегодня",
+        )
+        parser.add_argument("--contest-id", type=int)
+        parser.add_argument(
+            "--kind",
+            choices=[kind.name for kind in NotificationKind],
+            default=NotificationKind.stage_changed.name,
+        )
+        parser.add_argument(
+            "--stage-id",
+            type=int,
+            help="Этап конкурса (contest_stage); по умолчанию — текущий",
+        )
+        parser.add_argument(
+            "--rate",
+            type=float,
+            default=settings.notification_settings.RATE_PER_SECOND,
+            help="Максимум писем в секунду",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.notification_settings.BATCH_SIZE,
+        )
+
+    def handle(self, *args, **options):
+        if options["stage_started"]:
+            campaigns = schedule_stage_campaigns(day=timezone.localdate())
+            self.stdout.write(f"Рассылок по новым этапам: {len(campaigns)}")
+
+        if options["contest_id"]:
+            self.schedule_for_contest(
+                contest_id=options["contest_id"],
+                kind=NotificationKind[options["kind"]],
+                stage_id=options["stage_id"],
+            )
+
+        campaigns = NotificationCampaign.objects.filter(
+            status__in=[CampaignStatus.pending.value, CampaignStatus.running.value]
+        ).select_related("contest", "stage__stage")
+
+        sender = OutboxSender()
+        try:
+            for campaign in campaigns.order_by("id"):
+                run_campaign(
+                    campaign=campaign,
+                    sender=sender,
+                    rate=options["rate"],
+                    batch_size=options["batch_size"],
+                )
+                self.stdout.write(
+                    f"Рассылка {campaign.id} ({campaign.kind}, конкурс "
+                    f"{campaign.contest_id}): {campaign.status}, отправлено "
+                    f"{campaign.sent_count}, с ошибкой {campaign.failed_count}"
+                )
+        finally:
+            sender.close()
+
+    def schedule_for_contest(
+        self, contest_id: int, kind: NotificationKind, stage_id: int | None
+    ) -> None:
+        contest = Contest.objects.filter(id=contest_id).first()
+        if not contest:
+            raise CommandError(f"Конкурс {contest_id} не найден")
+
+        if kind is NotificationKind.results:
+            schedule_results_campaign(contest=contest)
+            return
+
+        today = timezone.localdate()
+        stages = ContestsContestStage.objects.filter(contest=contest)
+        stage = (
+            stages.filter(stage_id=stage_id).first()
+            if stage_id
+            else stages.filter(start_date__lte=today, end_date__gte=today).first()
+        )
+        if not stage:
+            raise CommandError(f"У конкурса {contest_id} не найден этап")
+
+        NotificationCampaign.objects.get_or_create(
+            contest=contest, stage=stage, kind=kind.value
+        )
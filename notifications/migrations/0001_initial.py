@@ -0,0 +1,88 @@
+# Generated by Django 5.2.2 on 2026-10-19 12:57
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    initial = True
+
+    dependencies = [
+        ("contests", "0005_alter_contest_avatar"),
+        ("contests_contest_stage", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="NotificationCampaign",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "kind",
+                    models.CharField(
+                        choices=[
+                            ("STAGE_CHANGED", "stage_changed"),
+                            ("RESULTS", "results"),
+                        ],
+                        max_length=255,
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("PENDING", "pending"),
+                            ("RUNNING", "running"),
+                            ("COMPLETED", "completed"),
+                        ],
+                        default="PENDING",
+                        max_length=255,
+                    ),
+                ),
+                ("last_recipient_id", models.PositiveBigIntegerField(default=0)),
+                ("sent_count", models.PositiveIntegerField(default=0)),
+                ("failed_count", models.PositiveIntegerField(default=0)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("finished_at", models.DateTimeField(blank=True, null=True)),
+                (
+                    "contest",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="contests.contest",
+                    ),
+                ),
+                (
+                    "stage",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="contests_contest_stage.contestsconteststage",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "notification_campaigns",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("contest", "kind", "stage"),
+                        name="notification_campaign_stage_unique",
+                    ),
+                    models.UniqueConstraint(
+                        condition=models.Q(("stage__isnull", True)),
+                        fields=("contest", "kind"),
+                        name="notification_campaign_unique",
+                    ),
+                ],
+            },
+        ),
+    ]
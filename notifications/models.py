@@ -0,0 +1,46 @@
+from django.db import models
+
+from notifications.enums import CampaignStatus, NotificationKind
+
+
+class NotificationCampaign(models.Model):
+    contest = models.ForeignKey(to="contests.Contest", on_delete=models.CASCADE)
+    stage = models.ForeignKey(
+        to="contests_contest_stage.ContestsContestStage",
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+    )
+    kind = models.CharField(
+        name="kind", max_length=255, null=False, choices=NotificationKind.choices()
+    )
+    status = models.CharField(
+        name="status",
+        max_length=255,
+        choices=CampaignStatus.choices(),
+        default=CampaignStatus.pending.value,
+    )
+    last_recipient_id = models.PositiveBigIntegerField(
+        name="last_recipient_id", null=False, default=0
+    )
+    sent_count = models.PositiveIntegerField(name="sent_count", null=False, default=0)
+    failed_count = models.PositiveIntegerField(
+        name="failed_count", null=False, default=0
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = "notification_campaigns"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["contest", "kind", "stage"],
+                name="notification_campaign_stage_unique",
+            ),
+            models.UniqueConstraint(
+                fields=["contest", "kind"],
+                condition=models.Q(stage__isnull=True),
+                name="notification_campaign_unique",
+            ),
+        ]
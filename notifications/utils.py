@@ -0,0 +1,278 @@
+from datetime import date
+from time import monotonic, sleep
+from typing import Iterator, NamedTuple
+from uuid import uuid4
+
+from django.core.cache import cache
+from django.core.mail import EmailMessage
+from django.db.models import Min
+from django.template.loader import render_to_string
+from django.utils import timezone
+
+from applications.models import Applications
+from config.logger import logger
+from config.settings import get_settings
+from contests.models import Contest
+from contests_contest_stage.models import ContestsContestStage
+from email_outbox.utils import OutboxSender
+from notifications.enums import CampaignStatus, NotificationKind
+from notifications.models import NotificationCampaign
+from participants.models import Participant
+
+settings = get_settings()
+
+
+class RenderedEmail(NamedTuple):
+    subject: str
+    body: str
+
+
+class Recipient(NamedTuple):
+    user_id: int
+    email: str
+    variant: str
+
+
+class RateLimiter:
+    """Не даёт отправлять больше rate писем в секунду."""
+
+    def __init__(self, rate: float):
+        self.interval: float = 1 / rate if rate > 0 else 0
+        self.next_slot: float = monotonic()
+
+    def wait(self) -> None:
+        if not self.interval:
+            return
+
+        now = monotonic()
+        if self.next_slot > now:
+            sleep(self.next_slot - now)
+            now = self.next_slot
+
+        self.next_slot = now + self.interval
+
+
+def schedule_stage_campaigns(day: date) -> list[NotificationCampaign]:
+    """Создаёт рассылки по всем этапам опубликованных конкурсов, начинающимся в day."""
+    stages = ContestsContestStage.objects.filter(
+        start_date=day, contest__is_published=True, contest__is_deleted=False
+    ).only("id", "contest_id")
+
+    return [
+        NotificationCampaign.objects.get_or_create(
+            contest_id=stage.contest_id,
+            stage=stage,
+            kind=NotificationKind.stage_changed.value,
+        )[0]
+        for stage in stages
+    ]
+
+
+def schedule_results_campaign(contest: Contest) -> NotificationCampaign:
+    campaign, _ = NotificationCampaign.objects.get_or_create(
+        contest=contest, stage=None, kind=NotificationKind.results.value
+    )
+    return campaign
+
+
+def render_campaign_variants(
+    campaign: NotificationCampaign,
+) -> dict[str, RenderedEmail]:
+    """
+    Рендерит письма рассылки по одному разу на каждый вариант.
+
+    Тексты не содержат персональных данных, поэтому одно и то же тело письма
+    отправляется всем получателям варианта.
+    """
+    contest = campaign.contest
+
+    if campaign.kind == NotificationKind.stage_changed.value:
+        stage = campaign.stage
+        return {
+            "stage_changed": RenderedEmail(
+                subject=f"Конкурс «{contest.title}»: этап «{stage.stage.name}»",
+                body=render_to_string(
+                    template_name="notification_template/stage_changed.html",
+                    context={
+                        "contest_title": contest.title,
+                        "stage_name": stage.stage.name,
+                        "start_date": stage.start_date,
+                        "end_date": stage.end_date,
+                    },
+                ),
+            )
+        }
+
+    context = {"contest_title": contest.title}
+    return {
+        variant: RenderedEmail(
+            subject=f"Итоги конкурса «{contest.title}»",
+            body=render_to_string(
+                template_name=f"notification_template/results_{variant}.html",
+                context=context,
+            ),
+        )
+        for variant in ("winner", "participant")
+    }
+
+
+def iter_campaign_recipients(
+    campaign: NotificationCampaign, chunk_size: int
+) -> Iterator[Recipient]:
+    """
+    Отдаёт получателей рассылки по возрастанию user_id, начиная с контрольной
+    точки. Каждый пользователь встречается один раз.
+    """
+    if campaign.kind == NotificationKind.stage_changed.value:
+        rows = (
+            Participant.objects.filter(
+                contest_id=campaign.contest_id,
+                user__is_active=True,
+                user_id__gt=campaign.last_recipient_id,
+            )
+            .values_list("user_id", "user__email")
+            .order_by("user_id")
+            .distinct()
+        )
+        for user_id, email in rows.iterator(chunk_size=chunk_size):
+            yield Recipient(user_id=user_id, email=email, variant="stage_changed")
+        return
+
+    winner_places = settings.notification_settings.WINNER_PLACES
+    rows = (
+        Applications.objects.filter(
+            contest_id=campaign.contest_id,
+            is_deleted=False,
+            user__is_active=True,
+            user_id__gt=campaign.last_recipient_id,
+        )
+        .values("user_id", "user__email")
+        .annotate(best_place=Min("winners__place"))
+        .order_by("user_id")
+    )
+    for row in rows.iterator(chunk_size=chunk_size):
+        is_winner = row["best_place"] and row["best_place"] <= winner_places
+        yield Recipient(
+            user_id=row["user_id"],
+            email=row["user__email"],
+            variant="winner" if is_winner else "participant",
+        )
+
+
+def save_campaign_checkpoint(campaign: NotificationCampaign) -> None:
+    campaign.save(
+        update_fields=[
+            "status",
+            "last_recipient_id",
+            "sent_count",
+            "failed_count",
+            "finished_at",
+            "updated_at",
+        ]
+    )
+
+
+def extend_campaign_lock(lock_key: str, owner: str) -> bool:
+    """
+    Продлевает блокировку рассылки, если она всё ещё принадлежит owner.
+
+    :return: False, если блокировка истекла или её уже взял другой процесс
+    """
+    if cache.get(lock_key) != owner:
+        return False
+
+    return cache.touch(lock_key, timeout=settings.notification_settings.LOCK_TIMEOUT)
+
+
+def release_campaign_lock(lock_key: str, owner: str) -> None:
+    # Чужую блокировку (взятую после истечения нашей) не снимаем.
+    if cache.get(lock_key) == owner:
+        cache.delete(lock_key)
+
+
+def run_campaign(
+    campaign: NotificationCampaign,
+    sender: OutboxSender,
+    rate: float,
+    batch_size: int,
+) -> bool:
+    """
+    Отправляет рассылку, продолжая с сохранённой контрольной точки.
+
+    Письма уходят через общее SMTP-соединение sender не чаще rate в секунду,
+    получатели читаются пачками по batch_size. Контрольная точка (последний
+    обработанный user_id и счётчики) сохраняется после каждого письма,
+    поэтому повторный запуск не отправит письмо тем, кто его уже получил;
+    повторно может уйти только письмо, отправка которого совпала с падением
+    процесса. Вместе с контрольной точкой продлевается блокировка рассылки.
+
+    :return: False, если рассылку уже выполняет другой процесс
+    """
+    lock_key = f"notification_campaign_{campaign.id}"
+    lock_owner = uuid4().hex
+    if not cache.add(
+        lock_key, lock_owner, timeout=settings.notification_settings.LOCK_TIMEOUT
+    ):
+        logger.info(f"Рассылка {campaign.id} уже выполняется другим процессом")
+        return False
+
+    try:
+        campaign.refresh_from_db(
+            fields=["status", "last_recipient_id", "sent_count", "failed_count"]
+        )
+        if campaign.status == CampaignStatus.completed.value:
+            return True
+
+        variants = render_campaign_variants(campaign=campaign)
+        from_email = settings.email_outbox_settings.FROM_EMAIL
+        rate_limiter = RateLimiter(rate=rate)
+
+        campaign.status = CampaignStatus.running.value
+        save_campaign_checkpoint(campaign=campaign)
+
+        try:
+            for recipient in iter_campaign_recipients(
+                campaign=campaign, chunk_size=batch_size
+            ):
+                rendered = variants[recipient.variant]
+                message = EmailMessage(
+                    subject=rendered.subject,
+                    body=rendered.body,
+                    from_email=from_email,
+                    to=[recipient.email],
+                )
+                message.content_subtype = "html"
+
+                rate_limiter.wait()
+                try:
+                    sender.send_message(message=message)
+                    campaign.sent_count += 1
+                except Exception as e:
+                    sender.close()
+                    campaign.failed_count += 1
+                    logger.warning(
+                        f"Рассылка {campaign.id}: не удалось отправить письмо "
+                        f"пользователю {recipient.user_id}: {e}"
+                    )
+
+                campaign.last_recipient_id = recipient.user_id
+                save_campaign_checkpoint(campaign=campaign)
+                if not extend_campaign_lock(lock_key=lock_key, owner=lock_owner):
+                    logger.warning(
+                        f"Рассылка {campaign.id} остановлена: блокировка "
+                        f"истекла или перехвачена другим процессом"
+                    )
+                    return False
+
+            campaign.status = CampaignStatus.completed.value
+            campaign.finished_at = timezone.now()
+        finally:
+            save_campaign_checkpoint(campaign=campaign)
+
+        logger.info(
+            f"Рассылка {campaign.id} завершена: отправлено {campaign.sent_count}, "
+            f"с ошибкой {campaign.failed_count}"
+        )
+        return True
+    finally:
+        release_campaign_lock(lock_key=lock_key, owner=lock_owner)
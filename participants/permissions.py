@@ -42,3 +42,28 @@ class IsContestMemberPermission(BaseContestRolePermission):
 
 class IsOrgCommitteePermission(BaseContestRolePermission):
     role = ParticipantRole.org_committee
+
+
+class IsContestStaffPermission(BasePermission):
+    roles = (
+        ParticipantRole.owner,
+        ParticipantRole.org_committee,
+        ParticipantRole.jury,
+    )
+    message = "Действие доступно только организаторам и жюри конкурса."
+
+    def has_permission(self, request, view):
+        contest_id = request.contest_id
+        user = request.user
+
+        if not contest_id:
+            raise PermissionDenied("Контекст конкурса не указан.")
+
+        if not Participant.objects.filter(
+            contest_id=contest_id,
+            user_id=user.id,
+            role__in=[role.value for role in self.roles],
+        ).exists():
+            raise PermissionDenied(self.message)
+
+        return True
@@ -34,11 +34,11 @@ def update_participant_in_contest_with_change_role(
         role=role,
     ).exclude(user_id__in=participant_ids)
 
-    participants_to_remove_ids: list[int] = [
-        participant.user.id for participant in participants_to_remove
-    ]
+    participants_to_remove_ids: list[int] = list(
+        participants_to_remove.values_list("user_id", flat=True)
+    )
 
-    if participants_to_remove.exists():
+    if participants_to_remove_ids:
         participants_to_remove.delete()
 
     return {
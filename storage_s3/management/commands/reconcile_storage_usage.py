@@ -0,0 +1,135 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, Sum
+from django.utils import timezone
+
+from applications.models import Applications
+from config.settings import get_settings
+from storage_s3.models import ContestStorageUsage, StoredObject
+from storage_s3.utils import build_file_url, get_sesion_s3
+
+settings = get_settings()
+
+
+class Command(BaseCommand):
+    help = (
+        "Сверяет учёт файлов конкурсов с содержимым бакета и пересчитывает "
+        "суммарный объём, занятый каждым конкурсом."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--prefix", default="applications/")
+        parser.add_argument("--page-size", type=int, default=1000)
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument("--dry-run", action="store_true")
+
+    def handle(self, *args, **options):
+        prefix: str = options["prefix"]
+        page_size: int = options["page_size"]
+        batch_size: int = options["batch_size"]
+        dry_run: bool = options["dry_run"]
+        started_at = timezone.now()
+
+        contest_by_url: dict[str, int] = dict(
+            Applications.objects.filter(
+                link_to_work__startswith=build_file_url(file_key=prefix)
+            ).values_list("link_to_work", "contest_id")
+        )
+
+        client = get_sesion_s3()
+        paginator = client.get_paginator("list_objects_v2")
+
+        seen_ids: set[int] = set()
+        stats = {"listed": 0, "resized": 0, "adopted": 0, "untracked": 0}
+
+        for page in paginator.paginate(
+            Bucket=settings.yandex_s3_credentials.BACKET_NAME,
+            Prefix=prefix,
+            PaginationConfig={"PageSize": page_size},
+        ):
+            sizes = {item["Key"]: item["Size"] for item in page.get("Contents", [])}
+            stats["listed"] += len(sizes)
+
+            tracked_keys: set[str] = set()
+            to_update = []
+            for stored_object in StoredObject.objects.filter(key__in=sizes.keys()):
+                seen_ids.add(stored_object.id)
+                tracked_keys.add(stored_object.key)
+                if stored_object.size != sizes[stored_object.key]:
+                    stored_object.size = sizes[stored_object.key]
+                    to_update.append(stored_object)
+
+            to_create = []
+            for key, size in sizes.items():
+                if key in tracked_keys:
+                    continue
+
+                contest_id = contest_by_url.get(build_file_url(file_key=key))
+                if not contest_id:
+                    stats["untracked"] += 1
+                    continue
+
+                to_create.append(
+                    StoredObject(contest_id=contest_id, key=key, size=size)
+                )
+
+            stats["resized"] += len(to_update)
+            stats["adopted"] += len(to_create)
+
+            if dry_run:
+                continue
+
+            StoredObject.objects.bulk_update(
+                objs=to_update, fields=["size"], batch_size=batch_size
+            )
+            StoredObject.objects.bulk_create(
+                objs=to_create, batch_size=batch_size, ignore_conflicts=True
+            )
+
+        missing_ids = [
+            stored_object_id
+            for stored_object_id in StoredObject.objects.filter(
+                key__startswith=prefix, created_at__lt=started_at
+            )
+            .values_list("id", flat=True)
+            .iterator(chunk_size=batch_size)
+            if stored_object_id not in seen_ids
+        ]
+
+        if not dry_run:
+            for start in range(0, len(missing_ids), batch_size):
+                StoredObject.objects.filter(
+                    id__in=missing_ids[start : start + batch_size]
+                ).delete()
+
+            self.recalculate_usage()
+
+        self.stdout.write(
+            f"Просмотрено объектов: {stats['listed']}, исправлен размер: "
+            f"{stats['resized']}, добавлено в учёт: {stats['adopted']}, "
+            f"удалено отсутствующих: {len(missing_ids)}, "
+            f"без привязки к конкурсу: {stats['untracked']}"
+            + (" (dry-run)" if dry_run else "")
+        )
+
+    def recalculate_usage(self) -> None:
+        totals = {
+            row["contest_id"]: row
+            for row in StoredObject.objects.values("contest_id").annotate(
+                total_bytes=Sum("size"), objects_count=Count("id")
+            )
+        }
+
+        with transaction.atomic():
+            for contest_id, row in totals.items():
+                ContestStorageUsage.objects.update_or_create(
+                    contest_id=contest_id,
+                    defaults={
+                        "total_bytes": row["total_bytes"] or 0,
+                        "objects_count": row["objects_count"],
+                    },
+                )
+
+            ContestStorageUsage.objects.exclude(contest_id__in=totals.keys()).update(
+                total_bytes=0, objects_count=0
+            )
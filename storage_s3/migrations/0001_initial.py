@@ -0,0 +1,34 @@
+# Generated by Django 5.2.2 on 2026-10-19 12:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="ImageDerivative",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("original_url", models.CharField(db_index=True, max_length=255)),
+                ("width", models.PositiveIntegerField()),
+                ("url", models.CharField(max_length=255)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "db_table": "image_derivatives",
+                "unique_together": {("original_url", "width")},
+            },
+        ),
+    ]
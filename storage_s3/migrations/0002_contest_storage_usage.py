@@ -0,0 +1,70 @@
+# Generated by Django 5.2.2 on 2026-10-19 12:53
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("contests", "0005_alter_contest_avatar"),
+        ("storage_s3", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ContestStorageUsage",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("total_bytes", models.PositiveBigIntegerField(default=0)),
+                ("objects_count", models.PositiveIntegerField(default=0)),
+                ("quota_bytes", models.PositiveBigIntegerField(blank=True, null=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "contest",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="storage_usage",
+                        to="contests.contest",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "contest_storage_usage",
+            },
+        ),
+        migrations.CreateModel(
+            name="StoredObject",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("key", models.CharField(max_length=255, unique=True)),
+                ("size", models.PositiveBigIntegerField(default=0)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "contest",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="contests.contest",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "stored_objects",
+            },
+        ),
+    ]
@@ -0,0 +1,43 @@
+from django.db import models
+
+
+class ImageDerivative(models.Model):
+    original_url = models.CharField(
+        name="original_url", max_length=255, null=False, db_index=True
+    )
+    width = models.PositiveIntegerField(name="width", null=False)
+    url = models.CharField(name="url", max_length=255, null=False)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = "image_derivatives"
+        unique_together = ("original_url", "width")
+
+
+class StoredObject(models.Model):
+    contest = models.ForeignKey(to="contests.Contest", on_delete=models.CASCADE)
+    key = models.CharField(name="key", max_length=255, null=False, unique=True)
+    size = models.PositiveBigIntegerField(name="size", null=False, default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = "stored_objects"
+
+
+class ContestStorageUsage(models.Model):
+    contest = models.OneToOneField(
+        to="contests.Contest", on_delete=models.CASCADE, related_name="storage_usage"
+    )
+    total_bytes = models.PositiveBigIntegerField(
+        name="total_bytes", null=False, default=0
+    )
+    objects_count = models.PositiveIntegerField(
+        name="objects_count", null=False, default=0
+    )
+    quota_bytes = models.PositiveBigIntegerField(
+        name="quota_bytes", null=True, blank=True
+    )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "contest_storage_usage"
@@ -0,0 +1,11 @@
+from authentication.throttle import ContestBasedThrottle, UserBasedThrottle
+
+
+class UploadUserThrottle(UserBasedThrottle):
+    scope = "upload_user"
+    rate = "20/min"
+
+
+class UploadContestThrottle(ContestBasedThrottle):
+    scope = "upload_contest"
+    rate = "300/min"
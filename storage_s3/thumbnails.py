@@ -0,0 +1,32 @@
+from io import BytesIO
+
+from PIL import Image, ImageOps
+
+
+def render_thumbnail(data: bytes, width: int, quality: int = 80) -> bytes:
+    """
+    Строит уменьшенную копию изображения фиксированной ширины в формате WebP.
+
+    Модуль намеренно не импортирует Django: функция выполняется в дочерних
+    процессах пула и должна импортироваться без инициализации приложения.
+
+    :param data: содержимое исходного изображения
+    :param width: целевая ширина в пикселях (изображение не увеличивается)
+    :param quality: качество WebP
+    :return: содержимое WebP-файла
+    """
+    with Image.open(BytesIO(data)) as source:
+        image = ImageOps.exif_transpose(source)
+
+        if image.width > width:
+            height = max(1, round(image.height * width / image.width))
+            image = image.resize(
+                size=(width, height), resample=Image.Resampling.LANCZOS
+            )
+
+        has_alpha = image.mode in ("RGBA", "LA") or "transparency" in image.info
+        image = image.convert("RGBA" if has_alpha else "RGB")
+
+        buffer = BytesIO()
+        image.save(buffer, format="WEBP", quality=quality, method=4)
+        return buffer.getvalue()
@@ -1,19 +1,37 @@
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
 from os import unlink
 from tempfile import NamedTemporaryFile
+from time import perf_counter
 from uuid import uuid4
 from django.core.files.uploadedfile import UploadedFile
+from django.db import transaction
+from django.db.models import F, Value
+from django.db.models.functions import Coalesce
 from rest_framework.serializers import ValidationError
 
+from config.logger import logger
 from config.settings import get_settings
 from boto3.session import Session
 
 from contest_file_constraints.models import ContestFileConstraints
 from contests.models import Contest
+from monitoring.collector import track
+from monitoring.metrics import observe_s3_upload
+from monitoring.tracing import SPAN_KIND_CLIENT, traced
 from storage_s3.enums import TypeUploads
+from storage_s3.models import ContestStorageUsage, ImageDerivative, StoredObject
 from storage_s3.success_error_type import Error, Success, FileUploadResult
+from storage_s3.thumbnails import render_thumbnail
 
 settings = get_settings()
 
+AVATAR_DERIVATIVE_WIDTHS: tuple[int, ...] = (320, 640)
+IMAGE_DERIVATIVE_WORKERS: int = 2
+IMAGE_DERIVATIVE_TIMEOUT: int = 30
+
+_image_process_pool: ProcessPoolExecutor | None = None
+
 
 def get_sesion_s3():
     session = Session()
@@ -26,6 +44,7 @@ def get_sesion_s3():
     )
 
 
+@traced(name="s3.upload_file_to_storage", kind=SPAN_KIND_CLIENT)
 def upload_file_to_storage(
     uploaded_file: UploadedFile, file_constraints: dict[str, list[str]]
 ) -> FileUploadResult:
@@ -67,20 +86,225 @@ def upload_file_to_storage(
         for chunk in uploaded_file.chunks():
             tmp_file.write(chunk)
 
+    started_at = perf_counter()
     try:
-        client.upload_file(
-            file_path,
-            settings.yandex_s3_credentials.BACKET_NAME,
-            file_key,
-        )
+        with track("s3"):
+            client.upload_file(
+                file_path,
+                settings.yandex_s3_credentials.BACKET_NAME,
+                file_key,
+            )
     except Exception as e:
         return Error(message=f"Ошибка загрузки файла в S3: {str(e)}")
     finally:
         unlink(file_path)
 
+    observe_s3_upload(
+        kind=target_folder.split(sep="/", maxsplit=1)[0],
+        size=uploaded_file.size,
+        duration=perf_counter() - started_at,
+    )
+
+    return Success(build_file_url(file_key=file_key))
+
+
+def build_file_url(file_key: str) -> str:
     endpoint_url: str = settings.yandex_s3_credentials.ENDPOINT_URL.rstrip("/")
-    url = f"{endpoint_url}/{settings.yandex_s3_credentials.BACKET_NAME}/{file_key}"
-    return Success(url)
+    return f"{endpoint_url}/{settings.yandex_s3_credentials.BACKET_NAME}/{file_key}"
+
+
+def get_file_key_from_url(url: str) -> str | None:
+    prefix = build_file_url(file_key="")
+
+    if not url.startswith(prefix):
+        return None
+
+    return url[len(prefix) :]
+
+
+def get_storage_object(client, file_key: str) -> dict:
+    """
+    Открывает объект хранилища на чтение. Тело ответа (ключ "Body") читается
+    потоково, поэтому объект не загружается в память целиком.
+    """
+    with track("s3"):
+        return client.get_object(
+            Bucket=settings.yandex_s3_credentials.BACKET_NAME, Key=file_key
+        )
+
+
+def get_image_process_pool() -> ProcessPoolExecutor:
+    global _image_process_pool
+
+    if _image_process_pool is None:
+        _image_process_pool = ProcessPoolExecutor(
+            max_workers=IMAGE_DERIVATIVE_WORKERS, mp_context=get_context("spawn")
+        )
+
+    return _image_process_pool
+
+
+def upload_image_derivatives(
+    client, data: bytes, original_url: str, base_key: str, widths: tuple[int, ...]
+) -> list[ImageDerivative]:
+    """
+    Строит WebP-копии изображения в пуле процессов и загружает их в хранилище
+    под ключами <base_key>_<ширина>.webp. Записи ImageDerivative возвращаются
+    несохранёнными.
+
+    Ошибка построения копии не прерывает остальные: такая копия пропускается.
+    """
+    pool = get_image_process_pool()
+    futures = {width: pool.submit(render_thumbnail, data, width) for width in widths}
+    derivatives: list[ImageDerivative] = []
+
+    for width, future in futures.items():
+        derivative_key = f"{base_key}_{width}.webp"
+
+        try:
+            content = future.result(timeout=IMAGE_DERIVATIVE_TIMEOUT)
+            started_at = perf_counter()
+            with track("s3"):
+                client.put_object(
+                    Bucket=settings.yandex_s3_credentials.BACKET_NAME,
+                    Key=derivative_key,
+                    Body=content,
+                    ContentType="image/webp",
+                )
+            observe_s3_upload(
+                kind="derivative",
+                size=len(content),
+                duration=perf_counter() - started_at,
+            )
+        except Exception as e:
+            logger.warning(f"Не удалось построить копию {derivative_key}: {e}")
+            continue
+
+        derivatives.append(
+            ImageDerivative(
+                original_url=original_url,
+                width=width,
+                url=build_file_url(file_key=derivative_key),
+            )
+        )
+
+    return derivatives
+
+
+def create_image_derivatives(
+    uploaded_file: UploadedFile,
+    original_url: str,
+    widths: tuple[int, ...] = AVATAR_DERIVATIVE_WIDTHS,
+) -> dict[str, str]:
+    """
+    Строит WebP-копии изображения фиксированной ширины в пуле процессов и
+    сохраняет их рядом с оригиналом: avatars/<uuid>.jpg -> avatars/<uuid>_320.webp.
+
+    Ошибка построения копий не влияет на загрузку оригинала: копия пропускается,
+    а клиенты продолжают использовать исходный файл.
+
+    Возвращает:
+        Dict[str, str]: Словарь вида {"ширина": "ссылка на копию"}
+    """
+    original_key = get_file_key_from_url(url=original_url)
+    if not original_key:
+        return {}
+
+    uploaded_file.seek(0)
+    derivatives = upload_image_derivatives(
+        client=get_sesion_s3(),
+        data=b"".join(uploaded_file.chunks()),
+        original_url=original_url,
+        base_key=original_key.rsplit(sep=".", maxsplit=1)[0],
+        widths=widths,
+    )
+
+    ImageDerivative.objects.bulk_create(objs=derivatives, ignore_conflicts=True)
+
+    return {str(derivative.width): derivative.url for derivative in derivatives}
+
+
+def get_image_derivatives_map(urls: list[str]) -> dict[str, dict[str, str]]:
+    """
+    Возвращает ссылки на уменьшенные копии для набора оригиналов одним запросом.
+
+    Пример:
+        >>> get_image_derivatives_map(["https://.../avatars/a.jpg"])
+        {'https://.../avatars/a.jpg': {'320': 'https://.../avatars/a_320.webp'}}
+    """
+    derivatives_map: dict[str, dict[str, str]] = {}
+
+    derivatives = ImageDerivative.objects.filter(original_url__in=set(urls)).only(
+        "original_url", "width", "url"
+    )
+
+    for derivative in derivatives:
+        derivatives_map.setdefault(derivative.original_url, {})[
+            str(derivative.width)
+        ] = derivative.url
+
+    return derivatives_map
+
+
+def get_contest_storage_quota(usage: ContestStorageUsage | None) -> int:
+    if usage and usage.quota_bytes is not None:
+        return usage.quota_bytes
+
+    return settings.storage_settings.CONTEST_QUOTA_BYTES
+
+
+def reserve_contest_storage(contest_id: int, size: int) -> Error | None:
+    """
+    Резервирует size байт в квоте конкурса до начала загрузки. Проверка и
+    увеличение занятого объёма выполняются одним условным UPDATE, поэтому
+    одновременные загрузки не превысят квоту вместе. Если загрузка не
+    удалась, резерв снимается через release_contest_storage.
+
+    Квота берётся из ContestStorageUsage.quota_bytes, а если она не задана -
+    из STORAGE_CONTEST_QUOTA_BYTES.
+    """
+    ContestStorageUsage.objects.get_or_create(contest_id=contest_id)
+
+    reserved = ContestStorageUsage.objects.filter(
+        contest_id=contest_id,
+        total_bytes__lte=Coalesce(
+            F("quota_bytes"), Value(settings.storage_settings.CONTEST_QUOTA_BYTES)
+        )
+        - size,
+    ).update(total_bytes=F("total_bytes") + size)
+
+    if reserved:
+        return None
+
+    usage = ContestStorageUsage.objects.get(contest_id=contest_id)
+    return Error(
+        message=f"Превышена квота хранилища конкурса: занято {usage.total_bytes} из "
+        f"{get_contest_storage_quota(usage=usage)} байт, размер файла {size} байт"
+    )
+
+
+def release_contest_storage(contest_id: int, size: int) -> None:
+    ContestStorageUsage.objects.filter(
+        contest_id=contest_id, total_bytes__gte=size
+    ).update(total_bytes=F("total_bytes") - size)
+
+
+def record_stored_object(contest_id: int, file_url: str, size: int) -> None:
+    """
+    Учитывает загруженный файл конкурса. Его объём уже добавлен к занятому
+    при резервировании (reserve_contest_storage); если файл учесть не
+    удалось, резерв снимается.
+    """
+    file_key = get_file_key_from_url(url=file_url)
+    if not file_key:
+        release_contest_storage(contest_id=contest_id, size=size)
+        return
+
+    with transaction.atomic():
+        StoredObject.objects.create(contest_id=contest_id, key=file_key, size=size)
+        ContestStorageUsage.objects.filter(contest_id=contest_id).update(
+            objects_count=F("objects_count") + 1
+        )
 
 
 def get_file_constraint_by_type(
@@ -1,20 +1,30 @@
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import OpenApiParameter, extend_schema, OpenApiExample
 from rest_framework import status
-from rest_framework.decorators import api_view, permission_classes
+from rest_framework.decorators import api_view, permission_classes, throttle_classes
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.request import Request
 
+from authentication.throttle import IpBasedThrottle
 from block_user.permissions import IsNotBlockUserPermission
 from storage_s3.enums import TypeUploads
-from storage_s3.success_error_type import FileUploadResult, Success
-from storage_s3.utils import upload_file_to_storage, get_file_constraint_by_type
+from storage_s3.success_error_type import FileUploadResult, Success, Error
+from storage_s3.throttle import UploadContestThrottle, UploadUserThrottle
+from storage_s3.utils import (
+    upload_file_to_storage,
+    get_file_constraint_by_type,
+    create_image_derivatives,
+    release_contest_storage,
+    reserve_contest_storage,
+    record_stored_object,
+)
 
 
 @extend_schema(
     summary="Загрузка файла любого типа",
-    description="Загружает файл на сервер с проверкой по ограничениям, зависящим от типа загрузки.",
+    description="Загружает файл на сервер с проверкой по ограничениям, зависящим от типа загрузки. "
+    "Для аватаров дополнительно строятся уменьшенные WebP-копии (320 и 640 пикселей по ширине).",
     parameters=[
         OpenApiParameter(
             name="file",
@@ -32,7 +42,13 @@ from storage_s3.utils import upload_file_to_storage, get_file_constraint_by_type
     responses={
         201: {
             "type": "object",
-            "properties": {"link_to_file": {"type": "string", "format": "uri"}},
+            "properties": {
+                "link_to_file": {"type": "string", "format": "uri"},
+                "derivatives": {
+                    "type": "object",
+                    "additionalProperties": {"type": "string", "format": "uri"},
+                },
+            },
         },
         400: {"type": "object", "properties": {"error": {"type": "string"}}},
     },
@@ -47,6 +63,17 @@ from storage_s3.utils import upload_file_to_storage, get_file_constraint_by_type
             value={"link_to_file": "https://storage.example.com/files/example.jpg"},
             response_only=True,
         ),
+        OpenApiExample(
+            name="Успешный ответ (аватар)",
+            value={
+                "link_to_file": "https://storage.example.com/avatars/example.jpg",
+                "derivatives": {
+                    "320": "https://storage.example.com/avatars/example_320.webp",
+                    "640": "https://storage.example.com/avatars/example_640.webp",
+                },
+            },
+            response_only=True,
+        ),
         OpenApiExample(
             name="Ошибка: Файл не предоставлен",
             value={"error": "Файл не предоставлен"},
@@ -95,11 +122,19 @@ def upload_file_view(request: Request) -> Response:
         uploaded_file=uploaded_file, file_constraints=file_constraints
     )
 
-    if isinstance(result, Success):
+    if not isinstance(result, Success):
         return Response(
-            data={"link_to_file": result.value}, status=status.HTTP_201_CREATED
+            data={"error": result.message}, status=status.HTTP_400_BAD_REQUEST
         )
-    return Response(data={"error": result.message}, status=status.HTTP_400_BAD_REQUEST)
+
+    data = {"link_to_file": result.value}
+
+    if type_uploads == TypeUploads.AVATAR:
+        data["derivatives"] = create_image_derivatives(
+            uploaded_file=uploaded_file, original_url=result.value
+        )
+
+    return Response(data=data, status=status.HTTP_201_CREATED)
 
 
 @extend_schema(
@@ -131,6 +166,7 @@ def upload_file_view(request: Request) -> Response:
             "properties": {"link_to_file": {"type": "string", "format": "uri"}},
         },
         400: {"type": "object", "properties": {"error": {"type": "string"}}},
+        413: {"type": "object", "properties": {"error": {"type": "string"}}},
     },
     examples=[
         OpenApiExample(
@@ -153,10 +189,21 @@ def upload_file_view(request: Request) -> Response:
             value={"error": "Данный тип заявки не поддерживается"},
             response_only=True,
         ),
+        OpenApiExample(
+            name="Ошибка: Превышена квота хранилища",
+            value={
+                "error": "Превышена квота хранилища конкурса: занято 10737418000 из "
+                "10737418240 байт, размер файла 5242880 байт"
+            },
+            response_only=True,
+        ),
     ],
 )
 @api_view(http_method_names=["POST"])
 @permission_classes(permission_classes=[IsAuthenticated, IsNotBlockUserPermission])
+@throttle_classes(
+    throttle_classes=[UploadUserThrottle, UploadContestThrottle, IpBasedThrottle]
+)
 def upload_contest_work_view(request: Request) -> Response:
     uploaded_file = request.FILES.get("file")
     upload_type: str = request.data.get("upload_type", None)
@@ -192,11 +239,29 @@ def upload_contest_work_view(request: Request) -> Response:
         type_uploads=type_uploads, contest_id=contest_id
     )
 
-    result: FileUploadResult = upload_file_to_storage(
-        uploaded_file=uploaded_file, file_constraints=file_constraints
+    quota_error: Error | None = reserve_contest_storage(
+        contest_id=contest_id, size=uploaded_file.size
     )
 
+    if quota_error:
+        return Response(
+            data={"error": quota_error.message},
+            status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        )
+
+    result: FileUploadResult | None = None
+    try:
+        result = upload_file_to_storage(
+            uploaded_file=uploaded_file, file_constraints=file_constraints
+        )
+    finally:
+        if not isinstance(result, Success):
+            release_contest_storage(contest_id=contest_id, size=uploaded_file.size)
+
     if isinstance(result, Success):
+        record_stored_object(
+            contest_id=contest_id, file_url=result.value, size=uploaded_file.size
+        )
         return Response(
             data={"link_to_file": result.value}, status=status.HTTP_201_CREATED
         )
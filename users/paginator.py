@@ -0,0 +1,9 @@
+from rest_framework.pagination import CursorPagination
+
+
+class UserSearchPaginator(CursorPagination):
+    page_size = 20
+    page_size_query_param = "limit"
+    max_page_size = 50
+    cursor_query_param = "cursor"
+    ordering = ("email",)
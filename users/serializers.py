@@ -1,12 +1,20 @@
 from datetime import date
 
 from rest_framework.exceptions import ValidationError
-from rest_framework.fields import ListField, CharField, EmailField, URLField, DateField
+from rest_framework.fields import (
+    ListField,
+    CharField,
+    EmailField,
+    URLField,
+    DateField,
+    SerializerMethodField,
+)
 from rest_framework.serializers import Serializer, ModelSerializer
 
 from authentication.models import Users
 from competencies.models import Competencies
 from competencies.serializers import CompetenciesSerializer
+from storage_s3.utils import get_image_derivatives_map
 
 
 class ContestDataUpdateSerializer(Serializer):
@@ -129,14 +137,26 @@ class UserFullDataSerializer(ModelSerializer[Users]):
 
 
 class UserShortDataSerializer(ModelSerializer[Users]):
+    avatar_thumbnails = SerializerMethodField()
+
     class Meta:
         model = Users
         fields = [
             "first_name",
             "last_name",
             "avatar_link",
+            "avatar_thumbnails",
         ]
 
+    def get_avatar_thumbnails(self, user):
+        return get_image_derivatives_map(urls=[user.avatar_link]).get(
+            user.avatar_link, {}
+        )
+
+
+class UserSearchQuerySerializer(Serializer):
+    q = CharField(required=True, min_length=2, max_length=100)
+
 
 class UserParticipantSerializer(ModelSerializer[Users]):
     class Meta:
@@ -3,6 +3,7 @@ from users.views import (
     user_data_update_view,
     user_data_get_view,
     all_users_view,
+    search_users_view,
     user_short_data_get_view,
     user_competencies_jury_view,
 )
@@ -25,6 +26,7 @@ urlpatterns = [
         name="user_data_get_view",
     ),
     path(route="all", view=all_users_view, name="all_users_view"),
+    path(route="search", view=search_users_view, name="search_users_view"),
     path(route="info", view=user_short_data_get_view, name="user_short_data_get_view"),
     path(
         route="info/competencies",
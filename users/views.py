@@ -1,5 +1,6 @@
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import OpenApiExample, extend_schema, OpenApiParameter
+from django.db.models import Q
 from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
@@ -9,6 +10,7 @@ from rest_framework.request import Request
 from authentication.models import Users
 from block_user.permissions import IsNotBlockUserPermission
 from participants.permissions import IsContestOwnerPermission, IsOrgCommitteePermission
+from users.paginator import UserSearchPaginator
 
 from users.serializers import (
     ContestDataUpdateSerializer,
@@ -17,6 +19,7 @@ from users.serializers import (
     UserShortDataSerializer,
     UserCompetenciesSerializer,
     UserParticipantSerializer,
+    UserSearchQuerySerializer,
 )
 
 
@@ -165,9 +168,9 @@ def user_short_data_get_view(request: Request) -> Response:
     ]
 )
 def all_users_view(request: Request) -> Response:
-    search: str = request.data.get("search", None)
+    search: str = request.query_params.get("search", None)
 
-    queryset = Users.objects.all()
+    queryset = Users.objects.only("id", "first_name", "last_name", "email")
 
     if search:
         queryset = queryset.filter(email__icontains=search)
@@ -177,6 +180,85 @@ def all_users_view(request: Request) -> Response:
     return Response(data=serializer.data, status=status.HTTP_200_OK)
 
 
+@extend_schema(
+    summary="Поиск пользователей при вводе",
+    description=(
+        "Постраничный поиск активных пользователей по email, имени и фамилии для "
+        "выбора жюри и оргкомитета. Каждое слово запроса `q` должно встречаться "
+        "хотя бы в одном из полей. Следующая страница запрашивается по ссылке "
+        "`next` (параметр `cursor`)."
+    ),
+    parameters=[
+        OpenApiParameter(
+            name="q",
+            type=OpenApiTypes.STR,
+            location="query",
+            required=True,
+            description="Строка поиска (не короче 2 символов)",
+        ),
+        OpenApiParameter(
+            name="limit",
+            type=OpenApiTypes.INT,
+            location="query",
+            description="Размер страницы (до 50, по умолчанию 20)",
+        ),
+        OpenApiParameter(
+            name="cursor",
+            type=OpenApiTypes.STR,
+            location="query",
+            description="Курсор страницы из ссылок next/previous",
+        ),
+    ],
+    responses={200: UserParticipantSerializer(many=True)},
+    examples=[
+        OpenApiExample(
+            name="Успешный ответ",
+            value={
+                "next": "https://api.example.com/api/v1/users/search?cursor=cD11c2VyMiU0MGV4YW1wbGUuY29t&q=ivan",
+                "previous": None,
+                "results": [
+                    {
+                        "id": 1,
+                        "first_name": "Иван",
+                        "last_name": "Петров",
+                        "email": "ivan@example.com",
+                    }
+                ],
+            },
+            response_only=True,
+        )
+    ],
+)
+@api_view(http_method_names=["GET"])
+@permission_classes(
+    permission_classes=[
+        IsAuthenticated,
+        IsNotBlockUserPermission,
+    ]
+)
+def search_users_view(request: Request) -> Response:
+    query_serializer = UserSearchQuerySerializer(data=request.query_params)
+    query_serializer.is_valid(raise_exception=True)
+
+    queryset = Users.objects.filter(is_active=True).only(
+        "id", "first_name", "last_name", "email"
+    )
+
+    for term in query_serializer.validated_data["q"].split():
+        lookup = "icontains" if len(term) >= 3 else "istartswith"
+        queryset = queryset.filter(
+            Q(**{f"email__{lookup}": term})
+            | Q(**{f"first_name__{lookup}": term})
+            | Q(**{f"last_name__{lookup}": term})
+        )
+
+    paginator = UserSearchPaginator()
+    page = paginator.paginate_queryset(queryset=queryset, request=request)
+    serializer = UserParticipantSerializer(instance=page, many=True)
+
+    return paginator.get_paginated_response(serializer.data)
+
+
 @extend_schema(
     summary="Получение компетенций пользователя",
     description="Возвращает информацию о компетенциях пользователя по email.",
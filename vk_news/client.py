@@ -0,0 +1,184 @@
+from random import uniform
+from threading import Lock
+from time import sleep
+from typing import Any
+
+from django.core.cache import cache
+from requests import ConnectionError, HTTPError, RequestException, Session, Timeout
+from requests.adapters import HTTPAdapter
+
+from config.logger import logger
+from config.settings import get_settings
+from monitoring.collector import track
+
+settings = get_settings()
+
+VK_CIRCUIT_FAILURES_KEY = "vk_api_circuit_failures"
+VK_CIRCUIT_OPEN_KEY = "vk_api_circuit_open"
+VK_CIRCUIT_HALF_OPEN_KEY = "vk_api_circuit_half_open"
+VK_CIRCUIT_PROBE_KEY = "vk_api_circuit_probe"
+
+# Коды ошибок VK API, после которых запрос имеет смысл повторить:
+# 1 — неизвестная ошибка, 6 — слишком много запросов в секунду,
+# 9 — слишком много однотипных действий, 10 — внутренняя ошибка сервера.
+VK_RETRYABLE_ERROR_CODES = {1, 6, 9, 10}
+
+_session: Session | None = None
+_session_lock = Lock()
+
+
+class VkApiError(RequestException):
+    def __init__(self, code: int, message: str):
+        super().__init__(f"[{code}] {message}")
+        self.code = code
+
+
+class CircuitOpenError(RequestException):
+    pass
+
+
+def get_session() -> Session:
+    """
+    Возвращает общую для процесса сессию requests с пулом keep-alive
+    соединений к VK API.
+    """
+    global _session
+
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = Session()
+                adapter = HTTPAdapter(
+                    pool_connections=1,
+                    pool_maxsize=settings.vk_credentials.POOL_SIZE,
+                    max_retries=0,
+                )
+                session.mount(prefix="https://", adapter=adapter)
+                session.mount(prefix="http://", adapter=adapter)
+                _session = session
+
+    return _session
+
+
+def is_circuit_open() -> bool:
+    return bool(cache.get(key=VK_CIRCUIT_OPEN_KEY))
+
+
+def allow_request() -> bool:
+    """
+    Пока цепь разомкнута, запросы к VK не выполняются. После истечения
+    CIRCUIT_RESET_TIMEOUT цепь полуоткрыта: пропускается только один пробный
+    вызов, остальные отклоняются до его завершения.
+    """
+    if is_circuit_open():
+        return False
+
+    if not cache.get(key=VK_CIRCUIT_HALF_OPEN_KEY):
+        return True
+
+    vk_credentials = settings.vk_credentials
+    probe_timeout = (vk_credentials.MAX_RETRIES + 1) * (
+        vk_credentials.CONNECT_TIMEOUT + vk_credentials.READ_TIMEOUT
+    )
+    return cache.add(key=VK_CIRCUIT_PROBE_KEY, value=True, timeout=int(probe_timeout))
+
+
+def open_circuit() -> None:
+    cache.set(
+        key=VK_CIRCUIT_OPEN_KEY,
+        value=True,
+        timeout=settings.vk_credentials.CIRCUIT_RESET_TIMEOUT,
+    )
+    cache.set(key=VK_CIRCUIT_HALF_OPEN_KEY, value=True, timeout=None)
+    cache.delete_many(keys=[VK_CIRCUIT_FAILURES_KEY, VK_CIRCUIT_PROBE_KEY])
+    logger.warning(
+        f"[VK API] запросы к VK приостановлены на "
+        f"{settings.vk_credentials.CIRCUIT_RESET_TIMEOUT} с"
+    )
+
+
+def record_success() -> None:
+    cache.delete_many(
+        keys=[VK_CIRCUIT_FAILURES_KEY, VK_CIRCUIT_HALF_OPEN_KEY, VK_CIRCUIT_PROBE_KEY]
+    )
+
+
+def record_failure() -> None:
+    if cache.get(key=VK_CIRCUIT_HALF_OPEN_KEY):
+        open_circuit()
+        return
+
+    cache.add(key=VK_CIRCUIT_FAILURES_KEY, value=0, timeout=None)
+    failures = cache.incr(key=VK_CIRCUIT_FAILURES_KEY)
+
+    if failures >= settings.vk_credentials.CIRCUIT_FAILURE_THRESHOLD:
+        open_circuit()
+
+
+def is_retryable(error: RequestException) -> bool:
+    if isinstance(error, (ConnectionError, Timeout)):
+        return True
+
+    if isinstance(error, HTTPError) and error.response is not None:
+        return error.response.status_code == 429 or error.response.status_code >= 500
+
+    if isinstance(error, VkApiError):
+        return error.code in VK_RETRYABLE_ERROR_CODES
+
+    return False
+
+
+def get_retry_delay(attempt: int) -> float:
+    return uniform(0, settings.vk_credentials.RETRY_BACKOFF * 2**attempt)
+
+
+def call_vk_method(method: str, params: dict[str, Any]) -> dict[str, Any]:
+    """
+    Вызывает метод VK API через общую сессию.
+
+    Каждый запрос ограничен таймаутами на соединение и чтение. Сетевые
+    ошибки, ответы 429/5xx и временные ошибки VK повторяются до MAX_RETRIES
+    раз с экспоненциальной задержкой со случайным разбросом. Неудачи
+    считаются общим для всех процессов автоматом (через кэш): после
+    CIRCUIT_FAILURE_THRESHOLD неудачных вызовов подряд запросы к VK
+    прекращаются на CIRCUIT_RESET_TIMEOUT секунд и сразу завершаются
+    CircuitOpenError.
+
+    :return: содержимое поля response ответа VK
+    """
+    if not allow_request():
+        raise CircuitOpenError("VK API временно недоступен, запросы приостановлены")
+
+    vk_credentials = settings.vk_credentials
+    url = f"{vk_credentials.API_URL.rstrip('/')}/{method}"
+    timeout = (vk_credentials.CONNECT_TIMEOUT, vk_credentials.READ_TIMEOUT)
+
+    attempt = 0
+    while True:
+        try:
+            with track("vk"):
+                response = get_session().get(url=url, params=params, timeout=timeout)
+            response.raise_for_status()
+            data = response.json()
+
+            if "error" in data:
+                raise VkApiError(
+                    code=data["error"].get("error_code", 0),
+                    message=data["error"].get("error_msg", ""),
+                )
+        except ValueError as e:
+            record_failure()
+            raise RequestException(f"Некорректный ответ VK API: {e}") from e
+        except RequestException as e:
+            if attempt >= vk_credentials.MAX_RETRIES or not is_retryable(error=e):
+                record_failure()
+                raise
+
+            delay = get_retry_delay(attempt=attempt)
+            attempt += 1
+            logger.info(f"[VK API] {method}: {e}; повтор {attempt} через {delay:.2f} с")
+            sleep(delay)
+            continue
+
+        record_success()
+        return data.get("response", {})
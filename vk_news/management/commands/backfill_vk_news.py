@@ -0,0 +1,70 @@
+from time import sleep
+
+from django.core.management.base import BaseCommand, CommandError
+
+from vk_news.utils import invalidate_news_payload, fetch_vk_posts_with_api
+
+VK_MAX_PAGE_SIZE = 100
+
+
+class Command(BaseCommand):
+    help = "Загружает историю стены ВКонтакте постранично, начиная со смещения."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--offset", type=int, default=0)
+        parser.add_argument("--page-size", type=int, default=VK_MAX_PAGE_SIZE)
+        parser.add_argument(
+            "--max-pages", type=int, default=0, help="0 — до конца стены"
+        )
+        parser.add_argument(
+            "--delay",
+            type=float,
+            default=0.35,
+            help="Пауза между запросами (лимит VK API — 3 запроса в секунду)",
+        )
+        parser.add_argument(
+            "--stop-at-known",
+            action="store_true",
+            help="Остановиться на первой странице без новых постов",
+        )
+
+    def handle(self, *args, **options):
+        offset: int = options["offset"]
+        page_size: int = min(options["page_size"], VK_MAX_PAGE_SIZE)
+        max_pages: int = options["max_pages"]
+
+        pages, saved_total = 0, 0
+
+        while not max_pages or pages < max_pages:
+            result = fetch_vk_posts_with_api(count=page_size, offset=offset)
+
+            if "error" in result:
+                raise CommandError(
+                    f"{result['error']} (offset={offset}, сохранено {saved_total})"
+                )
+
+            if "info" in result:
+                break
+
+            saved, total = int(result["saved"]), int(result["total"])
+            saved_total += saved
+            pages += 1
+            offset += total
+
+            self.stdout.write(
+                f"offset={offset}/{result['available']}: новых постов {saved}"
+            )
+
+            if offset >= int(result["available"]):
+                break
+
+            if options["stop_at_known"] and not saved:
+                break
+
+            sleep(options["delay"])
+
+        invalidate_news_payload()
+        self.stdout.write(
+            f"Загружено страниц: {pages}, новых постов: {saved_total}, "
+            f"следующее смещение: {offset}"
+        )
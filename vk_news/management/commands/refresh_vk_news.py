@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from vk_news.utils import refresh_vk_news
+
+
+class Command(BaseCommand):
+    help = "Обновляет новости из ВКонтакте и кэш для /api/v1/news/latest."
+
+    def handle(self, *args, **options):
+        result = refresh_vk_news()
+
+        if result is None:
+            self.stdout.write("Обновление уже выполняется другим процессом")
+            return
+
+        self.stdout.write(", ".join(f"{key}: {value}" for key, value in result.items()))
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.2 on 2026-10-19 12:58
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("vk_news", "0002_alter_vknews_url"),
+        ("vk_news_attachments", "0002_alter_vknewsattachment_url"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="vknews",
+            name="date",
+            field=models.DateTimeField(db_index=True),
+        ),
+        migrations.AlterField(
+            model_name="vknews",
+            name="vk_attachment",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                to="vk_news_attachments.vknewsattachment",
+            ),
+        ),
+    ]
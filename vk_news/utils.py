@@ -1,14 +1,30 @@
-from datetime import datetime
+from datetime import datetime, timedelta
+from threading import Thread
+from typing import Any
 
-from django.db import transaction
+from django.db import connection, transaction
 from requests import RequestException
 from django.core.cache import cache
+from django.utils import timezone
 from django.utils.timezone import make_aware
+from caching.utils import cached, invalidate
+from config.logger import logger
 from config.settings import get_settings
+from monitoring.tracing import SPAN_KIND_CLIENT, traced
+from storage_s3.utils import get_image_derivatives_map
+from vk_news.client import call_vk_method, is_circuit_open
 from vk_news.models import VkNews
 from vk_news.serializers import VkNewsSerializer
 from vk_news_attachments.models import VkNewsAttachment
-import requests
+from vk_news_attachments.utils import mirror_pending_attachments
+
+settings = get_settings()
+
+VK_NEWS_CACHE_KEY = "latest_vk_news"
+VK_NEWS_CACHE_TTL = 60 * 60
+VK_NEWS_REFRESHED_AT_KEY = "latest_vk_news_refreshed_at"
+VK_NEWS_REFRESH_LOCK_KEY = "latest_vk_news_refresh_lock"
+VK_NEWS_MIRROR_LIMIT = 20
 
 
 def clean_text(text: str) -> str:
@@ -28,93 +44,247 @@ def extract_photo(photo_data: dict):
     )
 
 
+@traced(name="vk.get_posts_with_api", kind=SPAN_KIND_CLIENT)
 def get_posts_with_api(
     token: str,
     domain: str,
     count: int,
     version: str = "5.199",
+    offset: int = 0,
 ):
     params = {
         "domain": domain,
         "access_token": token,
         "v": version,
         "count": count,
+        "offset": offset,
     }
 
-    response = requests.get(url="https://api.vk.com/method/wall.get", params=params)
-    response.raise_for_status()
-    return response.json()
+    return call_vk_method(method="wall.get", params=params)
+
+
+def extract_post_photo(item: dict) -> dict | None:
+    for attachment in item.get("attachments", []):
+        if attachment.get("type") == "photo":
+            return extract_photo(attachment.get("photo", {}))
+    return None
+
+
+def get_attachment_ids_by_url(urls: set[str]) -> dict[str, int]:
+    attachment_ids: dict[str, int] = {}
+    for attachment_id, url in (
+        VkNewsAttachment.objects.filter(url__in=urls)
+        .order_by("id")
+        .values_list("id", "url")
+    ):
+        attachment_ids.setdefault(url, attachment_id)
+    return attachment_ids
+
+
+def save_vk_posts_to_database(items: list[dict]) -> int:
+    """
+    Сохраняет порцию постов VK пакетно.
+
+    Уже известные vk_id отбираются одним запросом, вложения и посты
+    создаются через bulk_create, поэтому число запросов не зависит от
+    размера порции.
+
+    :return: количество новых постов
+    """
+    posts_by_id = {item["id"]: item for item in items if item.get("id")}
+    known_ids = set(
+        VkNews.objects.filter(vk_id__in=posts_by_id.keys()).values_list(
+            "vk_id", flat=True
+        )
+    )
+    new_items = [
+        item for post_id, item in posts_by_id.items() if post_id not in known_ids
+    ]
 
+    if not new_items:
+        return 0
 
-def save_vk_post_to_database(items: dict):
-    post_id = items.get("id")
-    text = clean_text(items.get("text", ""))
-    date = format_date(items.get("date", 0))
+    photos_by_post = {item["id"]: extract_post_photo(item) for item in new_items}
+    photos_by_url = {
+        photo["url"]: photo
+        for photo in photos_by_post.values()
+        if photo and photo.get("url")
+    }
 
     with transaction.atomic():
-        if VkNews.objects.filter(vk_id=post_id).exists():
-            return False
-
-        photo_data = None
-        for attachment in items.get("attachments", []):
-            if attachment.get("type") == "photo":
-                photo_data = extract_photo(attachment.get("photo", {}))
-                break
-
-        attachment_obj = None
-        if photo_data:
-            attachment_obj, _ = VkNewsAttachment.objects.get_or_create(
-                url=photo_data.get("url"),
-                defaults={
-                    "width": photo_data.get("width"),
-                    "height": photo_data.get("height"),
-                    "type": "photo",
-                },
+        attachment_ids = get_attachment_ids_by_url(urls=set(photos_by_url))
+        missing_urls = photos_by_url.keys() - attachment_ids.keys()
+
+        if missing_urls:
+            VkNewsAttachment.objects.bulk_create(
+                objs=[
+                    VkNewsAttachment(
+                        url=url,
+                        width=photos_by_url[url].get("width") or 0,
+                        height=photos_by_url[url].get("height") or 0,
+                        type="photo",
+                    )
+                    for url in missing_urls
+                ],
+                ignore_conflicts=True,
             )
+            attachment_ids.update(get_attachment_ids_by_url(urls=missing_urls))
 
-        VkNews.objects.create(
-            vk_id=post_id,
-            description=text,
-            date=date,
-            vk_attachment=attachment_obj,
-            url=f"https://vk.com/wall{items.get('owner_id', '')}_{post_id}",
+        VkNews.objects.bulk_create(
+            objs=[
+                VkNews(
+                    vk_id=item["id"],
+                    description=clean_text(item.get("text", "")),
+                    date=format_date(item.get("date", 0)),
+                    vk_attachment_id=(
+                        attachment_ids.get(photos_by_post[item["id"]].get("url"))
+                        if photos_by_post[item["id"]]
+                        else None
+                    ),
+                    url=f"https://vk.com/wall{item.get('owner_id', '')}_{item['id']}",
+                )
+                for item in new_items
+            ],
+            ignore_conflicts=True,
         )
-    return True
 
+    return len(new_items)
 
-def fetch_vk_posts_with_api() -> dict[str, str]:
-    settings = get_settings()
 
+def fetch_vk_posts_with_api(
+    count: int | None = None, offset: int = 0
+) -> dict[str, str]:
     try:
-        data = get_posts_with_api(
+        response = get_posts_with_api(
             token=settings.vk_credentials.TOKEN,
             domain=settings.vk_credentials.DOMAIN,
-            count=settings.vk_credentials.COUNT_POSTS,
+            count=count or settings.vk_credentials.COUNT_POSTS,
             version=settings.vk_credentials.API_VERSION,
+            offset=offset,
         )
     except RequestException as e:
         return {"error": f"Ошибка при запросе к VK API: {str(e)}"}
 
-    items = data.get("response", {}).get("items", [])
+    items = response.get("items", [])
 
     if not items:
         return {"info": "Нет новых постов в ответе от VK."}
 
-    saved_count = 0
-    for item in items:
-        if save_vk_post_to_database(item):
-            saved_count += 1
+    saved_count = save_vk_posts_to_database(items=items)
+
+    return {
+        "saved": str(saved_count),
+        "total": str(len(items)),
+        "available": str(response.get("count", len(items))),
+    }
+
+
+def build_news_payload() -> dict[str, Any]:
+    recent_news = VkNews.objects.select_related("vk_attachment").order_by("-date")[:5]
+
+    refreshed_at = cache.get(key=VK_NEWS_REFRESHED_AT_KEY)
+    if not refreshed_at:
+        latest = VkNews.objects.order_by("-created_at").only("created_at").first()
+        refreshed_at = latest.created_at if latest else None
+
+    recent_news = list(recent_news)
+    thumbnails = get_image_derivatives_map(
+        urls=[
+            news.vk_attachment.mirror_url
+            for news in recent_news
+            if news.vk_attachment and news.vk_attachment.mirror_url
+        ]
+    )
+
+    payload = {
+        "news": VkNewsSerializer(
+            recent_news, many=True, context={"thumbnails": thumbnails}
+        ).data,
+        "refreshed_at": refreshed_at,
+    }
+    return payload
+
+
+def invalidate_news_payload() -> None:
+    invalidate(key=VK_NEWS_CACHE_KEY)
+
+
+def get_news_payload() -> dict[str, Any]:
+    """
+    Возвращает закэшированные новости вместе с временем последнего обновления
+    и признаком устаревания. Запрос к VK здесь никогда не выполняется.
+    """
+    payload = cached(
+        key=VK_NEWS_CACHE_KEY, ttl=VK_NEWS_CACHE_TTL, loader=build_news_payload
+    )
+    refreshed_at = payload["refreshed_at"]
+
+    return {
+        **payload,
+        "is_stale": not refreshed_at
+        or timezone.now() - refreshed_at
+        > timedelta(seconds=settings.vk_credentials.REFRESH_INTERVAL),
+    }
+
+
+def refresh_vk_news() -> dict[str, str] | None:
+    """
+    Обновляет новости из VK, если этим не занят другой процесс.
+
+    Блокировка берётся через cache.add, поэтому одновременно к VK обращается
+    только один воркер. После неудачи блокировка не снимается, а доживает
+    REFRESH_RETRY_INTERVAL секунд, чтобы не повторять запрос на каждый визит.
+
+    :return: результат fetch_vk_posts_with_api или None, если обновление
+        уже выполняется
+    """
+    if not cache.add(
+        key=VK_NEWS_REFRESH_LOCK_KEY,
+        value=True,
+        timeout=settings.vk_credentials.REFRESH_LOCK_TIMEOUT,
+    ):
+        return None
+
+    try:
+        result = fetch_vk_posts_with_api()
+    except Exception as e:
+        logger.exception(f"[VK API] Ошибка при обновлении новостей: {e}")
+        result = {"error": str(e)}
+
+    if "error" in result:
+        logger.warning(f"[VK API] Новости не обновлены: {result['error']}")
+        cache.set(
+            key=VK_NEWS_REFRESH_LOCK_KEY,
+            value=True,
+            timeout=settings.vk_credentials.REFRESH_RETRY_INTERVAL,
+        )
+        return result
+
+    cache.set(key=VK_NEWS_REFRESHED_AT_KEY, value=timezone.now(), timeout=None)
+    invalidate_news_payload()
+    cache.delete(key=VK_NEWS_REFRESH_LOCK_KEY)
+
+    # Копирование изображений идёт уже без блокировки обновления: оно может
+    # занять дольше REFRESH_LOCK_TIMEOUT, а новости до его окончания
+    # отдаются со ссылками на VK.
+    if int(result.get("saved", 0)):
+        mirrored, _ = mirror_pending_attachments(limit=VK_NEWS_MIRROR_LIMIT)
+        if mirrored:
+            invalidate_news_payload()
+
+    return result
+
+
+def run_vk_news_refresh() -> None:
+    try:
+        refresh_vk_news()
+    finally:
+        connection.close()
 
-    return {"saved": str(saved_count), "total": str(len(items))}
 
+def schedule_vk_news_refresh() -> None:
+    """Запускает обновление новостей в фоновом потоке, не дожидаясь его."""
+    if cache.get(key=VK_NEWS_REFRESH_LOCK_KEY) or is_circuit_open():
+        return
 
-def get_news_response():
-    cached = cache.get(key="latest_vk_news")
-    if not cached:
-        recent_news = VkNews.objects.select_related("vk_attachment").order_by(
-            "-created_at"
-        )[:5]
-        serialized_news = VkNewsSerializer(recent_news, many=True).data
-        cache.set(key="latest_vk_news", value=serialized_news, timeout=3600)
-        return serialized_news
-    return cached
+    Thread(target=run_vk_news_refresh, name="vk-news-refresh", daemon=True).start()
@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand
+
+from vk_news.utils import invalidate_news_payload
+from vk_news_attachments.utils import (
+    VK_IMAGE_MIRROR_WORKERS,
+    mirror_pending_attachments,
+)
+
+
+class Command(BaseCommand):
+    help = "Сохраняет изображения новостей VK и их уменьшенные копии в бакет."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=100)
+        parser.add_argument("--workers", type=int, default=VK_IMAGE_MIRROR_WORKERS)
+
+    def handle(self, *args, **options):
+        mirrored_total, failed_total = 0, 0
+
+        while True:
+            mirrored, failed = mirror_pending_attachments(
+                limit=options["batch_size"], workers=options["workers"]
+            )
+            if not mirrored and not failed:
+                break
+
+            mirrored_total += mirrored
+            failed_total += failed
+            self.stdout.write(f"Сохранено: {mirrored}, с ошибкой: {failed}")
+
+        invalidate_news_payload()
+        self.stdout.write(
+            f"Всего сохранено изображений: {mirrored_total}, "
+            f"с ошибкой: {failed_total}"
+        )
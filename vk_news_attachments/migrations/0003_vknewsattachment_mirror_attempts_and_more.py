@@ -0,0 +1,29 @@
+# Generated by Django 5.2.2 on 2026-10-19 13:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("vk_news_attachments", "0002_alter_vknewsattachment_url"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="vknewsattachment",
+            name="mirror_attempts",
+            field=models.PositiveSmallIntegerField(
+                default=0, verbose_name="Неудачных попыток сохранить копию"
+            ),
+        ),
+        migrations.AddField(
+            model_name="vknewsattachment",
+            name="mirror_url",
+            field=models.CharField(
+                blank=True,
+                max_length=255,
+                null=True,
+                verbose_name="URL копии в хранилище",
+            ),
+        ),
+    ]
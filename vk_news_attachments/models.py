@@ -12,6 +12,12 @@ class VkNewsAttachment(models.Model):
     height = models.IntegerField(verbose_name="Высота изображения")
     width = models.IntegerField(verbose_name="Ширина изображения")
     type = models.CharField(max_length=10, null=False, blank=False)
+    mirror_url = models.CharField(
+        verbose_name="URL копии в хранилище", max_length=255, null=True, blank=True
+    )
+    mirror_attempts = models.PositiveSmallIntegerField(
+        verbose_name="Неудачных попыток сохранить копию", default=0
+    )
 
     class Meta:
         db_table = "vk_news_attachments"
@@ -1,9 +1,32 @@
+from rest_framework.fields import SerializerMethodField
 from rest_framework.serializers import ModelSerializer
 
 from vk_news_attachments.models import VkNewsAttachment
 
 
 class VkNewsAttachmentSerializer(ModelSerializer[VkNewsAttachment]):
+    """
+    url указывает на копию изображения в нашем хранилище, если она уже
+    сохранена, иначе на оригинал в VK. Карта уменьшенных копий передаётся
+    через context["thumbnails"] (см. storage_s3.utils.get_image_derivatives_map).
+    """
+
+    url = SerializerMethodField()
+    original_url = SerializerMethodField()
+    thumbnails = SerializerMethodField()
+
     class Meta:
         model = VkNewsAttachment
-        fields = ["url", "height", "width", "type"]
+        fields = ["url", "original_url", "height", "width", "type", "thumbnails"]
+
+    def get_url(self, attachment: VkNewsAttachment) -> str:
+        return attachment.mirror_url or attachment.url
+
+    def get_original_url(self, attachment: VkNewsAttachment) -> str:
+        return attachment.url
+
+    def get_thumbnails(self, attachment: VkNewsAttachment) -> dict[str, str]:
+        if not attachment.mirror_url:
+            return {}
+
+        return self.context.get("thumbnails", {}).get(attachment.mirror_url, {})
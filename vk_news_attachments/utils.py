@@ -0,0 +1,179 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import NamedTuple
+
+from django.db.models import F
+from requests import Session
+from requests.adapters import HTTPAdapter
+
+from config.logger import logger
+from config.settings import get_settings
+from storage_s3.models import ImageDerivative
+from storage_s3.utils import build_file_url, get_sesion_s3, upload_image_derivatives
+from vk_news_attachments.models import VkNewsAttachment
+
+settings = get_settings()
+
+VK_IMAGE_DERIVATIVE_WIDTHS: tuple[int, ...] = (480, 960)
+VK_IMAGE_MIRROR_WORKERS: int = 4
+VK_IMAGE_MIRROR_MAX_ATTEMPTS: int = 3
+VK_IMAGE_MAX_BYTES: int = 20 * 1024 * 1024
+# Изображения раздаются с нескольких хостов CDN (sun9-*.userapi.com и т. п.).
+VK_IMAGE_POOL_HOSTS: int = 10
+
+IMAGE_EXTENSIONS: dict[str, str] = {
+    "image/jpeg": "jpg",
+    "image/png": "png",
+    "image/webp": "webp",
+    "image/gif": "gif",
+}
+
+
+_download_session: Session | None = None
+_download_session_lock = Lock()
+
+
+class MirroredImage(NamedTuple):
+    attachment_id: int
+    mirror_url: str | None
+    derivatives: list[ImageDerivative]
+
+
+def get_download_session() -> Session:
+    """
+    Сессия для скачивания изображений с CDN VK. Отдельна от сессии VK API
+    (vk_news.client.get_session), у которой пул рассчитан на один хост:
+    соединения с хостами CDN вытесняли бы из него соединение с api.vk.com.
+    """
+    global _download_session
+
+    if _download_session is None:
+        with _download_session_lock:
+            if _download_session is None:
+                session = Session()
+                adapter = HTTPAdapter(
+                    pool_connections=VK_IMAGE_POOL_HOSTS,
+                    pool_maxsize=VK_IMAGE_MIRROR_WORKERS,
+                    max_retries=0,
+                )
+                session.mount(prefix="https://", adapter=adapter)
+                session.mount(prefix="http://", adapter=adapter)
+                _download_session = session
+
+    return _download_session
+
+
+def download_image(url: str) -> tuple[bytes, str]:
+    vk_credentials = settings.vk_credentials
+
+    with get_download_session().get(
+        url=url,
+        stream=True,
+        timeout=(vk_credentials.CONNECT_TIMEOUT, vk_credentials.READ_TIMEOUT),
+    ) as response:
+        response.raise_for_status()
+
+        content_type = response.headers.get("Content-Type", "").split(";")[0].strip()
+        if content_type not in IMAGE_EXTENSIONS:
+            raise ValueError(f"Неподдерживаемый тип содержимого: {content_type!r}")
+
+        data = bytearray()
+        for chunk in response.iter_content(chunk_size=64 * 1024):
+            data.extend(chunk)
+            if len(data) > VK_IMAGE_MAX_BYTES:
+                raise ValueError(f"Изображение больше {VK_IMAGE_MAX_BYTES} байт")
+
+    return bytes(data), content_type
+
+
+def mirror_image(client, attachment_id: int, url: str) -> MirroredImage:
+    """
+    Скачивает изображение из VK, кладёт его в бакет как vk_news/<id>.<ext>
+    и строит уменьшенные копии для отображения в блоке новостей.
+    Выполняется в потоке пула и не обращается к базе данных.
+    """
+    try:
+        data, content_type = download_image(url=url)
+        file_key = f"vk_news/{attachment_id}.{IMAGE_EXTENSIONS[content_type]}"
+        client.put_object(
+            Bucket=settings.yandex_s3_credentials.BACKET_NAME,
+            Key=file_key,
+            Body=data,
+            ContentType=content_type,
+        )
+    except Exception as e:
+        logger.warning(f"Не удалось сохранить копию изображения VK {url}: {e}")
+        return MirroredImage(
+            attachment_id=attachment_id, mirror_url=None, derivatives=[]
+        )
+
+    mirror_url = build_file_url(file_key=file_key)
+    derivatives = upload_image_derivatives(
+        client=client,
+        data=data,
+        original_url=mirror_url,
+        base_key=file_key.rsplit(sep=".", maxsplit=1)[0],
+        widths=VK_IMAGE_DERIVATIVE_WIDTHS,
+    )
+    return MirroredImage(
+        attachment_id=attachment_id, mirror_url=mirror_url, derivatives=derivatives
+    )
+
+
+def mirror_pending_attachments(
+    limit: int | None = None, workers: int = VK_IMAGE_MIRROR_WORKERS
+) -> tuple[int, int]:
+    """
+    Переносит ещё не сохранённые изображения новостей VK в наш бакет.
+
+    Скачивание и загрузка выполняются в пуле потоков, а результаты
+    записываются в базу пакетно из вызывающего потока. Изображения, которые
+    не удалось сохранить VK_IMAGE_MIRROR_MAX_ATTEMPTS раз, больше не
+    запрашиваются.
+
+    :return: количество сохранённых и несохранённых изображений
+    """
+    attachments = (
+        VkNewsAttachment.objects.filter(
+            mirror_url__isnull=True,
+            mirror_attempts__lt=VK_IMAGE_MIRROR_MAX_ATTEMPTS,
+        )
+        .order_by("-id")
+        .values_list("id", "url")
+    )
+    if limit:
+        attachments = attachments[:limit]
+
+    pending = list(attachments)
+    if not pending:
+        return 0, 0
+
+    client = get_sesion_s3()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(
+            executor.map(
+                lambda attachment: mirror_image(client, *attachment),
+                pending,
+            )
+        )
+
+    mirrored = [result for result in results if result.mirror_url]
+    failed_ids = [result.attachment_id for result in results if not result.mirror_url]
+
+    VkNewsAttachment.objects.bulk_update(
+        objs=[
+            VkNewsAttachment(id=result.attachment_id, mirror_url=result.mirror_url)
+            for result in mirrored
+        ],
+        fields=["mirror_url"],
+    )
+    ImageDerivative.objects.bulk_create(
+        objs=[derivative for result in mirrored for derivative in result.derivatives],
+        ignore_conflicts=True,
+    )
+    if failed_ids:
+        VkNewsAttachment.objects.filter(id__in=failed_ids).update(
+            mirror_attempts=F("mirror_attempts") + 1
+        )
+
+    return len(mirrored), len(failed_ids)
@@ -27,6 +27,10 @@ class ApplicationRatedSerializer(ModelSerializer[Applications]):
         )
 
     def get_winner_qs(self, application):
+        winners_by_application = self.context.get("winners_by_application")
+        if winners_by_application is not None:
+            return winners_by_application.get(application.id)
+
         contest = self.context.get("contest")
         return (
             Winners.objects.filter(application_id=application.id, contest_id=contest.id)
@@ -64,11 +68,13 @@ class NominationWinnersSerializer(Serializer):
     age_categories = SerializerMethodField()
 
     def get_age_categories(self, obj):
-        contest = self.context.get("contest")
-
-        winners = Winners.objects.filter(
-            contest=contest, application__nomination=obj
-        ).select_related("application")
+        winners_by_nomination = self.context.get("winners_by_nomination")
+        if winners_by_nomination is not None:
+            winners = winners_by_nomination.get(obj.id, [])
+        else:
+            winners = Winners.objects.filter(
+                contest=self.context.get("contest"), application__nomination=obj
+            ).select_related("application__user")
 
         grouped = defaultdict(list)
         for winner in winners:
@@ -93,3 +99,21 @@ class ContestWinnersSerializer(ModelSerializer[Contest]):
     class Meta:
         model = Contest
         fields = ("id", "title", "nominations")
+
+    def to_representation(self, instance):
+        # Победители конкурса загружаются одним запросом и раздаются вложенным
+        # сериализаторам через context, а не запрашиваются по каждой номинации
+        # и заявке.
+        winners = list(
+            Winners.objects.filter(contest=instance).select_related("application__user")
+        )
+
+        winners_by_nomination = defaultdict(list)
+        for winner in winners:
+            winners_by_nomination[winner.application.nomination_id].append(winner)
+
+        self.context["winners_by_nomination"] = winners_by_nomination
+        self.context["winners_by_application"] = {
+            winner.application_id: winner for winner in winners
+        }
+        return super().to_representation(instance)
@@ -8,6 +8,7 @@ from rest_framework.response import Response
 from contest_stage.permissions import CanFinalizeResultsPermission
 from contests.models import Contest
 from contests.serializers import ContestWinnerSerializer
+from notifications.utils import schedule_results_campaign
 from participants.permissions import IsContestOwnerPermission
 from winners.serializers import ContestWinnersSerializer
 
@@ -25,6 +26,7 @@ def get_contest_winners_view(request: Request) -> Response:
 
     winner_serializer = ContestWinnerSerializer(context={"contest": contest})
     winner_serializer.change_winners_by_contest()
+    schedule_results_campaign(contest=contest)
 
     serializer = ContestWinnersSerializer(contest, context={"contest": contest})
     return Response(data=serializer.data, status=status.HTTP_200_OK)
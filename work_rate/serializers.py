@@ -27,7 +27,7 @@ class WorkRateSerializer(Serializer):
 
     def validate_application_id(self, value):
         try:
-            application = Applications.objects.get(id=value)
+            application = Applications.objects.get(id=value, is_deleted=False)
         except Applications.DoesNotExist:
             raise ValidationError(detail={"error": "Invalid application_id"}, code=400)
         if application.status != ApplicationStatus.accepted.value:
@@ -41,24 +41,31 @@ class WorkRateSerializer(Serializer):
         contest = self.context.get("contest")
 
         for item in value:
-            criteria_id = item.get("criteria_id")
-            rate = item.get("rate")
-
-            if not isinstance(criteria_id, int):
+            if not isinstance(item.get("criteria_id"), int):
                 raise ValidationError(
                     detail={"error": "criteria_id must be an integer"}, code="invalid"
                 )
 
-            if not isinstance(rate, int):
+            if not isinstance(item.get("rate"), int):
                 raise ValidationError(
                     detail={"error": "rate must be an integer"}, code="invalid"
                 )
 
-            try:
-                contest_criteria = ContestCriteria.objects.get(
-                    criteria_id=criteria_id, contest=contest
-                )
-            except ContestCriteria.DoesNotExist:
+        # Критерии всех оценок загружаются одним запросом.
+        contest_criteria_by_id = {
+            contest_criteria.criteria_id: contest_criteria
+            for contest_criteria in ContestCriteria.objects.filter(
+                contest=contest,
+                criteria_id__in=[item.get("criteria_id") for item in value],
+            )
+        }
+
+        for item in value:
+            criteria_id = item.get("criteria_id")
+            rate = item.get("rate")
+
+            contest_criteria = contest_criteria_by_id.get(criteria_id)
+            if contest_criteria is None:
                 raise ValidationError(
                     detail={
                         "error": f"Criteria with id {criteria_id} does not exist in this contest"
@@ -158,7 +165,14 @@ class WorkRateContestAllSerializer(Serializer):
     total = IntegerField()
 
     def to_representation(self, instance):
-        application = Applications.objects.get(id=instance["application_id"])
+        applications = self.context.get("applications")
+        if applications is not None:
+            application = applications[instance["application_id"]]
+        else:
+            application = Applications.objects.select_related(
+                "contest", "nomination"
+            ).get(id=instance["application_id"])
+
         return {
             "application": ApplicationSerializer(application).data,
             "total": instance["total"],
@@ -173,7 +187,8 @@ class ApplicationRatesSerializer(ModelSerializer[Applications]):
         fields = ["id", "rates"]
 
     def get_rates(self, application):
-        work_rates = WorkRate.objects.filter(application=application)
+        # Оценки с критериями подгружаются во view через prefetch_related.
+        work_rates = application.workrate_set.all()
 
         return [
             {
@@ -1,4 +1,4 @@
-from django.db.models import Sum, F, Value, Count
+from django.db.models import Sum, F, Value, Count, Prefetch
 from django.db.models.functions import Concat
 from drf_spectacular.utils import extend_schema, OpenApiExample
 from rest_framework import status
@@ -141,12 +141,20 @@ def get_all_rated_works_in_contest_view(request: Request) -> Response:
     contest = get_object_or_404(Contest, id=request.contest_id)
 
     work_rates = (
-        WorkRate.objects.filter(application__contest_id=contest.id)
+        WorkRate.objects.filter(
+            application__contest_id=contest.id, application__is_deleted=False
+        )
         .values("application_id")
         .annotate(total=Sum("rate"))
     )
 
-    serializer = WorkRateContestAllSerializer(instance=work_rates, many=True)
+    applications = Applications.objects.select_related("contest", "nomination").in_bulk(
+        [work_rate["application_id"] for work_rate in work_rates]
+    )
+
+    serializer = WorkRateContestAllSerializer(
+        instance=work_rates, many=True, context={"applications": applications}
+    )
     return Response(data=serializer.data, status=status.HTTP_200_OK)
 
 
@@ -181,13 +189,19 @@ def get_all_rated_works_view(request: Request) -> Response:
     contest = get_object_or_404(Contest, id=request.contest_id)
 
     application_ids = (
-        WorkRate.objects.filter(application__contest_id=contest.id)
+        WorkRate.objects.filter(
+            application__contest_id=contest.id, application__is_deleted=False
+        )
         .values_list("application_id", flat=True)
         .distinct()
         .all()
     )
 
-    application_queryset = Applications.objects.filter(id__in=application_ids).all()
+    application_queryset = Applications.objects.filter(
+        id__in=application_ids
+    ).prefetch_related(
+        Prefetch("workrate_set", queryset=WorkRate.objects.select_related("criteria"))
+    )
 
     serializer = ApplicationRatesSerializer(instance=application_queryset, many=True)
     return Response(data=serializer.data, status=status.HTTP_200_OK)
@@ -276,7 +290,9 @@ def get_rated_work_by_jury_in_contest_view(request: Request) -> Response:
     contest = get_object_or_404(Contest, id=request.contest_id)
 
     rates = (
-        WorkRate.objects.filter(application__contest_id=contest.id)
+        WorkRate.objects.filter(
+            application__contest_id=contest.id, application__is_deleted=False
+        )
         .select_related("jury__user")
         .annotate(
             full_name=Concat(